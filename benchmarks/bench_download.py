@@ -0,0 +1,202 @@
+"""
+End-to-end benchmark of WallpaperDownloader on the local stand-in server.
+
+Every scenario starts the stand-in server with its latency, bandwidth and
+error rate, downloads the wallpapers of July 2020 from the test fixtures
+into the temporary directory and reports the wall time, the throughput
+and the peak memory allocated by Python (tracemalloc). The server runs in
+the child process, so only the client is measured. The wall time and
+the memory are measured in separate downloads, so the time does not
+include the overhead of tracemalloc.
+
+Usage:
+
+    $ python -m benchmarks.bench_download --image-size 512 --scenario local
+"""
+import logging
+import tempfile
+import time
+import tracemalloc
+
+import click
+
+from benchmarks.standin_server import StandInServerProcess
+from wallpaper_downloader import metrics, retry, site_parser
+from wallpaper_downloader.downloader import WallpaperDownloader
+
+# Knobs of the stand-in server in every scenario. The run makes about
+# 20 requests, so the seed of errors is chosen to inject at least one.
+SCENARIOS = {
+    "local": {},
+    "latency-50ms": {"latency": 0.05},
+    "bandwidth-2MiB": {"bandwidth": 2 * 1024 * 1024},
+    "errors-5%": {"error_rate": 0.05, "seed": 6},
+    "slow-site": {
+        "latency": 0.1,
+        "bandwidth": 1024 * 1024,
+        "error_rate": 0.02,
+        "seed": 6,
+    },
+}
+
+
+def _download(
+    server_options: dict,
+    image_size: int,
+    resolutions: list,
+    max_concurrency: int,
+    trace_memory: bool,
+) -> dict:
+    """
+    Download wallpapers from the new stand-in server and measure the run.
+
+    Args:
+        server_options (dict): latency, bandwidth and error rate of
+            the server.
+        image_size (int): size of every image in bytes.
+        resolutions (list): resolutions of downloaded wallpapers.
+        max_concurrency (int): maximum number of concurrent downloads.
+        trace_memory (bool): measure the peak memory with tracemalloc.
+
+    Returns:
+        dict: wall time, downloaded bytes, peak memory and numbers of
+            requests, errors and wallpapers.
+    """
+    server = StandInServerProcess(image_size=image_size, **server_options)
+    server.start()
+    site_parser.BASE_URL = server.url
+    run_metrics = metrics.Metrics()
+    metrics.set_metrics(run_metrics)
+    retry.set_retry_policy(retry.RetryPolicy(max_attempts=4, base_delay=0.05))
+    peak_memory = None
+    try:
+        with tempfile.TemporaryDirectory() as destination_directory_path:
+            downloader = WallpaperDownloader(
+                "07-2020",
+                resolutions,
+                destination_directory_path,
+                max_concurrency=max_concurrency,
+            )
+            if trace_memory:
+                tracemalloc.start()
+            start_time = time.perf_counter()
+            downloader.download_wallpapers()
+            wall_time = time.perf_counter() - start_time
+            if trace_memory:
+                _, peak_memory = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+    finally:
+        server.stop()
+
+    return {
+        "wall_time": wall_time,
+        "downloaded_bytes": run_metrics.counters.get(
+            "downloaded_bytes_total",
+            0,
+        ),
+        "peak_memory": peak_memory,
+        "requests": server.requests_count,
+        "errors": server.errors_count,
+        "wallpapers": run_metrics.counters.get("wallpapers_ok_total", 0),
+    }
+
+
+def _run_scenario(
+    server_options: dict,
+    image_size: int,
+    resolutions: list,
+    max_concurrency: int,
+) -> dict:
+    """
+    Measure the time of one download and the memory of another one.
+
+    Args:
+        server_options (dict): latency, bandwidth and error rate of
+            the server.
+        image_size (int): size of every image in bytes.
+        resolutions (list): resolutions of downloaded wallpapers.
+        max_concurrency (int): maximum number of concurrent downloads.
+
+    Returns:
+        dict: wall time, downloaded bytes and numbers of requests, errors
+            and wallpapers of the timed download, peak memory of
+            the traced download.
+    """
+    result = _download(
+        server_options,
+        image_size,
+        resolutions,
+        max_concurrency,
+        trace_memory=False,
+    )
+    result["peak_memory"] = _download(
+        server_options,
+        image_size,
+        resolutions,
+        max_concurrency,
+        trace_memory=True,
+    )["peak_memory"]
+    return result
+
+
+@click.command()
+@click.option(
+    "--scenario",
+    "scenarios_names",
+    type=click.Choice(list(SCENARIOS)),
+    multiple=True,
+    help="Scenario to run, can be repeated  [default: all]",
+)
+@click.option(
+    "--image-size",
+    type=int,
+    default=512,
+    show_default=True,
+    help="Size of every image in KiB",
+)
+@click.option(
+    "--resolution",
+    "resolutions",
+    type=str,
+    multiple=True,
+    default=["1920x1080"],
+    show_default=True,
+    help="Resolution of downloaded wallpapers, can be repeated",
+)
+@click.option(
+    "--max-concurrency",
+    type=int,
+    default=32,
+    show_default=True,
+    help="Maximum number of concurrent downloads",
+)
+def main(
+    scenarios_names: tuple,
+    image_size: int,
+    resolutions: tuple,
+    max_concurrency: int,
+) -> None:
+    """Measure downloading of wallpapers from the local stand-in server."""
+    logging.disable(logging.WARNING)
+    print(
+        f"{'scenario':<16}{'files':>7}{'requests':>10}{'errors':>8}"
+        f"{'s':>8}{'MiB/s':>9}{'peak MiB':>10}",
+    )
+    for scenario_name in scenarios_names or SCENARIOS:
+        result = _run_scenario(
+            SCENARIOS[scenario_name],
+            image_size * 1024,
+            list(resolutions),
+            max_concurrency,
+        )
+        throughput = result["downloaded_bytes"] / 2 ** 20 / result["wall_time"]
+        print(
+            f"{scenario_name:<16}{result['wallpapers']:>7g}"
+            f"{result['requests']:>10}{result['errors']:>8}"
+            f"{result['wall_time']:>8.2f}"
+            f"{throughput:>9.2f}{result['peak_memory'] / 2 ** 20:>10.2f}",
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""
+Benchmark of HTML parser backends on the pages from the test fixtures.
+
+Every page from 'tests/files_for_tests/*.html' is parsed by every installed
+backend of BeautifulSoup in the full and in the restricted mode.
+The time of parsing plus the time of the finders used for the page
+is compared to the full parsing with 'html.parser'.
+
+Usage:
+
+    $ python -m benchmarks.bench_html_parser --repeat 20
+"""
+import glob
+import os
+import timeit
+
+import click
+from bs4 import BeautifulSoup, FeatureNotFound
+
+from wallpaper_downloader import site_parser
+
+FILES_FOR_TESTS_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "tests",
+    "files_for_tests",
+)
+PARSERS = ("html.parser", "lxml", "html5lib")
+
+
+def _get_installed_parsers() -> list:
+    """
+    Get names of installed parser backends.
+
+    Returns:
+        list: names of parser backends.
+    """
+    installed_parsers = []
+    for parser in PARSERS:
+        try:
+            BeautifulSoup("", parser)
+        except FeatureNotFound:
+            continue
+        installed_parsers.append(parser)
+    return installed_parsers
+
+
+def _parse_and_find(markup: str) -> None:
+    """
+    Parse the page and run the finders of site_parser module on it.
+
+    Args:
+        markup (str): HTML of the page.
+    """
+    page_html = site_parser._parse_html(markup)
+    page_index = site_parser._index_wallpapers_page(page_html)
+    site_parser._find_wallpapers_page_url(page_html, "july", "2020")
+    site_parser._find_wallpapers_urls(
+        page_html,
+        page_index.names,
+        "1920x1080",
+        page_index,
+    )
+
+
+def _measure(markup: str, parser: str, restricted: bool, repeat: int) -> float:
+    """
+    Measure the best time of parsing of the page.
+
+    Args:
+        markup (str): HTML of the page.
+        parser (str): name of the parser backend.
+        restricted (bool): parse only tags used by the finders.
+        repeat (int): number of measurements.
+
+    Returns:
+        float: the best time in seconds.
+    """
+    site_parser.set_html_parser(parser, restricted)
+    return min(
+        timeit.repeat(
+            lambda: _parse_and_find(markup),
+            number=1,
+            repeat=repeat,
+        ),
+    )
+
+
+@click.command()
+@click.option(
+    "--repeat",
+    type=int,
+    default=10,
+    show_default=True,
+    help="Number of measurements for every page",
+)
+def main(repeat: int) -> None:
+    """Compare parser backends on the pages from the test fixtures."""
+    parsers = _get_installed_parsers()
+    pages_paths = sorted(
+        glob.glob(os.path.join(FILES_FOR_TESTS_PATH, "*.html")),
+    )
+
+    print(f"{'page':<28}{'parser':<14}{'mode':<12}{'ms':>9}{'speedup':>10}")
+    for page_path in pages_paths:
+        with open(page_path) as page:
+            markup = page.read()
+        baseline = _measure(markup, "html.parser", False, repeat)
+        for parser in parsers:
+            for restricted in (False, True):
+                best_time = _measure(markup, parser, restricted, repeat)
+                print(
+                    f"{os.path.basename(page_path):<28}{parser:<14}"
+                    f"{'restricted' if restricted else 'full':<12}"
+                    f"{best_time * 1000:>9.2f}"
+                    f"{baseline / best_time:>9.2f}x",
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+Benchmark of the start of the CLI.
+
+The module is imported in fresh interpreters with '-X importtime', the
+best cumulative import time and the slowest imported packages are
+reported. The wall time of 'python -m wallpaper_downloader --help'
+includes the start of the interpreter. With '--max-import-ms' the
+benchmark exits with status 1 if the import is slower, so regressions of
+the start are caught by CI.
+
+Usage:
+
+    $ python -m benchmarks.bench_startup --repeat 10 --max-import-ms 100
+"""
+import subprocess
+import sys
+import time
+
+import click
+
+
+def _get_imports_times(module: str) -> dict:
+    """
+    Import the module in a fresh interpreter with '-X importtime'.
+
+    Args:
+        module (str): name of the imported module.
+
+    Returns:
+        dict: cumulative import times in microseconds of the module and
+            of top-level packages in '{package: microseconds}' format.
+    """
+    completed_process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    imports_times = {}
+    for line in completed_process.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative_time, imported_name = line.split("|")
+        if not cumulative_time.strip().isdigit():
+            continue
+        package = imported_name.strip().split(".")[0]
+        if imported_name.strip() == module:
+            package = module
+        imports_times[package] = max(
+            imports_times.get(package, 0),
+            int(cumulative_time),
+        )
+    return imports_times
+
+
+def _get_help_time() -> float:
+    """
+    Run 'python -m wallpaper_downloader --help'.
+
+    Returns:
+        float: wall time of the run in seconds.
+    """
+    start_time = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "-m", "wallpaper_downloader", "--help"],
+        capture_output=True,
+        check=True,
+    )
+    return time.perf_counter() - start_time
+
+
+@click.command()
+@click.option(
+    "--module",
+    type=str,
+    default="wallpaper_downloader.cli",
+    show_default=True,
+    help="Imported module",
+)
+@click.option(
+    "--repeat",
+    type=int,
+    default=10,
+    show_default=True,
+    help="Number of fresh interpreters",
+)
+@click.option(
+    "--top",
+    type=int,
+    default=5,
+    show_default=True,
+    help="Number of the slowest imported packages to show",
+)
+@click.option(
+    "--max-import-ms",
+    type=float,
+    default=None,
+    help="Exit with status 1 if the import is slower",
+)
+def main(module: str, repeat: int, top: int, max_import_ms: float) -> None:
+    """Measure the import of the CLI and the start of '--help'."""
+    runs_imports_times = [_get_imports_times(module) for _ in range(repeat)]
+    import_ms = min(
+        imports_times[module] for imports_times in runs_imports_times
+    ) / 1000
+    help_ms = min(_get_help_time() for _ in range(repeat)) * 1000
+    print(f"import {module}: {import_ms:.1f} ms (best of {repeat})")
+    print(f"python -m wallpaper_downloader --help: {help_ms:.1f} ms")
+
+    best_imports_times = {}
+    for imports_times in runs_imports_times:
+        for package, cumulative_time in imports_times.items():
+            if package == module:
+                continue
+            best_imports_times[package] = min(
+                best_imports_times.get(package, cumulative_time),
+                cumulative_time,
+            )
+    print(f"{'package':<24}{'ms':>8}")
+    for package, cumulative_time in sorted(
+        best_imports_times.items(),
+        key=lambda package_time: package_time[1],
+        reverse=True,
+    )[:top]:
+        print(f"{package:<24}{cumulative_time / 1000:>8.1f}")
+
+    if max_import_ms is not None and import_ms > max_import_ms:
+        print(f"Import is slower than {max_import_ms:g} ms.")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
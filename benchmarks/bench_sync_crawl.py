@@ -0,0 +1,99 @@
+"""
+Benchmark of cold and pooled requests of the sync parser.
+
+The category pages and the page with wallpapers are requested from
+the local stand-in server by 'site_parser._download_page'. In the cold
+mode the session is closed after every page, like 'requests.get' did, so
+every page opens a new connection. In the pooled mode one session with
+kept-alive connections is shared by all pages. The stand-in server is
+plain HTTP, so the difference does not include TLS handshakes of
+the real site.
+
+Usage:
+
+    $ python -m benchmarks.bench_sync_crawl --pages 30 --repeat 5
+"""
+import logging
+import statistics
+import time
+
+import click
+
+from benchmarks.standin_server import PAGES, StandInServer
+from wallpaper_downloader import site_parser
+
+
+def _crawl(pages_urls: list, pooled: bool) -> float:
+    """
+    Request all pages one by one.
+
+    Args:
+        pages_urls (list): URLs of requested pages.
+        pooled (bool): share one session by all pages.
+
+    Returns:
+        float: wall time of the crawl in seconds.
+    """
+    site_parser.set_http_session(site_parser.create_http_session())
+    start_time = time.perf_counter()
+    for page_url in pages_urls:
+        site_parser._download_page(page_url)
+        if not pooled:
+            site_parser.http_session.close()
+            site_parser.set_http_session(site_parser.create_http_session())
+    wall_time = time.perf_counter() - start_time
+    site_parser.http_session.close()
+    return wall_time
+
+
+@click.command()
+@click.option(
+    "--pages",
+    "pages_count",
+    type=int,
+    default=30,
+    show_default=True,
+    help="Number of pages requested in every crawl",
+)
+@click.option(
+    "--repeat",
+    type=int,
+    default=5,
+    show_default=True,
+    help="Number of crawls in every mode",
+)
+@click.option(
+    "--latency",
+    type=float,
+    default=0.0,
+    show_default=True,
+    help="Delay before every response of the server in seconds",
+)
+def main(pages_count: int, repeat: int, latency: float) -> None:
+    """Compare cold and pooled requests of the sync parser."""
+    logging.disable(logging.WARNING)
+    server = StandInServer(latency=latency)
+    server.start()
+    pages_paths = list(PAGES)
+    pages_urls = [
+        f"{server.url}{pages_paths[page_number % len(pages_paths)]}"
+        for page_number in range(pages_count)
+    ]
+    try:
+        print(f"{'mode':<8}{'best s':>9}{'median s':>10}{'ms/page':>9}")
+        for mode in ("cold", "pooled"):
+            wall_times = [
+                _crawl(pages_urls, mode == "pooled") for _ in range(repeat)
+            ]
+            print(
+                f"{mode:<8}{min(wall_times):>9.3f}"
+                f"{statistics.median(wall_times):>10.3f}"
+                f"{min(wall_times) / pages_count * 1000:>9.2f}",
+            )
+    finally:
+        site_parser.set_http_session(None)
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,324 @@
+"""
+Local stand-in for 'smashingmagazine.com' used by benchmarks and tests.
+
+The server serves the pages from 'tests/files_for_tests/' and synthetic
+images. Latency, bandwidth and error rate of the real site can be
+injected, so the downloader is measured end to end without the network.
+Requests are recorded and single failures can be scheduled, so tests
+check what the client asked for and how it recovers.
+
+Benchmarks run the server in a child process, so its allocations and
+CPU time are not measured with the client:
+
+    $ python -m benchmarks.standin_server --image-size 524288 --latency 0.05
+"""
+import asyncio
+import hashlib
+import json
+import os
+import random
+import subprocess
+import sys
+import threading
+from typing import Union
+
+import click
+from aiohttp import web
+
+FILES_FOR_TESTS_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "tests",
+    "files_for_tests",
+)
+PAGES = {
+    "/category/wallpapers/": "first_main_page.html",
+    "/categories/wallpapers/page/2/": "second_main_page.html",
+    "/2020/06/desktop-wallpaper-calendars-july-2020/": (
+        "page_with_wallpapers.html"
+    ),
+}
+IMAGES_HOST = "http://files.smashingmagazine.com"
+IMAGE_ETAG = '"image"'
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+class StandInServer:
+    """aiohttp server in the background thread with injected slowness."""
+
+    pages = PAGES
+    images_host = IMAGES_HOST
+
+    def __init__(
+        self,
+        image_size: Union[int, None] = None,
+        latency: float = 0.0,
+        bandwidth: Union[int, None] = None,
+        error_rate: float = 0.0,
+        seed: int = 0,
+    ) -> None:
+        """
+        Initialize the server. It is started by 'start' method.
+
+        Args:
+            image_size (Union[int, None], optional): size of every image
+                in bytes. Defaults to None (the path of the image repeated
+                100 times, so every image has its own content).
+            latency (float, optional): delay before every response in
+                seconds. Defaults to 0.
+            bandwidth (Union[int, None], optional): bytes per second of
+                every image response. Defaults to None (unlimited).
+            error_rate (float, optional): share of responses replaced by
+                '503 Service Unavailable'. Defaults to 0.
+            seed (int, optional): seed of injected errors. Defaults to 0.
+        """
+        self.image_size = image_size
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self.error_rate = error_rate
+        self.url = None
+        self.requests_count = 0
+        self.errors_count = 0
+        self.requested_paths = []
+        self.requested_ranges = []
+        self.clients_ports = set()
+        # Paths of images which connection is broken in the middle once.
+        self.broken_images = set()
+        # Paths which respond with '503 Service Unavailable' once.
+        self.unavailable_paths = set()
+        # Paths of images which always respond with '416 Range Not
+        # Satisfiable', even without 'Range' header.
+        self.unsatisfiable_images = set()
+        self._random = random.Random(seed)
+        self._pages = {}
+        self._loop = asyncio.new_event_loop()
+        self._runner = None
+        self._thread = threading.Thread(target=self._loop.run_forever)
+
+    async def _handle(self, request: web.Request) -> web.StreamResponse:
+        """
+        Return the page from fixtures or the synthetic image.
+
+        Pages are revalidated by their ETag.
+
+        Args:
+            request (web.Request): request to the server.
+
+        Returns:
+            web.StreamResponse: page, image, 304, 404 or 503 response.
+        """
+        self.requests_count += 1
+        self.requested_paths.append(request.path)
+        self.clients_ports.add(request.transport.get_extra_info("peername"))
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if request.path in self.unavailable_paths:
+            self.unavailable_paths.discard(request.path)
+            return web.Response(status=503, headers={"Retry-After": "0"})
+        if self._random.random() < self.error_rate:
+            self.errors_count += 1
+            return web.Response(status=503)
+        if request.path in self._pages:
+            page_content, etag = self._pages[request.path]
+            if request.headers.get("If-None-Match") == etag:
+                return web.Response(status=304, headers={"ETag": etag})
+            return web.Response(
+                text=page_content,
+                content_type="text/html",
+                headers={"ETag": etag},
+            )
+        if request.path.endswith((".png", ".jpg")):
+            return await self._handle_image(request)
+        return web.Response(status=404, text="Not found")
+
+    def _get_image_size(self, image_path: str) -> int:
+        """
+        Get the size of the synthetic image.
+
+        Args:
+            image_path (str): path of the image on the server.
+
+        Returns:
+            int: size of the image in bytes.
+        """
+        if self.image_size is None:
+            return len(image_path.encode()) * 100
+        return self.image_size
+
+    def _read_image(self, image_path: str, start: int, end: int) -> bytes:
+        """
+        Get the part of the synthetic image.
+
+        Args:
+            image_path (str): path of the image on the server.
+            start (int): first byte of the part.
+            end (int): byte after the last byte of the part.
+
+        Returns:
+            bytes: the part of the image.
+        """
+        if self.image_size is None:
+            return (image_path.encode() * 100)[start:end]
+        return bytes(end - start)
+
+    async def _handle_image(self, request: web.Request) -> web.StreamResponse:
+        """
+        Stream the synthetic image with the configured bandwidth.
+
+        Ranges and revalidation of the image are supported.
+
+        Args:
+            request (web.Request): request to the server.
+
+        Returns:
+            web.StreamResponse: full or partial image or 304 response.
+        """
+        image_size = self._get_image_size(request.path)
+        headers = {"Accept-Ranges": "bytes", "ETag": IMAGE_ETAG}
+        if request.headers.get("If-None-Match") == IMAGE_ETAG:
+            return web.Response(status=304, headers=headers)
+        range_header = request.headers.get("Range")
+        self.requested_ranges.append(range_header)
+        if request.path in self.unsatisfiable_images:
+            return web.Response(status=416, headers=headers)
+        start = 0
+        status = 200
+        if range_header and request.headers.get("If-Range") == IMAGE_ETAG:
+            start = int(range_header[len("bytes="):-len("-")])
+            headers["Content-Range"] = (
+                f"bytes {start}-{image_size - 1}/{image_size}"
+            )
+            status = 206
+        end = image_size
+        broken = request.path in self.broken_images
+        if broken:
+            self.broken_images.discard(request.path)
+            end = image_size // 2
+
+        response = web.StreamResponse(status=status, headers=headers)
+        response.content_type = "image/png"
+        response.content_length = image_size - start
+        await response.prepare(request)
+        for chunk_start in range(start, end, STREAM_CHUNK_SIZE):
+            chunk_end = min(chunk_start + STREAM_CHUNK_SIZE, end)
+            await response.write(
+                self._read_image(request.path, chunk_start, chunk_end),
+            )
+            if self.bandwidth:
+                await asyncio.sleep((chunk_end - chunk_start) / self.bandwidth)
+        if broken:
+            await asyncio.sleep(0.1)
+            request.transport.close()
+            return response
+        await response.write_eof()
+        return response
+
+    async def _start(self) -> None:
+        """Start the server on the free port of the localhost."""
+        app = web.Application()
+        app.router.add_route("GET", "/{path:.*}", self._handle)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        port = self._runner.addresses[0][1]
+        self.url = f"http://127.0.0.1:{port}"
+
+    def start(self) -> None:
+        """Start the server in the background thread."""
+        self._thread.start()
+        asyncio.run_coroutine_threadsafe(self._start(), self._loop).result()
+        for page_path, page_file_name in self.pages.items():
+            page_file_path = os.path.join(FILES_FOR_TESTS_PATH, page_file_name)
+            with open(page_file_path) as page:
+                page_content = page.read().replace(self.images_host, self.url)
+            etag = f'"{hashlib.md5(page_content.encode()).hexdigest()}"'
+            self._pages[page_path] = (page_content, etag)
+
+    def stop(self) -> None:
+        """Stop the server and the background thread."""
+        asyncio.run_coroutine_threadsafe(
+            self._runner.cleanup(),
+            self._loop,
+        ).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+
+class StandInServerProcess:
+    """Stand-in server in the child process with the same knobs."""
+
+    def __init__(self, **server_options) -> None:
+        """
+        Initialize the server. It is started by 'start' method.
+
+        Args:
+            **server_options: arguments of StandInServer.
+        """
+        self.server_options = server_options
+        self.url = None
+        self.requests_count = 0
+        self.errors_count = 0
+        self._process = None
+
+    def start(self) -> None:
+        """Start the server and wait for its URL."""
+        command = [sys.executable, "-m", "benchmarks.standin_server"]
+        for option_name, option_value in self.server_options.items():
+            if option_value is not None:
+                command.extend([
+                    f"--{option_name.replace('_', '-')}",
+                    str(option_value),
+                ])
+        self._process = subprocess.Popen(
+            command,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+            text=True,
+        )
+        self.url = self._process.stdout.readline().strip()
+        if not self.url:
+            self._process.wait()
+            raise RuntimeError("Stand-in server is not started.")
+
+    def stop(self) -> None:
+        """Stop the server and read numbers of requests and errors."""
+        stdout, _ = self._process.communicate("stop\n")
+        counters = json.loads(stdout)
+        self.requests_count = counters["requests_count"]
+        self.errors_count = counters["errors_count"]
+
+
+@click.command()
+@click.option("--image-size", type=int, default=None)
+@click.option("--latency", type=float, default=0.0)
+@click.option("--bandwidth", type=int, default=None)
+@click.option("--error-rate", type=float, default=0.0)
+@click.option("--seed", type=int, default=0)
+def main(
+    image_size: Union[int, None],
+    latency: float,
+    bandwidth: Union[int, None],
+    error_rate: float,
+    seed: int,
+) -> None:
+    """
+    Serve until a line or EOF is read from stdin.
+
+    The URL of the server is printed when it is started, numbers of
+    requests and errors are printed in JSON when it is stopped.
+    """
+    server = StandInServer(image_size, latency, bandwidth, error_rate, seed)
+    server.start()
+    print(server.url, flush=True)
+    sys.stdin.readline()
+    server.stop()
+    print(json.dumps({
+        "requests_count": server.requests_count,
+        "errors_count": server.errors_count,
+    }))
+
+
+if __name__ == "__main__":
+    main()
@@ -9,6 +9,14 @@ import requests
 from bs4 import BeautifulSoup
 from requests.models import Response
 
+from benchmarks.standin_server import StandInServer
+from wallpaper_downloader import site_parser
+
+FILES_FOR_TESTS_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    "files_for_tests",
+)
+
 
 @pytest.fixture()
 def get_page_html_from_file():
@@ -120,6 +128,23 @@ def get_wallpapers_filenames(get_wallpapers_urls_from_file) -> tuple:
     )
 
 
+@pytest.fixture()
+def get_first_page_urls() -> dict:
+    """
+    Fixture. Get URLs of wallpapers pages of the first category page.
+
+    Returns:
+        dict: URLs of ten months from 'august-2020' to 'november-2019'
+            in '{month-year: page_url}' format.
+    """
+    months_years = (
+        "august-2020", "july-2020", "june-2020", "may-2020", "april-2020",
+        "march-2020", "february-2020", "january-2020", "december-2019",
+        "november-2019",
+    )
+    return {month_year: f"/{month_year}/" for month_year in months_years}
+
+
 @pytest.fixture()
 def get_async_response_from_url():
     """
@@ -205,3 +230,95 @@ def delete_temp_directory(get_temp_directory_path):
     yield
 
     shutil.rmtree(temp_directory_path)
+
+
+class FakeStreamReader:
+    """Stand-in for aiohttp.StreamReader that yields predefined chunks."""
+
+    def __init__(self, chunks: list, error: Exception = None) -> None:
+        """
+        Initialize chunks of the body.
+
+        Args:
+            chunks (list): chunks of the body as bytes.
+            error (Exception, optional): exception raised after all chunks.
+        """
+        self.chunks = chunks
+        self.error = error
+
+    async def iter_chunked(self, chunk_size: int):
+        """
+        Yield chunks of the body.
+
+        Args:
+            chunk_size (int): ignored, chunks are predefined.
+
+        Yields:
+            bytes: chunk of the body.
+        """
+        for chunk in self.chunks:
+            yield chunk
+        if self.error is not None:
+            raise self.error
+
+
+class FakeResponse:
+    """Stand-in for aiohttp.ClientResponse with predefined body."""
+
+    def __init__(
+        self,
+        chunks: list,
+        status: int = 200,
+        headers: dict = None,
+        error: Exception = None,
+    ) -> None:
+        """
+        Initialize attributes of the response.
+
+        Args:
+            chunks (list): chunks of the body as bytes.
+            status (int, optional): HTTP status. Defaults to 200.
+            headers (dict, optional): headers of the response.
+            error (Exception, optional): exception raised while streaming.
+        """
+        self.status = status
+        self.headers = headers or {"Content-Type": "image/png"}
+        self.content = FakeStreamReader(chunks, error)
+
+
+@pytest.fixture()
+def get_fake_response():
+    """
+    Fixture. Get the fake aiohttp response with predefined body.
+
+    Args:
+        chunks (list): chunks of the body as bytes.
+
+    Returns:
+        FakeResponse: response that streams the chunks.
+    """
+    def inner(chunks: list, **kwargs) -> FakeResponse:
+        return FakeResponse(chunks, **kwargs)
+    return inner
+
+
+@pytest.fixture()
+def fixtures_server(monkeypatch):
+    """
+    Fixture. Start the local server with pages from 'files_for_tests'.
+
+    The base URL of site_parser module points to the server during the test.
+
+    Args:
+        monkeypatch (Fixture): fixture for patching of module attributes.
+
+    Yields:
+        StandInServer: started server.
+    """
+    server = StandInServer()
+    server.start()
+    monkeypatch.setattr(site_parser, "BASE_URL", server.url)
+
+    yield server
+
+    server.stop()
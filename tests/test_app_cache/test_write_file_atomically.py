@@ -0,0 +1,51 @@
+import os
+
+import pytest
+
+from wallpaper_downloader import app_cache
+
+
+def test_write(tmp_path):
+    """
+    Test 'write_file_atomically' function.
+
+    Function is tested with writing of the text and the bytes. Only
+    the files must be left in the directory.
+
+    Args:
+        tmp_path (Fixture): fixture that return the temporary directory.
+    """
+    app_cache.write_file_atomically(str(tmp_path / "file.txt"), "text")
+    app_cache.write_file_atomically(str(tmp_path / "file.bin"), b"bytes")
+
+    assert (tmp_path / "file.txt").read_text() == "text"
+    assert (tmp_path / "file.bin").read_bytes() == b"bytes"
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "file.bin",
+        "file.txt",
+    ]
+
+
+def test_failed_replace(tmp_path, monkeypatch):
+    """
+    Test 'write_file_atomically' function.
+
+    Function is tested with the failed replace of the file. The error must
+    be raised, the file must be kept and the temporary file removed.
+
+    Args:
+        tmp_path (Fixture): fixture that return the temporary directory.
+        monkeypatch (Fixture): fixture that patches 'os.replace'.
+    """
+    file_path = tmp_path / "file.txt"
+    file_path.write_text("old")
+
+    def fail_replace(source_path, target_path):
+        raise OSError("replace failed")
+
+    monkeypatch.setattr(os, "replace", fail_replace)
+
+    with pytest.raises(OSError):
+        app_cache.write_file_atomically(str(file_path), "new")
+    assert file_path.read_text() == "old"
+    assert [path.name for path in tmp_path.iterdir()] == ["file.txt"]
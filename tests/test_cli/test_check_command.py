@@ -0,0 +1,35 @@
+from click.testing import CliRunner
+
+from wallpaper_downloader import retry, site_parser
+from wallpaper_downloader.cli import cli
+from wallpaper_downloader.month_check import EXIT_NEW_MONTH
+
+
+def test_new_month_is_found_once(fixtures_server, monkeypatch, tmp_path):
+    """
+    Test 'check' command of the CLI.
+
+    Command is tested twice with the same state file. Only the first check
+    must report the new month.
+
+    Args:
+        fixtures_server (Fixture): fixture that start the local server
+            with pages from files for tests.
+        monkeypatch (Fixture): fixture for patching of module attributes.
+        tmp_path (Fixture): fixture that return the temporary directory.
+    """
+    monkeypatch.setattr(site_parser, "BASE_URL", fixtures_server.url)
+    monkeypatch.setattr(retry, "_retry_policy", retry.get_retry_policy())
+    arguments = [
+        "check",
+        "--no-http-cache",
+        "--state-file",
+        str(tmp_path / "last_check.json"),
+    ]
+
+    first_result = CliRunner().invoke(cli, arguments)
+    second_result = CliRunner().invoke(cli, arguments)
+
+    assert first_result.exit_code == EXIT_NEW_MONTH
+    assert first_result.output == "08-2020\n"
+    assert second_result.exit_code == 0
@@ -0,0 +1,15 @@
+from click.testing import CliRunner
+
+from wallpaper_downloader.cli import cli
+
+
+def test_from_without_to():
+    """
+    Test 'download' command of the CLI.
+
+    Command is tested with '--from' option without '--to' option.
+    """
+    result = CliRunner().invoke(cli, ["download", "--from", "05-2020"])
+
+    assert result.exit_code == 2
+    assert "must be used together" in result.output
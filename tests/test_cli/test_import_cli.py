@@ -0,0 +1,25 @@
+import subprocess
+import sys
+
+
+def test_heavy_modules_are_not_imported():
+    """
+    Test the import of cli module.
+
+    Modules with heavy dependencies must be imported only by commands,
+    so the start of the CLI stays fast.
+    """
+    completed_process = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, wallpaper_downloader.cli; "
+            "print(*sorted(set(sys.modules) & "
+            "{'aiohttp', 'bs4', 'requests', 'lxml'}))",
+        ],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+
+    assert completed_process.stdout.strip() == ""
@@ -0,0 +1,48 @@
+import asyncio
+
+import pytest
+
+from wallpaper_downloader.concurrency import AdaptiveConcurrency
+
+
+@pytest.mark.asyncio
+async def test_wait_for_free_slot():
+    """
+    Test 'acquire' method of AdaptiveConcurrency class.
+
+    Method is tested with all slots taken. The download must wait until
+    one of the running downloads is finished.
+    """
+    concurrency = AdaptiveConcurrency(min_limit=1, max_limit=1)
+    token = await concurrency.acquire()
+    waiting_task = asyncio.create_task(concurrency.acquire())
+    await asyncio.sleep(0.01)
+    assert not waiting_task.done()
+
+    await concurrency.release(token, 0.1)
+    await asyncio.wait_for(waiting_task, 1)
+    assert concurrency.in_flight == 1
+
+
+def test_created_before_event_loop():
+    """
+    Test 'acquire' method of AdaptiveConcurrency class.
+
+    Method is tested with the limit created before 'asyncio.run' and used
+    in two event loops, like the downloader does. Waiting downloads must
+    not fail with the condition of another event loop.
+    """
+    concurrency = AdaptiveConcurrency(min_limit=1, max_limit=1)
+
+    async def download():
+        token = await concurrency.acquire()
+        await asyncio.sleep(0.01)
+        await concurrency.release(token, 0.01)
+
+    async def download_all():
+        await asyncio.gather(*(download() for _ in range(3)))
+
+    asyncio.run(download_all())
+    asyncio.run(download_all())
+
+    assert concurrency.in_flight == 0
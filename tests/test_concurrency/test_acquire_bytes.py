@@ -0,0 +1,61 @@
+import asyncio
+
+import pytest
+
+from wallpaper_downloader.concurrency import ByteBudget
+
+
+@pytest.mark.asyncio
+async def test_wait_for_free_bytes():
+    """
+    Test 'acquire' method of ByteBudget class.
+
+    Method is tested with the body which does not fit in the rest of
+    the budget. The download must wait until other bodies are downloaded.
+    """
+    byte_budget = ByteBudget(max_bytes=100)
+    reserved_bytes = await byte_budget.acquire(60)
+    waiting_task = asyncio.create_task(byte_budget.acquire(50))
+    await asyncio.sleep(0.01)
+    assert not waiting_task.done()
+
+    await byte_budget.release(reserved_bytes)
+    assert await asyncio.wait_for(waiting_task, 1) == 50
+    assert byte_budget.in_flight_bytes == 50
+
+
+@pytest.mark.asyncio
+async def test_body_bigger_than_budget():
+    """
+    Test 'acquire' method of ByteBudget class.
+
+    Method is tested with the body bigger than the whole budget. The body
+    must take the whole budget instead of waiting forever.
+    """
+    byte_budget = ByteBudget(max_bytes=100)
+    reserved_bytes = await asyncio.wait_for(byte_budget.acquire(1000), 1)
+    assert reserved_bytes == 100
+    assert byte_budget.in_flight_bytes == 100
+
+
+def test_budget_created_before_event_loop():
+    """
+    Test 'acquire' method of ByteBudget class.
+
+    Method is tested with the budget created before 'asyncio.run', like
+    the downloader does. Waiting downloads must not fail with
+    the condition of another event loop.
+    """
+    byte_budget = ByteBudget(10)
+
+    async def download():
+        reserved_bytes = await byte_budget.acquire(8)
+        await asyncio.sleep(0.01)
+        await byte_budget.release(reserved_bytes)
+
+    async def download_all():
+        await asyncio.gather(*(download() for _ in range(3)))
+
+    asyncio.run(download_all())
+
+    assert byte_budget.in_flight_bytes == 0
@@ -0,0 +1,72 @@
+import pytest
+
+from wallpaper_downloader.concurrency import AdaptiveConcurrency
+
+
+@pytest.mark.asyncio
+async def test_successful_downloads():
+    """
+    Test 'release' method of AdaptiveConcurrency class.
+
+    Method is tested with successful downloads. The limit must grow
+    by about one after the window of downloads and must not exceed
+    the maximum.
+    """
+    concurrency = AdaptiveConcurrency(
+        min_limit=1,
+        max_limit=5,
+        initial_limit=2,
+    )
+    for _ in range(3):
+        token = await concurrency.acquire()
+        await concurrency.release(token, 0.1)
+    assert concurrency.current == 3
+
+    for _ in range(100):
+        token = await concurrency.acquire()
+        await concurrency.release(token, 0.1)
+    assert concurrency.current == 5
+    assert concurrency.peak_limit == 5
+
+
+@pytest.mark.asyncio
+async def test_failed_downloads_of_one_window():
+    """
+    Test 'release' method of AdaptiveConcurrency class.
+
+    Method is tested with failures of concurrent downloads. The limit must
+    be halved once for downloads started before the decrease and must not
+    be lower than the minimum.
+    """
+    concurrency = AdaptiveConcurrency(
+        min_limit=2,
+        max_limit=16,
+        initial_limit=8,
+    )
+    tokens = [await concurrency.acquire() for _ in range(4)]
+    for token in tokens:
+        await concurrency.release(token, None)
+    assert concurrency.current == 4
+
+    for _ in range(3):
+        token = await concurrency.acquire()
+        await concurrency.release(token, None)
+    assert concurrency.current == 2
+
+
+@pytest.mark.asyncio
+async def test_slow_downloads():
+    """
+    Test 'release' method of AdaptiveConcurrency class.
+
+    Method is tested with response times much longer than the best one.
+    The limit must not grow.
+    """
+    concurrency = AdaptiveConcurrency(initial_limit=4)
+    token = await concurrency.acquire()
+    await concurrency.release(token, 0.1)
+    limit = concurrency.limit
+    for _ in range(10):
+        token = await concurrency.acquire()
+        await concurrency.release(token, 1.0)
+    assert concurrency.limit == limit
@@ -0,0 +1,41 @@
+import os
+
+from wallpaper_downloader.content_store import ContentStore
+from wallpaper_downloader.manifest import get_file_hash
+
+
+def test_identical_wallpapers_are_linked(tmp_path):
+    """
+    Test 'add' method of ContentStore class.
+
+    Method is tested with two identical wallpapers in directories of
+    different months. The second one must become the link to the object
+    of the first one.
+
+    Args:
+        tmp_path (Fixture): fixture that return the temporary directory.
+    """
+    content_store = ContentStore(str(tmp_path))
+    wallpapers_paths = []
+    for directory_name in ("july-2020", "july-2021"):
+        wallpaper_path = tmp_path / directory_name / "wallpaper.png"
+        wallpaper_path.parent.mkdir()
+        wallpaper_path.write_bytes(b"wallpaper")
+        wallpapers_paths.append(str(wallpaper_path))
+    sha256 = get_file_hash(wallpapers_paths[0])
+
+    first_is_duplicate = content_store.add(
+        wallpapers_paths[0],
+        "https://example.com/2020/wallpaper.png",
+        sha256,
+    )
+    second_is_duplicate = content_store.add(
+        wallpapers_paths[1],
+        "https://example.com/2021/wallpaper.png",
+        sha256,
+    )
+
+    assert first_is_duplicate is False
+    assert second_is_duplicate is True
+    assert os.path.samefile(*wallpapers_paths)
+    assert os.stat(wallpapers_paths[0]).st_nlink == 3
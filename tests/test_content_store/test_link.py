@@ -0,0 +1,34 @@
+import os
+
+from wallpaper_downloader.content_store import ContentStore
+from wallpaper_downloader.manifest import get_file_hash
+
+
+def test_known_url_is_linked(tmp_path):
+    """
+    Test 'link' method of ContentStore class.
+
+    Method is tested with the URL added to the store by the previous run
+    and with the unknown URL.
+
+    Args:
+        tmp_path (Fixture): fixture that return the temporary directory.
+    """
+    wallpaper_url = "https://example.com/wallpaper.png"
+    wallpaper_path = tmp_path / "july-2020" / "wallpaper.png"
+    wallpaper_path.parent.mkdir()
+    wallpaper_path.write_bytes(b"wallpaper")
+    sha256 = get_file_hash(str(wallpaper_path))
+    previous_store = ContentStore(str(tmp_path))
+    previous_store.add(str(wallpaper_path), wallpaper_url, sha256)
+    previous_store.save()
+    linked_path = tmp_path / "july-2021" / "wallpaper.png"
+
+    content_store = ContentStore(str(tmp_path))
+
+    assert content_store.link(wallpaper_url, str(linked_path)) == sha256
+    assert os.path.samefile(wallpaper_path, linked_path)
+    assert content_store.link(
+        "https://example.com/unknown.png",
+        str(tmp_path / "unknown.png"),
+    ) is None
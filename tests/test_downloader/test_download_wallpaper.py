@@ -1,7 +1,9 @@
 import os
+
 import aiohttp
 import pytest
 
+from wallpaper_downloader import retry
 from wallpaper_downloader.downloader import WallpaperDownloader
 
 
@@ -65,3 +67,102 @@ async def test_bad_wallpaper_url(
             session,
         )
     assert os.path.isfile(wallpaper_path) is False
+
+
+@pytest.mark.asyncio
+async def test_resume_of_broken_download(
+    fixtures_server,
+    get_wallpaper_path,
+    get_temp_directory_path,
+    create_delete_temp_directory,
+):
+    """
+    Test '_download_wallpaper' method of WallpaperDownloader class.
+
+    Method is tested with the connection which is broken in the middle of
+    the image. The next download must request only the rest of the image.
+
+    Args:
+        fixtures_server (Fixture): fixture that start the local server
+            with pages from files for tests.
+        get_wallpaper_path (Fixture): fixture that return the absolute
+            path to the wallpaper.
+        get_temp_directory_path (Fixture): fixture that return the absolute
+            path to the temporary directory.
+        create_delete_temp_directory (Fixture): fixture that create temporary
+            directory before the test and delete after the test.
+    """
+    downloader = WallpaperDownloader("07-2020")
+    wallpaper_filename = "july-20-birdie-july-cal-1920x1080.png"
+    wallpaper_url = f"{fixtures_server.url}/{wallpaper_filename}"
+    wallpaper_path = get_wallpaper_path(wallpaper_filename)
+    fixtures_server.broken_images.add(f"/{wallpaper_filename}")
+    image_size = len(f"/{wallpaper_filename}".encode() * 100)
+
+    async with aiohttp.ClientSession() as session:
+        with pytest.raises(aiohttp.ClientPayloadError):
+            await downloader._download_wallpaper(
+                wallpaper_path,
+                wallpaper_url,
+                session,
+            )
+        assert os.path.isfile(wallpaper_path) is False
+        assert len(os.listdir(get_temp_directory_path)) == 2
+
+        await downloader._download_wallpaper(
+            wallpaper_path,
+            wallpaper_url,
+            session,
+        )
+
+    assert fixtures_server.requested_ranges == [
+        None,
+        f"bytes={image_size // 2}-",
+    ]
+    with open(wallpaper_path, "rb") as wallpaper:
+        assert wallpaper.read() == f"/{wallpaper_filename}".encode() * 100
+    assert os.listdir(get_temp_directory_path) == [wallpaper_filename]
+
+
+@pytest.mark.asyncio
+async def test_retry_of_broken_download(
+    fixtures_server,
+    monkeypatch,
+    get_wallpaper_path,
+    create_delete_temp_directory,
+):
+    """
+    Test '_download_wallpaper' method of WallpaperDownloader class.
+
+    Method is tested with the connection which is broken in the middle of
+    the image and with retries. The retry must request only the rest of
+    the image.
+
+    Args:
+        fixtures_server (Fixture): fixture that start the local server
+            with pages from files for tests.
+        monkeypatch (Fixture): fixture for patching of module attributes.
+        get_wallpaper_path (Fixture): fixture that return the absolute
+            path to the wallpaper.
+        create_delete_temp_directory (Fixture): fixture that create temporary
+            directory before the test and delete after the test.
+    """
+    retry_policy = retry.RetryPolicy(max_attempts=2, base_delay=0)
+    monkeypatch.setattr(retry, "_retry_policy", retry_policy)
+    downloader = WallpaperDownloader("07-2020")
+    wallpaper_filename = "july-20-birdie-july-cal-1920x1080.png"
+    wallpaper_path = get_wallpaper_path(wallpaper_filename)
+    fixtures_server.broken_images.add(f"/{wallpaper_filename}")
+
+    async with aiohttp.ClientSession() as session:
+        await downloader._download_wallpaper(
+            wallpaper_path,
+            f"{fixtures_server.url}/{wallpaper_filename}",
+            session,
+        )
+
+    assert fixtures_server.requested_ranges[0] is None
+    assert fixtures_server.requested_ranges[1].startswith("bytes=")
+    with open(wallpaper_path, "rb") as wallpaper:
+        assert wallpaper.read() == f"/{wallpaper_filename}".encode() * 100
+    assert retry_policy.retries_count == 1
@@ -29,11 +29,11 @@ def test_with_good_arguments(
     main_directory_path = get_temp_directory_path
     directory_path_to_wallpapers_with_calendar = os.path.join(
         main_directory_path,
-        "july-2020 (with-calendar)",
+        "july-2020 1920x1080 (with-calendar)",
     )
     directory_path_to_wallpapers_without_calendar = os.path.join(
         main_directory_path,
-        "july-2020 (without-calendar)",
+        "july-2020 1920x1080 (without-calendar)",
     )
 
     downloader = WallpaperDownloader(
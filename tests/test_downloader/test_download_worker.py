@@ -0,0 +1,90 @@
+import asyncio
+import os
+
+import aiohttp
+import pytest
+
+from wallpaper_downloader import metrics
+from wallpaper_downloader.downloader import WallpaperDownloader
+
+
+@pytest.mark.asyncio
+async def test_download_from_queue(
+    fixtures_server,
+    get_wallpaper_path,
+    create_delete_temp_directory,
+):
+    """
+    Test '_download_worker' method of WallpaperDownloader class.
+
+    Method is tested with the queue of one good wallpaper, the wallpaper
+    from the host which refuses connections and 'None'. The failed
+    wallpaper must not stop the worker.
+
+    Args:
+        fixtures_server (Fixture): fixture that start the local server
+            with pages from files for tests.
+        get_wallpaper_path (Fixture): fixture that return the absolute
+            path to the wallpaper.
+        create_delete_temp_directory (Fixture): fixture that create temporary
+            directory before the test and delete after the test.
+    """
+    downloader = WallpaperDownloader("07-2020")
+    wallpaper_filename = "july-20-birdie-july-cal-1920x1080.png"
+    wallpaper_path = get_wallpaper_path(wallpaper_filename)
+    wallpapers_queue = asyncio.Queue()
+    wallpapers_queue.put_nowait((
+        get_wallpaper_path("refused.png"),
+        "http://127.0.0.1:1/refused.png",
+        None,
+    ))
+    wallpapers_queue.put_nowait((
+        wallpaper_path,
+        f"{fixtures_server.url}/{wallpaper_filename}",
+        None,
+    ))
+    wallpapers_queue.put_nowait(None)
+
+    async with aiohttp.ClientSession() as session:
+        await asyncio.wait_for(
+            downloader._download_worker(wallpapers_queue, session),
+            5,
+        )
+
+    assert os.path.isfile(wallpaper_path) is True
+    assert wallpapers_queue.empty()
+
+
+@pytest.mark.asyncio
+async def test_unexpected_error(monkeypatch):
+    """
+    Test '_download_worker' method of WallpaperDownloader class.
+
+    Method is tested with the download which raises the unexpected error.
+    The worker must count the failure and consume the rest of the queue.
+
+    Args:
+        monkeypatch (Fixture): fixture for patching of module attributes.
+    """
+    async def download_wallpaper(*args):
+        raise ValueError("unexpected")
+
+    downloader = WallpaperDownloader("07-2020")
+    monkeypatch.setattr(downloader, "_download_wallpaper", download_wallpaper)
+    monkeypatch.setattr(metrics, "_metrics", metrics.Metrics())
+    wallpapers_queue = asyncio.Queue()
+    for wallpaper_number in range(2):
+        wallpapers_queue.put_nowait((
+            f"/tmp/{wallpaper_number}.png",
+            f"http://127.0.0.1:1/{wallpaper_number}.png",
+            None,
+        ))
+    wallpapers_queue.put_nowait(None)
+
+    await asyncio.wait_for(
+        downloader._download_worker(wallpapers_queue, None),
+        5,
+    )
+
+    assert wallpapers_queue.empty()
+    assert metrics.get_metrics().counters["wallpapers_failed_total"] == 2
@@ -0,0 +1,153 @@
+import os
+
+import pytest
+
+from wallpaper_downloader import metrics
+from wallpaper_downloader.downloader import WallpaperDownloader
+
+
+@pytest.mark.asyncio
+async def test_with_local_server(
+    fixtures_server,
+    get_wallpapers_urls_from_file,
+    get_temp_directory_path,
+    delete_temp_directory,
+):
+    """
+    Test '_downloader_event_loop' method of WallpaperDownloader class.
+
+    Method is tested on the local server. Parsing and downloading must
+    be done in one session.
+
+    Args:
+        fixtures_server (Fixture): fixture that start the local server
+            with pages from files for tests.
+        get_wallpapers_urls_from_file (Fixture): fixture that return URLs of
+            wallpapers in format {'wallpaper_filename': 'wallpaper_url'}.
+        get_temp_directory_path (Fixture): fixture that return the absolute
+            path to the temporary directory.
+        delete_temp_directory (Fixture): fixture that deletes the temporary
+            directory after the test.
+    """
+    downloader = WallpaperDownloader(
+        "07-2020",
+        destination_directory_path=get_temp_directory_path,
+    )
+    await downloader._downloader_event_loop()
+    downloader.io_executor.shutdown()
+
+    downloaded_filenames = []
+    for directory_name in os.listdir(get_temp_directory_path):
+        directory_path = os.path.join(get_temp_directory_path, directory_name)
+        if os.path.isdir(directory_path):
+            downloaded_filenames.extend(os.listdir(directory_path))
+    assert sorted(downloaded_filenames) == sorted(
+        get_wallpapers_urls_from_file,
+    )
+    assert len(fixtures_server.requested_paths) == (
+        2 + len(get_wallpapers_urls_from_file)
+    )
+
+
+@pytest.mark.asyncio
+async def test_with_downloaded_wallpapers(
+    fixtures_server,
+    get_wallpapers_urls_from_file,
+    get_temp_directory_path,
+    delete_temp_directory,
+    monkeypatch,
+):
+    """
+    Test '_downloader_event_loop' method of WallpaperDownloader class.
+
+    Method is tested on the local server with wallpapers downloaded by
+    the previous run. Wallpapers must not be downloaded again. The quick
+    check must not request them, the full check must revalidate them
+    by ETag.
+
+    Args:
+        fixtures_server (Fixture): fixture that start the local server
+            with pages from files for tests.
+        get_wallpapers_urls_from_file (Fixture): fixture that return URLs of
+            wallpapers in format {'wallpaper_filename': 'wallpaper_url'}.
+        get_temp_directory_path (Fixture): fixture that return the absolute
+            path to the temporary directory.
+        delete_temp_directory (Fixture): fixture that deletes the temporary
+            directory after the test.
+        monkeypatch (Fixture): fixture for patching of module attributes.
+    """
+    images_requests_counts = []
+    for verify in ("quick", "quick", "full"):
+        monkeypatch.setattr(metrics, "_metrics", metrics.Metrics())
+        fixtures_server.requested_paths.clear()
+        downloader = WallpaperDownloader(
+            "07-2020",
+            destination_directory_path=get_temp_directory_path,
+            verify=verify,
+        )
+        await downloader._downloader_event_loop()
+        downloader.io_executor.shutdown()
+        images_requests_counts.append(
+            len(fixtures_server.requested_paths) - 2,
+        )
+
+    wallpapers_count = len(get_wallpapers_urls_from_file)
+    assert images_requests_counts == [wallpapers_count, 0, wallpapers_count]
+    assert metrics.get_metrics().counters["wallpapers_skipped_total"] == (
+        wallpapers_count
+    )
+    assert not metrics.get_metrics().counters.get("downloaded_bytes_total")
+
+
+@pytest.mark.asyncio
+async def test_with_changed_wallpapers(
+    fixtures_server,
+    get_wallpapers_urls_from_file,
+    get_temp_directory_path,
+    delete_temp_directory,
+    monkeypatch,
+):
+    """
+    Test '_downloader_event_loop' method of WallpaperDownloader class.
+
+    Method is tested on the local server with wallpapers whose ETag
+    changed since the previous run. The full check must download them
+    again.
+
+    Args:
+        fixtures_server (Fixture): fixture that start the local server
+            with pages from files for tests.
+        get_wallpapers_urls_from_file (Fixture): fixture that return URLs of
+            wallpapers in format {'wallpaper_filename': 'wallpaper_url'}.
+        get_temp_directory_path (Fixture): fixture that return the absolute
+            path to the temporary directory.
+        delete_temp_directory (Fixture): fixture that deletes the temporary
+            directory after the test.
+        monkeypatch (Fixture): fixture for patching of module attributes.
+    """
+    downloader = WallpaperDownloader(
+        "07-2020",
+        destination_directory_path=get_temp_directory_path,
+    )
+    await downloader._downloader_event_loop()
+    downloader.io_executor.shutdown()
+    for wallpaper_record in downloader.manifest.records.values():
+        wallpaper_record["etag"] = '"old image"'
+    downloader.manifest.save()
+
+    monkeypatch.setattr(metrics, "_metrics", metrics.Metrics())
+    downloader = WallpaperDownloader(
+        "07-2020",
+        destination_directory_path=get_temp_directory_path,
+        verify="full",
+    )
+    await downloader._downloader_event_loop()
+    downloader.io_executor.shutdown()
+
+    assert metrics.get_metrics().counters["wallpapers_ok_total"] == len(
+        get_wallpapers_urls_from_file,
+    )
+    assert {
+        wallpaper_record["etag"]
+        for wallpaper_record in downloader.manifest.records.values()
+    } == {'"image"'}
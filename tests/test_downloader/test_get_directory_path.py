@@ -13,7 +13,7 @@ def test_directory_path_with_calendar():
     directory_path = downloader._get_directory_path(with_calendar=True)
     exist_directory_path = os.path.join(
         downloader.destination_directory_path,
-        "august-2020 (with-calendar)",
+        "august-2020 1920x1080 (with-calendar)",
     )
     assert directory_path == exist_directory_path
 
@@ -28,6 +28,6 @@ def test_directory_path_without_calendar():
     directory_path = downloader._get_directory_path(with_calendar=False)
     exist_directory_path = os.path.join(
         downloader.destination_directory_path,
-        "august-2020 (without-calendar)",
+        "august-2020 1920x1080 (without-calendar)",
     )
     assert directory_path == exist_directory_path
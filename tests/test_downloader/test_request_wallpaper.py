@@ -0,0 +1,94 @@
+import aiohttp
+import pytest
+
+from wallpaper_downloader import metrics
+from wallpaper_downloader.downloader import WallpaperDownloader
+from wallpaper_downloader.partial_download import PartialDownload
+
+
+@pytest.mark.asyncio
+async def test_rejected_range(
+    fixtures_server,
+    monkeypatch,
+    get_wallpaper_path,
+    create_delete_temp_directory,
+):
+    """
+    Test '_request_wallpaper' method of WallpaperDownloader class.
+
+    Method is tested with the partial file whose range is rejected by
+    the server with '416 Range Not Satisfiable'. The partial file must be
+    discarded and the whole wallpaper must be requested only once more.
+
+    Args:
+        fixtures_server (Fixture): fixture that start the local server
+            with pages from files for tests.
+        monkeypatch (Fixture): fixture for patching of module attributes.
+        get_wallpaper_path (Fixture): fixture that return the absolute
+            path to the wallpaper.
+        create_delete_temp_directory (Fixture): fixture that create temporary
+            directory before the test and delete after the test.
+    """
+    monkeypatch.setattr(metrics, "_metrics", metrics.Metrics())
+    downloader = WallpaperDownloader("07-2020")
+    wallpaper_filename = "july-20-birdie-july-cal-1920x1080.png"
+    wallpaper_path = get_wallpaper_path(wallpaper_filename)
+    wallpaper_url = f"{fixtures_server.url}/{wallpaper_filename}"
+    partial_download = PartialDownload(wallpaper_path, wallpaper_url)
+    part_file, _ = partial_download.open(False)
+    with part_file:
+        part_file.write(b"part")
+    partial_download.mark('"image"', None)
+    fixtures_server.unsatisfiable_images.add(f"/{wallpaper_filename}")
+
+    async with aiohttp.ClientSession() as session:
+        status, _ = await downloader._request_wallpaper(
+            wallpaper_path,
+            wallpaper_url,
+            session,
+        )
+
+    assert status == 416
+    assert fixtures_server.requested_ranges == ["bytes=4-", None]
+    assert PartialDownload(wallpaper_path, wallpaper_url).load() is False
+    assert metrics.get_metrics().counters["wallpapers_failed_total"] == 1
+
+
+@pytest.mark.asyncio
+async def test_unsatisfiable_without_range(
+    fixtures_server,
+    monkeypatch,
+    get_wallpaper_path,
+    create_delete_temp_directory,
+):
+    """
+    Test '_request_wallpaper' method of WallpaperDownloader class.
+
+    Method is tested with the server which responds with '416 Range Not
+    Satisfiable' to the request without 'Range' header. The wallpaper
+    must be requested once and counted as failed.
+
+    Args:
+        fixtures_server (Fixture): fixture that start the local server
+            with pages from files for tests.
+        monkeypatch (Fixture): fixture for patching of module attributes.
+        get_wallpaper_path (Fixture): fixture that return the absolute
+            path to the wallpaper.
+        create_delete_temp_directory (Fixture): fixture that create temporary
+            directory before the test and delete after the test.
+    """
+    monkeypatch.setattr(metrics, "_metrics", metrics.Metrics())
+    downloader = WallpaperDownloader("07-2020")
+    wallpaper_filename = "july-20-birdie-july-cal-1920x1080.png"
+    fixtures_server.unsatisfiable_images.add(f"/{wallpaper_filename}")
+
+    async with aiohttp.ClientSession() as session:
+        status, _ = await downloader._request_wallpaper(
+            get_wallpaper_path(wallpaper_filename),
+            f"{fixtures_server.url}/{wallpaper_filename}",
+            session,
+        )
+
+    assert status == 416
+    assert len(fixtures_server.requested_paths) == 1
+    assert metrics.get_metrics().counters["wallpapers_failed_total"] == 1
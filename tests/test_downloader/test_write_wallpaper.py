@@ -0,0 +1,78 @@
+import hashlib
+import os
+
+import aiohttp
+import pytest
+
+from wallpaper_downloader.downloader import WallpaperDownloader
+
+
+@pytest.mark.asyncio
+async def test_streamed_wallpaper(
+    get_fake_response,
+    get_wallpaper_path,
+    get_temp_directory_path,
+    create_delete_temp_directory,
+):
+    """
+    Test '_write_wallpaper' method of WallpaperDownloader class.
+
+    Method is tested with the body received in several chunks.
+
+    Args:
+        get_fake_response (Fixture): fixture that return the fake response.
+        get_wallpaper_path (Fixture): fixture that return the absolute
+            path to the wallpaper.
+        get_temp_directory_path (Fixture): fixture that return the absolute
+            path to the temporary directory.
+        create_delete_temp_directory (Fixture): fixture that create temporary
+            directory before the test and delete after the test.
+    """
+    downloader = WallpaperDownloader("07-2020", chunk_size=4)
+    wallpaper_path = get_wallpaper_path("wallpaper-1920x1080.png")
+    response = get_fake_response([b"abcd", b"efgh", b"ij"])
+
+    wallpaper_size, wallpaper_sha256 = await downloader._write_wallpaper(
+        response,
+        wallpaper_path,
+    )
+
+    assert wallpaper_size == 10
+    assert wallpaper_sha256 == hashlib.sha256(b"abcdefghij").hexdigest()
+    with open(wallpaper_path, "rb") as wallpaper:
+        assert wallpaper.read() == b"abcdefghij"
+    assert os.listdir(get_temp_directory_path) == ["wallpaper-1920x1080.png"]
+
+
+@pytest.mark.asyncio
+async def test_broken_stream(
+    get_fake_response,
+    get_wallpaper_path,
+    get_temp_directory_path,
+    create_delete_temp_directory,
+):
+    """
+    Test '_write_wallpaper' method of WallpaperDownloader class.
+
+    Method is tested with the connection broken in the middle of the body.
+
+    Args:
+        get_fake_response (Fixture): fixture that return the fake response.
+        get_wallpaper_path (Fixture): fixture that return the absolute
+            path to the wallpaper.
+        get_temp_directory_path (Fixture): fixture that return the absolute
+            path to the temporary directory.
+        create_delete_temp_directory (Fixture): fixture that create temporary
+            directory before the test and delete after the test.
+    """
+    downloader = WallpaperDownloader("07-2020")
+    wallpaper_path = get_wallpaper_path("wallpaper-1920x1080.png")
+    response = get_fake_response(
+        [b"abcd"],
+        error=aiohttp.ClientPayloadError("Connection lost"),
+    )
+
+    with pytest.raises(aiohttp.ClientPayloadError):
+        await downloader._write_wallpaper(response, wallpaper_path)
+
+    assert os.listdir(get_temp_directory_path) == []
@@ -0,0 +1,37 @@
+from wallpaper_downloader.http_cache import PageCache
+
+
+def test_unchanged_page(tmp_path):
+    """
+    Test 'load_parsed' method of PageCache class.
+
+    Method is tested with the page which is not changed.
+
+    Args:
+        tmp_path (Fixture): fixture that return the temporary directory.
+    """
+    page_cache = PageCache(str(tmp_path))
+    page = page_cache.store("https://example.com/", b"x", {"ETag": '"v1"'})
+    page_cache.store_parsed(page, "names", ["Birdie July"])
+    assert page_cache.load_parsed(page, "names") == ["Birdie July"]
+
+
+def test_changed_page(tmp_path):
+    """
+    Test 'load_parsed' method of PageCache class.
+
+    Method is tested with the page which body was changed.
+
+    Args:
+        tmp_path (Fixture): fixture that return the temporary directory.
+    """
+    page_cache = PageCache(str(tmp_path))
+    page = page_cache.store("https://example.com/", b"x", {"ETag": '"v1"'})
+    page_cache.store_parsed(page, "names", ["Birdie July"])
+    new_page = page_cache.store(
+        "https://example.com/",
+        b"y",
+        {"ETag": '"v2"'},
+    )
+    assert page_cache.load_parsed(page, "names") is None
+    assert page_cache.load_parsed(new_page, "names") is None
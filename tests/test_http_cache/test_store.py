@@ -0,0 +1,45 @@
+from wallpaper_downloader.http_cache import PageCache
+
+
+def test_stored_page(tmp_path):
+    """
+    Test 'store' method of PageCache class.
+
+    Method is tested with the page with validators.
+
+    Args:
+        tmp_path (Fixture): fixture that return the temporary directory.
+    """
+    page_cache = PageCache(str(tmp_path))
+    page_cache.store(
+        "https://example.com/",
+        b"<html></html>",
+        {"ETag": '"v1"', "Last-Modified": "Wed, 01 Jul 2020 10:00:00 GMT"},
+    )
+
+    page = page_cache.load("https://example.com/")
+    assert page.body == b"<html></html>"
+    assert page_cache.get_conditional_headers(page) == {
+        "If-None-Match": '"v1"',
+        "If-Modified-Since": "Wed, 01 Jul 2020 10:00:00 GMT",
+    }
+
+
+def test_eviction_of_least_recently_used_page(tmp_path):
+    """
+    Test 'store' method of PageCache class.
+
+    Method is tested with pages which size is bigger than the cache size.
+
+    Args:
+        tmp_path (Fixture): fixture that return the temporary directory.
+    """
+    page_cache = PageCache(str(tmp_path), max_size=25)
+    page_cache.store("https://example.com/1/", b"1" * 10, {})
+    page_cache.store("https://example.com/2/", b"2" * 10, {})
+    page_cache.load("https://example.com/1/")
+    page_cache.store("https://example.com/3/", b"3" * 10, {})
+
+    assert page_cache.load("https://example.com/1/") is not None
+    assert page_cache.load("https://example.com/2/") is None
+    assert page_cache.load("https://example.com/3/") is not None
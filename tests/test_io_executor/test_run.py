@@ -0,0 +1,35 @@
+import threading
+
+import pytest
+
+from wallpaper_downloader.io_executor import IOExecutor
+
+
+@pytest.mark.asyncio
+async def test_call_outside_of_event_loop_thread():
+    """
+    Test 'run' method of IOExecutor class.
+
+    Method is tested with the function that returns the name of the thread
+    in which it was called.
+    """
+    io_executor = IOExecutor(max_workers=1)
+    thread_name = await io_executor.run(
+        lambda: threading.current_thread().name,
+    )
+    io_executor.shutdown()
+    assert thread_name != threading.current_thread().name
+    assert thread_name.startswith("wallpaper-io")
+
+
+@pytest.mark.asyncio
+async def test_call_with_arguments():
+    """
+    Test 'run' method of IOExecutor class.
+
+    Method is tested with positional and keyword arguments of the function.
+    """
+    io_executor = IOExecutor()
+    result = await io_executor.run(int, "ff", base=16)
+    io_executor.shutdown()
+    assert result == 255
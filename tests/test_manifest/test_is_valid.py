@@ -0,0 +1,105 @@
+import pytest
+
+from wallpaper_downloader.manifest import Manifest, get_file_hash
+
+
+@pytest.fixture()
+def get_recorded_wallpaper(tmp_path):
+    """
+    Fixture. Create the wallpaper and add its record to the manifest.
+
+    Args:
+        tmp_path (Fixture): fixture that return the temporary directory.
+
+    Returns:
+        tuple: the manifest and the absolute path of the wallpaper.
+    """
+    wallpaper_path = tmp_path / "july-2020" / "wallpaper.png"
+    wallpaper_path.parent.mkdir()
+    wallpaper_path.write_bytes(b"wallpaper")
+    manifest = Manifest(str(tmp_path))
+    manifest.record(
+        str(wallpaper_path),
+        "https://example.com/wallpaper.png",
+        len(b"wallpaper"),
+        get_file_hash(str(wallpaper_path)),
+    )
+    manifest.save()
+    return Manifest(str(tmp_path)), wallpaper_path
+
+
+@pytest.mark.parametrize("verify", ["quick", "full"])
+def test_complete_wallpaper(get_recorded_wallpaper, verify):
+    """
+    Test 'is_valid' method of Manifest class.
+
+    Method is tested with the wallpaper which is not changed.
+
+    Args:
+        get_recorded_wallpaper (Fixture): fixture that return the manifest
+            and the path of the recorded wallpaper.
+        verify (str): mode of the check.
+    """
+    manifest, wallpaper_path = get_recorded_wallpaper
+    assert manifest.is_valid(
+        str(wallpaper_path),
+        "https://example.com/wallpaper.png",
+        verify,
+    ) is True
+
+
+def test_changed_wallpaper(get_recorded_wallpaper):
+    """
+    Test 'is_valid' method of Manifest class.
+
+    Method is tested with the wallpaper which content is changed, but
+    the size is the same. Only the full check finds the change.
+
+    Args:
+        get_recorded_wallpaper (Fixture): fixture that return the manifest
+            and the path of the recorded wallpaper.
+    """
+    manifest, wallpaper_path = get_recorded_wallpaper
+    wallpaper_path.write_bytes(b"WALLPAPER")
+    wallpaper_url = "https://example.com/wallpaper.png"
+    assert manifest.is_valid(str(wallpaper_path), wallpaper_url) is True
+    assert manifest.is_valid(
+        str(wallpaper_path),
+        wallpaper_url,
+        "full",
+    ) is False
+
+
+def test_truncated_wallpaper(get_recorded_wallpaper):
+    """
+    Test 'is_valid' method of Manifest class.
+
+    Method is tested with the wallpaper which size is changed.
+
+    Args:
+        get_recorded_wallpaper (Fixture): fixture that return the manifest
+            and the path of the recorded wallpaper.
+    """
+    manifest, wallpaper_path = get_recorded_wallpaper
+    wallpaper_path.write_bytes(b"wall")
+    assert manifest.is_valid(
+        str(wallpaper_path),
+        "https://example.com/wallpaper.png",
+    ) is False
+
+
+def test_wallpaper_with_new_url(get_recorded_wallpaper):
+    """
+    Test 'is_valid' method of Manifest class.
+
+    Method is tested with the wallpaper which URL is changed.
+
+    Args:
+        get_recorded_wallpaper (Fixture): fixture that return the manifest
+            and the path of the recorded wallpaper.
+    """
+    manifest, wallpaper_path = get_recorded_wallpaper
+    assert manifest.is_valid(
+        str(wallpaper_path),
+        "https://example.com/new-wallpaper.png",
+    ) is False
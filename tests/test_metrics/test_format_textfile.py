@@ -0,0 +1,37 @@
+from wallpaper_downloader.metrics import Metrics
+
+
+def test_counters_and_histograms():
+    """
+    Test 'format_textfile' method of Metrics class.
+
+    Method is tested with the counter and the histogram. Buckets of
+    the histogram must be cumulative.
+    """
+    run_metrics = Metrics()
+    run_metrics.increment("wallpapers_ok_total", 3)
+    run_metrics.increment("downloaded_bytes_total", 12345678)
+    for value in (0.02, 0.2, 40):
+        run_metrics.observe("image_request_seconds", value)
+
+    textfile_lines = run_metrics.format_textfile().splitlines()
+
+    assert "# TYPE wallpaper_downloader_wallpapers_ok_total counter" in (
+        textfile_lines
+    )
+    assert "wallpaper_downloader_wallpapers_ok_total 3" in textfile_lines
+    assert "wallpaper_downloader_downloaded_bytes_total 12345678" in (
+        textfile_lines
+    )
+    assert (
+        'wallpaper_downloader_image_request_seconds_bucket{le="0.025"} 1'
+    ) in textfile_lines
+    assert (
+        'wallpaper_downloader_image_request_seconds_bucket{le="30"} 2'
+    ) in textfile_lines
+    assert (
+        'wallpaper_downloader_image_request_seconds_bucket{le="+Inf"} 3'
+    ) in textfile_lines
+    assert "wallpaper_downloader_image_request_seconds_count 3" in (
+        textfile_lines
+    )
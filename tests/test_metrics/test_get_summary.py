@@ -0,0 +1,24 @@
+from wallpaper_downloader.metrics import Metrics
+
+
+def test_summary_of_run():
+    """
+    Test 'get_summary' method of Metrics class.
+
+    Method is tested with counters of files, the downloaded size,
+    the duration of the run and latencies of requests.
+    """
+    run_metrics = Metrics()
+    run_metrics.increment("wallpapers_ok_total", 2)
+    run_metrics.increment("wallpapers_skipped_total")
+    run_metrics.increment("downloaded_bytes_total", 4 * 2 ** 20)
+    run_metrics.set_gauge("run_duration_seconds", 2)
+    run_metrics.observe("image_request_seconds", 0.07)
+    run_metrics.observe("image_request_seconds", 0.3)
+
+    summary = run_metrics.get_summary()
+
+    assert summary[0] == "Wallpapers: 2 downloaded, 0 failed, 1 skipped."
+    assert summary[1] == "Downloaded 4.00 MiB in 2.00 s (2.00 MiB/s)."
+    assert summary[3].startswith("Image requests: 2 in 0.37 s")
+    assert summary[3].endswith("p50 <= 0.1 s, p95 <= 0.5 s.")
@@ -0,0 +1,22 @@
+from wallpaper_downloader.metrics import Metrics
+
+
+def test_atomic_write(tmp_path):
+    """
+    Test 'write_textfile' method of Metrics class.
+
+    Method is tested with writing of the textfile. Only the textfile must
+    be left in the directory.
+
+    Args:
+        tmp_path (Fixture): fixture that return the temporary directory.
+    """
+    run_metrics = Metrics()
+    run_metrics.set_gauge("run_duration_seconds", 1.5)
+    textfile_path = tmp_path / "wallpaper_downloader.prom"
+    run_metrics.write_textfile(str(textfile_path))
+
+    assert textfile_path.read_text() == run_metrics.format_textfile()
+    assert [path.name for path in tmp_path.iterdir()] == [
+        "wallpaper_downloader.prom",
+    ]
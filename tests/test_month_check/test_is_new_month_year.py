@@ -0,0 +1,28 @@
+import pytest
+
+from wallpaper_downloader.month_check import is_new_month_year
+
+
+@pytest.mark.parametrize(
+    "month_year, known_month_year, expected",
+    [
+        ("08-2020", "07-2020", True),
+        ("01-2021", "12-2020", True),
+        ("07-2020", "07-2020", False),
+        ("12-2019", "07-2020", False),
+        ("07-2020", None, True),
+    ],
+)
+def test_compare_months(month_year, known_month_year, expected):
+    """
+    Test 'is_new_month_year' function of month_check module.
+
+    Function is tested with newer, equal and older months and without
+    the known month.
+
+    Args:
+        month_year (str): the newest month on the site.
+        known_month_year (str): the newest known month.
+        expected (bool): expected result.
+    """
+    assert is_new_month_year(month_year, known_month_year) is expected
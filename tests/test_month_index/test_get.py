@@ -0,0 +1,29 @@
+from wallpaper_downloader.month_index import MonthIndex
+
+
+def test_without_index_file(tmp_path):
+    """
+    Test 'get' method of MonthIndex class.
+
+    Method is tested with the index which file does not exist.
+
+    Args:
+        tmp_path (Fixture): fixture that return the temporary directory.
+    """
+    month_index = MonthIndex(str(tmp_path / "month_index.json"))
+    assert month_index.get("july", "2020") is None
+
+
+def test_with_broken_index_file(tmp_path):
+    """
+    Test 'get' method of MonthIndex class.
+
+    Method is tested with the index which file is not JSON.
+
+    Args:
+        tmp_path (Fixture): fixture that return the temporary directory.
+    """
+    index_path = tmp_path / "month_index.json"
+    index_path.write_text("{broken")
+    month_index = MonthIndex(str(index_path))
+    assert month_index.get("july", "2020") is None
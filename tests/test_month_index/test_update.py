@@ -0,0 +1,62 @@
+from wallpaper_downloader.month_index import MonthIndex
+
+
+def test_new_pages_urls(tmp_path):
+    """
+    Test 'update' method of MonthIndex class.
+
+    Method is tested with URLs which are not in the index.
+    The index must be saved to the file.
+
+    Args:
+        tmp_path (Fixture): fixture that return the temporary directory.
+    """
+    index_path = str(tmp_path / "cache" / "month_index.json")
+    month_index = MonthIndex(index_path)
+    pages_urls = {
+        "july-2020": "/2020/06/desktop-wallpaper-calendars-july-2020/",
+    }
+
+    assert month_index.update(pages_urls) is True
+    assert MonthIndex(index_path).get("july", "2020") == (
+        "/2020/06/desktop-wallpaper-calendars-july-2020/"
+    )
+
+
+def test_known_pages_urls(tmp_path):
+    """
+    Test 'update' method of MonthIndex class.
+
+    Method is tested with URLs which are already in the index.
+
+    Args:
+        tmp_path (Fixture): fixture that return the temporary directory.
+    """
+    month_index = MonthIndex(str(tmp_path / "month_index.json"))
+    pages_urls = {
+        "july-2020": "/2020/06/desktop-wallpaper-calendars-july-2020/",
+    }
+    month_index.update(pages_urls)
+
+    assert month_index.update(pages_urls) is False
+
+
+def test_without_saving(tmp_path):
+    """
+    Test 'update' method of MonthIndex class.
+
+    Method is tested with saving disabled. The index must be changed in
+    memory and the file must not be written.
+
+    Args:
+        tmp_path (Fixture): fixture that return the temporary directory.
+    """
+    index_path = tmp_path / "month_index.json"
+    month_index = MonthIndex(str(index_path))
+    pages_urls = {
+        "july-2020": "/2020/06/desktop-wallpaper-calendars-july-2020/",
+    }
+
+    assert month_index.update(pages_urls, save=False) is True
+    assert month_index.get("july", "2020") == pages_urls["july-2020"]
+    assert not index_path.exists()
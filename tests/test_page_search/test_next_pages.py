@@ -0,0 +1,46 @@
+from wallpaper_downloader.page_search import PageSearch
+
+
+def test_estimated_page(get_first_page_urls):
+    """
+    Test 'next_pages' method of PageSearch class.
+
+    Method is tested with the month which is 40 months older than
+    the newest month. There are 10 months on the page.
+
+    Args:
+        get_first_page_urls (Fixture): fixture that return URLs of
+            wallpapers pages of the first category page.
+    """
+    page_search = PageSearch(get_first_page_urls, "april", "2017")
+    assert page_search.next_pages() == [5]
+
+
+def test_window_of_pages(get_first_page_urls):
+    """
+    Test 'next_pages' method of PageSearch class.
+
+    Method is tested with the window of three pages.
+
+    Args:
+        get_first_page_urls (Fixture): fixture that return URLs of
+            wallpapers pages of the first category page.
+    """
+    page_search = PageSearch(get_first_page_urls, "april", "2017")
+    assert page_search.next_pages(3) == [5, 6, 4]
+
+
+def test_page_after_last_page(get_first_page_urls):
+    """
+    Test 'next_pages' method of PageSearch class.
+
+    Method is tested after the request of the page which does not exist.
+
+    Args:
+        get_first_page_urls (Fixture): fixture that return URLs of
+            wallpapers pages of the first category page.
+    """
+    page_search = PageSearch(get_first_page_urls, "april", "2017")
+    page_search.observe(5, None)
+    assert page_search.high == 4
+    assert page_search.next_pages() == [4]
@@ -0,0 +1,68 @@
+from wallpaper_downloader.page_search import PageSearch
+
+
+def test_page_with_month(get_first_page_urls):
+    """
+    Test 'observe' method of PageSearch class.
+
+    Method is tested with the page which contains requested month.
+
+    Args:
+        get_first_page_urls (Fixture): fixture that return URLs of
+            wallpapers pages of the first category page.
+    """
+    page_search = PageSearch(get_first_page_urls, "april", "2017")
+    page_search.observe(5, {"april-2017": "/april-2017/"})
+    assert page_search.done is True
+    assert page_search.result == "/april-2017/"
+
+
+def test_page_with_newer_months(get_first_page_urls):
+    """
+    Test 'observe' method of PageSearch class.
+
+    Method is tested with the page where all months are newer than
+    requested month. The next page must be interpolated.
+
+    Args:
+        get_first_page_urls (Fixture): fixture that return URLs of
+            wallpapers pages of the first category page.
+    """
+    page_search = PageSearch(get_first_page_urls, "april", "2017")
+    page_search.observe(3, {"june-2018": "/june-2018/"})
+    assert page_search.low == 4
+    assert page_search.next_pages() == [5]
+
+
+def test_page_with_older_months(get_first_page_urls):
+    """
+    Test 'observe' method of PageSearch class.
+
+    Method is tested with the page where all months are older than
+    requested month.
+
+    Args:
+        get_first_page_urls (Fixture): fixture that return URLs of
+            wallpapers pages of the first category page.
+    """
+    page_search = PageSearch(get_first_page_urls, "april", "2017")
+    page_search.observe(6, {"january-2017": "/january-2017/"})
+    assert page_search.high == 5
+    assert page_search.next_pages() == [5]
+
+
+def test_page_without_month_in_range(get_first_page_urls):
+    """
+    Test 'observe' method of PageSearch class.
+
+    Method is tested with the page where months around requested month
+    exist, but requested month does not exist.
+
+    Args:
+        get_first_page_urls (Fixture): fixture that return URLs of
+            wallpapers pages of the first category page.
+    """
+    page_search = PageSearch(get_first_page_urls, "april", "2017")
+    page_search.observe(5, {"may-2017": "/may-2017/", "march-2017": "/m/"})
+    assert page_search.done is True
+    assert page_search.result is None
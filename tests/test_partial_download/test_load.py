@@ -0,0 +1,50 @@
+import os
+
+from wallpaper_downloader.partial_download import PartialDownload
+
+
+def test_partial_file_with_marker(tmp_path):
+    """
+    Test 'load' method of PartialDownload class.
+
+    Method is tested with the partial file of the same URL.
+
+    Args:
+        tmp_path (Fixture): fixture that return the temporary directory.
+    """
+    wallpaper_path = str(tmp_path / "wallpaper.png")
+    partial_download = PartialDownload(wallpaper_path, "https://e.com/w.png")
+    part_file, _ = partial_download.open(resume=False)
+    with part_file:
+        part_file.write(b"12345")
+    partial_download.mark('"v1"', None)
+
+    partial_download = PartialDownload(wallpaper_path, "https://e.com/w.png")
+    assert partial_download.load() is True
+    assert partial_download.get_range_headers() == {
+        "Range": "bytes=5-",
+        "If-Range": '"v1"',
+    }
+
+
+def test_partial_file_of_other_url(tmp_path):
+    """
+    Test 'load' method of PartialDownload class.
+
+    Method is tested with the partial file of another URL.
+    The partial file must be removed.
+
+    Args:
+        tmp_path (Fixture): fixture that return the temporary directory.
+    """
+    wallpaper_path = str(tmp_path / "wallpaper.png")
+    partial_download = PartialDownload(wallpaper_path, "https://e.com/w.png")
+    part_file, _ = partial_download.open(resume=False)
+    with part_file:
+        part_file.write(b"12345")
+    partial_download.mark('"v1"', None)
+
+    partial_download = PartialDownload(wallpaper_path, "https://e.com/x.png")
+    assert partial_download.load() is False
+    assert partial_download.get_range_headers() == {}
+    assert os.listdir(tmp_path) == []
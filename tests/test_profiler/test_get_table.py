@@ -0,0 +1,22 @@
+from wallpaper_downloader.profiler import Profiler
+
+
+def test_table_of_phases():
+    """
+    Test 'get_table' method of Profiler class.
+
+    Phases are listed in the order of the run, unknown phases are listed
+    after them.
+    """
+    profiler = Profiler()
+    profiler._record("write", 0.5, 0.25)
+    profiler._record("custom", 0.1, 0.0)
+    profiler._record("plan", 0.002, 0.001)
+    profiler._record("write", 0.5, 0.25)
+
+    table = profiler.get_table()
+
+    assert table[0].split() == ["phase", "calls", "wall", "s", "cpu", "s"]
+    assert table[1].split() == ["plan", "1", "0.002", "0.001"]
+    assert table[2].split() == ["write", "2", "1.000", "0.500"]
+    assert table[3].split() == ["custom", "1", "0.100", "0.000"]
@@ -0,0 +1,26 @@
+import time
+
+from wallpaper_downloader.profiler import Profiler
+
+
+def test_nested_phase_is_excluded():
+    """
+    Test 'phase' method of Profiler class.
+
+    Time of the nested phase is not included in the time of the outer
+    phase.
+    """
+    profiler = Profiler()
+
+    with profiler.phase("download"):
+        with profiler.phase("write"):
+            time.sleep(0.05)
+    with profiler.phase("write"):
+        pass
+
+    download_calls, download_wall_time, _ = profiler.phases["download"]
+    write_calls, write_wall_time, _ = profiler.phases["write"]
+    assert download_calls == 1
+    assert write_calls == 2
+    assert write_wall_time >= 0.05
+    assert download_wall_time < 0.05
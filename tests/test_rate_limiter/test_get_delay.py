@@ -0,0 +1,32 @@
+from wallpaper_downloader import rate_limiter
+
+
+def test_separate_budgets():
+    """
+    Test 'get_delay' method of RateLimiter class.
+
+    Method is tested with requests of different hosts and kinds.
+    Every host and kind must have its own budget.
+    """
+    limiter = rate_limiter.RateLimiter(html_rate=1, image_rate=1, burst=1)
+    page_url = "https://www.smashingmagazine.com/category/wallpapers/"
+    image_url = "http://files.smashingmagazine.com/wallpapers/image.png"
+
+    assert limiter.get_delay(page_url, rate_limiter.HTML) == 0
+    assert limiter.get_delay(image_url, rate_limiter.IMAGE) == 0
+    assert limiter.get_delay(image_url, rate_limiter.HTML) == 0
+    assert limiter.get_delay(page_url, rate_limiter.HTML) > 0
+
+
+def test_disabled_limit():
+    """
+    Test 'get_delay' method of RateLimiter class.
+
+    Method is tested with the disabled limit of images.
+    """
+    limiter = rate_limiter.RateLimiter(html_rate=1, image_rate=0)
+    image_url = "http://files.smashingmagazine.com/wallpapers/image.png"
+    delays = [
+        limiter.get_delay(image_url, rate_limiter.IMAGE) for _ in range(10)
+    ]
+    assert delays == [0] * 10
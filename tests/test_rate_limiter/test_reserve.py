@@ -0,0 +1,18 @@
+import pytest
+
+from wallpaper_downloader.rate_limiter import TokenBucket
+
+
+def test_burst_and_pacing():
+    """
+    Test 'reserve' method of TokenBucket class.
+
+    Method is tested with more requests than the capacity of the bucket.
+    Requests of the burst must not wait, next requests must be spread
+    with the rate of the bucket.
+    """
+    bucket = TokenBucket(rate=10, capacity=2)
+    delays = [bucket.reserve() for _ in range(4)]
+    assert delays[:2] == [0.0, 0.0]
+    assert delays[2] == pytest.approx(0.1, abs=0.01)
+    assert delays[3] == pytest.approx(0.2, abs=0.01)
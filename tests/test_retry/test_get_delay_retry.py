@@ -0,0 +1,29 @@
+from wallpaper_downloader.retry import RetryPolicy
+
+
+def test_exponential_backoff():
+    """
+    Test 'get_delay' method of RetryPolicy class.
+
+    Method is tested without 'Retry-After' header. The delay must be
+    random and not longer than the doubled base delay or the maximum.
+    """
+    retry_policy = RetryPolicy(base_delay=1, max_delay=5)
+    for attempt, max_delay in ((0, 1), (1, 2), (2, 4), (10, 5)):
+        delays = [retry_policy.get_delay(attempt) for _ in range(20)]
+        assert all(0 <= delay <= max_delay for delay in delays)
+        assert len(set(delays)) > 1
+
+
+def test_retry_after():
+    """
+    Test 'get_delay' method of RetryPolicy class.
+
+    Method is tested with 'Retry-After' header in seconds and in
+    the HTTP date format. The delay must follow the header and must not
+    be longer than the maximum.
+    """
+    retry_policy = RetryPolicy(max_delay=30)
+    assert retry_policy.get_delay(0, "7") == 7
+    assert retry_policy.get_delay(0, "120") == 30
+    assert retry_policy.get_delay(0, "Wed, 21 Oct 2015 07:28:00 GMT") == 0
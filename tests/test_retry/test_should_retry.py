@@ -0,0 +1,28 @@
+from wallpaper_downloader.retry import RetryPolicy
+
+
+def test_max_attempts():
+    """
+    Test 'should_retry' method of RetryPolicy class.
+
+    Method is tested with the last allowed attempt.
+    """
+    retry_policy = RetryPolicy(max_attempts=3)
+    url = "https://www.smashingmagazine.com/"
+    assert retry_policy.should_retry(0, url) is True
+    assert retry_policy.should_retry(1, url) is True
+    assert retry_policy.should_retry(2, url) is False
+    assert retry_policy.retries_count == 2
+
+
+def test_exhausted_budget():
+    """
+    Test 'should_retry' method of RetryPolicy class.
+
+    Method is tested with more failed requests than the budget of retries.
+    """
+    retry_policy = RetryPolicy(max_attempts=5, budget=2)
+    url = "https://www.smashingmagazine.com/"
+    results = [retry_policy.should_retry(0, url) for _ in range(4)]
+    assert results == [True, True, False, False]
+    assert retry_policy.denied_retries_count == 2
@@ -0,0 +1,31 @@
+from wallpaper_downloader import site_parser
+
+
+def test_connection_is_reused(fixtures_server, monkeypatch):
+    """
+    Test '_download_page' function of site_parser module.
+
+    Function is tested with several pages of the same host. All pages
+    must be requested through one kept-alive connection.
+
+    Args:
+        fixtures_server (Fixture): fixture that start the local server
+            with pages from files for tests.
+        monkeypatch (Fixture): fixture for patching of module attributes.
+    """
+    monkeypatch.setattr(
+        site_parser,
+        "http_session",
+        site_parser.create_http_session(),
+    )
+
+    for page_path in (
+        "/category/wallpapers/",
+        "/categories/wallpapers/page/2/",
+        "/2020/06/desktop-wallpaper-calendars-july-2020/",
+    ):
+        page = site_parser._download_page(f"{fixtures_server.url}{page_path}")
+        assert page.body
+
+    assert len(fixtures_server.requested_paths) == 3
+    assert len(fixtures_server.clients_ports) == 1
@@ -0,0 +1,135 @@
+import threading
+
+import aiohttp
+import pytest
+
+from wallpaper_downloader import retry, site_parser
+from wallpaper_downloader.http_cache import PageCache
+
+
+@pytest.mark.asyncio
+async def test_revalidation_of_cached_page(
+    fixtures_server,
+    monkeypatch,
+    tmp_path,
+):
+    """
+    Test '_download_page_async' function of site_parser module.
+
+    Function is tested with the page which was cached by previous request.
+    The page must be revalidated and must not be parsed again.
+
+    Args:
+        fixtures_server (Fixture): fixture that start the local server
+            with pages from files for tests.
+        monkeypatch (Fixture): fixture for patching of module attributes.
+        tmp_path (Fixture): fixture that return the temporary directory.
+    """
+    monkeypatch.setattr(site_parser, "page_cache", PageCache(str(tmp_path)))
+    page_url = (
+        f"{fixtures_server.url}/2020/06/desktop-wallpaper-calendars-july-2020/"
+    )
+
+    async with aiohttp.ClientSession() as session:
+        page = await site_parser._download_page_async(page_url, session)
+        page_index = site_parser._get_wallpapers_page_index(page)
+        cached_page = await site_parser._download_page_async(
+            page_url,
+            session,
+        )
+
+    monkeypatch.setattr(site_parser, "_index_wallpapers_page", None)
+    assert page.unchanged is False
+    assert cached_page.unchanged is True
+    assert cached_page.body == page.body
+    assert site_parser._get_wallpapers_page_index(cached_page) == page_index
+
+
+@pytest.mark.asyncio
+async def test_without_cache(fixtures_server):
+    """
+    Test '_download_page_async' function of site_parser module.
+
+    Function is tested with the disabled cache.
+
+    Args:
+        fixtures_server (Fixture): fixture that start the local server
+            with pages from files for tests.
+    """
+    async with aiohttp.ClientSession() as session:
+        page = await site_parser._download_page_async(
+            f"{fixtures_server.url}/category/wallpapers/",
+            session,
+        )
+    assert page.unchanged is False
+    assert page.etag is None
+
+
+@pytest.mark.asyncio
+async def test_retry_of_unavailable_page(fixtures_server, monkeypatch):
+    """
+    Test '_download_page_async' function of site_parser module.
+
+    Function is tested with the page which is unavailable on the first
+    request. The request must be repeated.
+
+    Args:
+        fixtures_server (Fixture): fixture that start the local server
+            with pages from files for tests.
+        monkeypatch (Fixture): fixture for patching of module attributes.
+    """
+    retry_policy = retry.RetryPolicy(max_attempts=2, base_delay=0)
+    monkeypatch.setattr(retry, "_retry_policy", retry_policy)
+    fixtures_server.unavailable_paths.add("/category/wallpapers/")
+
+    async with aiohttp.ClientSession() as session:
+        page = await site_parser._download_page_async(
+            f"{fixtures_server.url}/category/wallpapers/",
+            session,
+        )
+    assert page.body
+    assert len(fixtures_server.requested_paths) == 2
+    assert retry_policy.retries_count == 1
+
+
+@pytest.mark.asyncio
+async def test_cache_outside_of_event_loop(
+    fixtures_server,
+    monkeypatch,
+    tmp_path,
+):
+    """
+    Test '_download_page_async' function of site_parser module.
+
+    Function is tested with the enabled cache. Files of the cache must be
+    read and written outside of the thread of the event loop.
+
+    Args:
+        fixtures_server (Fixture): fixture that start the local server
+            with pages from files for tests.
+        monkeypatch (Fixture): fixture for patching of module attributes.
+        tmp_path (Fixture): fixture that return the temporary directory.
+    """
+    page_cache = PageCache(str(tmp_path))
+    cache_threads = []
+
+    def load(page_url):
+        cache_threads.append(threading.current_thread())
+        return PageCache.load(page_cache, page_url)
+
+    def store(page_url, body, headers):
+        cache_threads.append(threading.current_thread())
+        return PageCache.store(page_cache, page_url, body, headers)
+
+    monkeypatch.setattr(page_cache, "load", load)
+    monkeypatch.setattr(page_cache, "store", store)
+    monkeypatch.setattr(site_parser, "page_cache", page_cache)
+
+    async with aiohttp.ClientSession() as session:
+        await site_parser._download_page_async(
+            f"{fixtures_server.url}/category/wallpapers/",
+            session,
+        )
+
+    assert len(cache_threads) == 2
+    assert threading.current_thread() not in cache_threads
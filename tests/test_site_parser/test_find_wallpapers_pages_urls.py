@@ -0,0 +1,35 @@
+from wallpaper_downloader import site_parser
+
+
+def test_page_with_wallpapers_pages_urls(get_page_html_from_file):
+    """
+    Test '_find_wallpapers_pages_urls' function of site_parser module.
+
+    Function is tested with the category page.
+
+    Args:
+        get_page_html_from_file (Fixture): fixture that return HTML.
+    """
+    page_html = get_page_html_from_file("first_main_page.html")
+    pages_urls = site_parser._find_wallpapers_pages_urls(page_html)
+    assert len(pages_urls) == 10
+    assert pages_urls["august-2020"] == (
+        "/2020/07/desktop-wallpaper-calendars-august-2020/"
+    )
+    assert pages_urls["november-2019"] == (
+        "/2019/10/desktop-wallpaper-calendars-november-2019/"
+    )
+
+
+def test_page_without_wallpapers_pages_urls(get_page_html_from_file):
+    """
+    Test '_find_wallpapers_pages_urls' function of site_parser module.
+
+    Function is tested with the last category page without monthly
+    wallpapers.
+
+    Args:
+        get_page_html_from_file (Fixture): fixture that return HTML.
+    """
+    page_html = get_page_html_from_file("last_main_page.html")
+    assert site_parser._find_wallpapers_pages_urls(page_html) == {}
@@ -0,0 +1,46 @@
+from wallpaper_downloader import site_parser
+
+
+def test_page_with_wallpapers(
+    get_page_html_from_file,
+    get_wallpapers_names_from_file,
+):
+    """
+    Test '_find_wallpapers_resolutions' function of site_parser module.
+
+    Function is tested with the HTML where wallpapers are exist.
+
+    Args:
+        get_page_html_from_file (Fixture): fixture that return HTML.
+        get_wallpapers_names_from_file (Fixture): fixture that return
+            names of wallpapers.
+    """
+    page_html = get_page_html_from_file("page_with_wallpapers.html")
+    resolutions = site_parser._find_wallpapers_resolutions(
+        page_html,
+        get_wallpapers_names_from_file,
+    )
+    assert {"1920x1080", "2560x1440", "800x600"} <= resolutions
+    assert "Preview" not in resolutions
+
+
+def test_page_without_wallpapers(
+    get_page_html_from_file,
+    get_wallpapers_names_from_file,
+):
+    """
+    Test '_find_wallpapers_resolutions' function of site_parser module.
+
+    Function is tested with the HTML where wallpapers are not exist.
+
+    Args:
+        get_page_html_from_file (Fixture): fixture that return HTML.
+        get_wallpapers_names_from_file (Fixture): fixture that return
+            names of wallpapers.
+    """
+    page_html = get_page_html_from_file("first_main_page.html")
+    resolutions = site_parser._find_wallpapers_resolutions(
+        page_html,
+        get_wallpapers_names_from_file,
+    )
+    assert resolutions == set()
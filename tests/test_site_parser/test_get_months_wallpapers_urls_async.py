@@ -0,0 +1,66 @@
+import aiohttp
+import pytest
+
+from wallpaper_downloader import site_parser
+
+
+@pytest.mark.asyncio
+async def test_with_several_months(
+    fixtures_server,
+    get_wallpapers_urls_from_file,
+):
+    """
+    Test 'get_months_wallpapers_urls_async' function of site_parser module.
+
+    Function is tested on the local server with two months from the first
+    category page. The category page must be requested once. The month
+    whose wallpapers page does not exist must be skipped.
+
+    Args:
+        fixtures_server (Fixture): fixture that start the local server
+            with pages from files for tests.
+        get_wallpapers_urls_from_file (Fixture): fixture that return URLs of
+            wallpapers in format {'wallpaper_filename': 'wallpaper_url'}.
+    """
+    async with aiohttp.ClientSession() as session:
+        months_wallpapers_urls = (
+            await site_parser.get_months_wallpapers_urls_async(
+                ["07-2020", "05-2020"],
+                ["1920x1080"],
+                session,
+            )
+        )
+
+    assert list(months_wallpapers_urls) == ["07-2020"]
+    assert len(months_wallpapers_urls["07-2020"]["1920x1080"]) == len(
+        get_wallpapers_urls_from_file,
+    )
+    assert fixtures_server.requested_paths.count("/category/wallpapers/") == 1
+
+
+@pytest.mark.asyncio
+async def test_with_unavailable_category_page(fixtures_server):
+    """
+    Test 'get_months_wallpapers_urls_async' function of site_parser module.
+
+    Function is tested on the local server with the second category page
+    which responds with '503 Service Unavailable' and without retries.
+    Only the month searched on this page must be skipped.
+
+    Args:
+        fixtures_server (Fixture): fixture that start the local server
+            with pages from files for tests.
+    """
+    fixtures_server.unavailable_paths.add("/categories/wallpapers/page/2/")
+
+    async with aiohttp.ClientSession() as session:
+        months_wallpapers_urls = (
+            await site_parser.get_months_wallpapers_urls_async(
+                ["07-2020", "03-2019"],
+                ["1920x1080"],
+                session,
+            )
+        )
+
+    assert list(months_wallpapers_urls) == ["07-2020"]
+    assert "/categories/wallpapers/page/2/" in fixtures_server.requested_paths
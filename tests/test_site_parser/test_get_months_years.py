@@ -0,0 +1,23 @@
+import pytest
+
+from wallpaper_downloader import site_parser
+
+
+def test_range_of_months():
+    """
+    Test 'get_months_years' function of site_parser module.
+
+    Function is tested with the range which crosses the new year.
+    """
+    months_years = site_parser.get_months_years("11-2019", "02-2020")
+    assert months_years == ["11-2019", "12-2019", "01-2020", "02-2020"]
+
+
+def test_reversed_range_of_months():
+    """
+    Test 'get_months_years' function of site_parser module.
+
+    Function is tested with the first month after the last month.
+    """
+    with pytest.raises(SystemExit):
+        site_parser.get_months_years("02-2020", "11-2019")
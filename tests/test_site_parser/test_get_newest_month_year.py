@@ -0,0 +1,27 @@
+from wallpaper_downloader import site_parser
+from wallpaper_downloader.http_cache import PageCache
+
+
+def test_revalidated_category_page(fixtures_server, monkeypatch, tmp_path):
+    """
+    Test 'get_newest_month_year' function of site_parser module.
+
+    Function is tested twice with the page cache. The second check must
+    revalidate the category page and must not parse it again.
+
+    Args:
+        fixtures_server (Fixture): fixture that start the local server
+            with pages from files for tests.
+        monkeypatch (Fixture): fixture for patching of module attributes.
+        tmp_path (Fixture): fixture that return the temporary directory.
+    """
+    monkeypatch.setattr(site_parser, "BASE_URL", fixtures_server.url)
+    monkeypatch.setattr(site_parser, "page_cache", PageCache(str(tmp_path)))
+
+    newest_month_year = site_parser.get_newest_month_year()
+    monkeypatch.setattr(site_parser, "_parse_html", None)
+    cached_newest_month_year = site_parser.get_newest_month_year()
+
+    assert newest_month_year == "08-2020"
+    assert cached_newest_month_year == "08-2020"
+    assert fixtures_server.requested_paths == ["/category/wallpapers/"] * 2
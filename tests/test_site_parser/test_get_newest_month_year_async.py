@@ -0,0 +1,55 @@
+import threading
+
+import aiohttp
+import pytest
+
+from wallpaper_downloader import site_parser
+from wallpaper_downloader.http_cache import PageCache
+
+
+@pytest.mark.asyncio
+async def test_parsed_page_outside_of_event_loop(
+    fixtures_server,
+    monkeypatch,
+    tmp_path,
+):
+    """
+    Test 'get_newest_month_year_async' function of site_parser module.
+
+    Function is tested twice with the page cache. The second check must
+    not parse the page again and the stored result must be read and
+    written outside of the thread of the event loop.
+
+    Args:
+        fixtures_server (Fixture): fixture that start the local server
+            with pages from files for tests.
+        monkeypatch (Fixture): fixture for patching of module attributes.
+        tmp_path (Fixture): fixture that return the temporary directory.
+    """
+    page_cache = PageCache(str(tmp_path))
+    cache_threads = []
+
+    def load_parsed(page, name):
+        cache_threads.append(threading.current_thread())
+        return PageCache.load_parsed(page_cache, page, name)
+
+    def store_parsed(page, name, parsed):
+        cache_threads.append(threading.current_thread())
+        PageCache.store_parsed(page_cache, page, name, parsed)
+
+    monkeypatch.setattr(page_cache, "load_parsed", load_parsed)
+    monkeypatch.setattr(page_cache, "store_parsed", store_parsed)
+    monkeypatch.setattr(site_parser, "page_cache", page_cache)
+
+    async with aiohttp.ClientSession() as session:
+        newest_month_year = await site_parser.get_newest_month_year_async(
+            session,
+        )
+        monkeypatch.setattr(site_parser, "_parse_html", None)
+        cached_newest_month_year = (
+            await site_parser.get_newest_month_year_async(session)
+        )
+
+    assert newest_month_year == cached_newest_month_year == "08-2020"
+    assert len(cache_threads) == 2
+    assert threading.current_thread() not in cache_threads
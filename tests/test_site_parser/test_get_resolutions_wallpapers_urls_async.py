@@ -0,0 +1,62 @@
+import aiohttp
+import pytest
+
+from wallpaper_downloader import site_parser
+
+
+@pytest.mark.asyncio
+async def test_with_several_resolutions(
+    fixtures_server,
+    get_wallpapers_urls_from_file,
+):
+    """
+    Test 'get_resolutions_wallpapers_urls_async' function of site_parser.
+
+    Function is tested on the local server with two available resolutions
+    and one missing resolution. The page with wallpapers must be requested
+    once and the missing resolution must be omitted.
+
+    Args:
+        fixtures_server (Fixture): fixture that start the local server
+            with pages from files for tests.
+        get_wallpapers_urls_from_file (Fixture): fixture that return URLs of
+            wallpapers in format {'wallpaper_filename': 'wallpaper_url'}.
+    """
+    async with aiohttp.ClientSession() as session:
+        resolutions_wallpapers_urls = (
+            await site_parser.get_resolutions_wallpapers_urls_async(
+                "07-2020",
+                ["1920x1080", "2560x1440", "1920x10"],
+                session,
+            )
+        )
+
+    assert sorted(resolutions_wallpapers_urls) == ["1920x1080", "2560x1440"]
+    assert len(resolutions_wallpapers_urls["1920x1080"]) == len(
+        get_wallpapers_urls_from_file,
+    )
+    assert all(
+        "2560x1440" in wallpaper_url
+        for wallpaper_url in resolutions_wallpapers_urls["2560x1440"].values()
+    )
+    assert len(fixtures_server.requested_paths) == 2
+
+
+@pytest.mark.asyncio
+async def test_with_bad_resolutions(fixtures_server):
+    """
+    Test 'get_resolutions_wallpapers_urls_async' function of site_parser.
+
+    Function is tested with resolutions which are not available.
+
+    Args:
+        fixtures_server (Fixture): fixture that start the local server
+            with pages from files for tests.
+    """
+    async with aiohttp.ClientSession() as session:
+        with pytest.raises(SystemExit):
+            await site_parser.get_resolutions_wallpapers_urls_async(
+                "07-2020",
+                ["1920x10", "10x10"],
+                session,
+            )
@@ -0,0 +1,88 @@
+import aiohttp
+import pytest
+
+from wallpaper_downloader import site_parser
+from wallpaper_downloader.month_index import MonthIndex
+
+
+@pytest.mark.asyncio
+async def test_with_empty_month_index(fixtures_server, monkeypatch, tmp_path):
+    """
+    Test '_get_wallpapers_page_url_async' function of site_parser module.
+
+    Function is tested with the empty month index. Category pages must
+    be requested and added to the index.
+
+    Args:
+        fixtures_server (Fixture): fixture that start the local server
+            with pages from files for tests.
+        monkeypatch (Fixture): fixture for patching of module attributes.
+        tmp_path (Fixture): fixture that return the temporary directory.
+    """
+    index_path = str(tmp_path / "month_index.json")
+    monkeypatch.setattr(site_parser, "month_index", MonthIndex(index_path))
+    monkeypatch.setattr(site_parser, "page_search_window", 1)
+
+    async with aiohttp.ClientSession() as session:
+        page_url = await site_parser._get_wallpapers_page_url_async(
+            "01-2019",
+            session,
+        )
+
+    assert page_url == (
+        f"{fixtures_server.url}"
+        "/2018/12/desktop-wallpaper-calendars-january-2019/"
+    )
+    assert len(fixtures_server.requested_paths) == 2
+    assert len(MonthIndex(index_path).pages_urls) == 20
+
+
+@pytest.mark.asyncio
+async def test_with_filled_month_index(fixtures_server, monkeypatch, tmp_path):
+    """
+    Test '_get_wallpapers_page_url_async' function of site_parser module.
+
+    Function is tested with the month index which contains requested month.
+    Category pages must not be requested.
+
+    Args:
+        fixtures_server (Fixture): fixture that start the local server
+            with pages from files for tests.
+        monkeypatch (Fixture): fixture for patching of module attributes.
+        tmp_path (Fixture): fixture that return the temporary directory.
+    """
+    month_index = MonthIndex(str(tmp_path / "month_index.json"))
+    month_index.update({"march-2013": "/2013/02/wallpapers-march-2013/"})
+    monkeypatch.setattr(site_parser, "month_index", month_index)
+
+    async with aiohttp.ClientSession() as session:
+        page_url = await site_parser._get_wallpapers_page_url_async(
+            "03-2013",
+            session,
+        )
+
+    assert page_url == f"{fixtures_server.url}/2013/02/wallpapers-march-2013/"
+    assert fixtures_server.requested_paths == []
+
+
+@pytest.mark.asyncio
+async def test_with_not_published_month(fixtures_server):
+    """
+    Test '_get_wallpapers_page_url_async' function of site_parser module.
+
+    Function is tested with the month older than all category pages.
+    Pages after the last page don't exist.
+
+    Args:
+        fixtures_server (Fixture): fixture that start the local server
+            with pages from files for tests.
+    """
+    async with aiohttp.ClientSession() as session:
+        with pytest.raises(SystemExit):
+            await site_parser._get_wallpapers_page_url_async(
+                "03-2013",
+                session,
+            )
+
+    assert "/categories/wallpapers/page/2/" in fixtures_server.requested_paths
+    assert len(fixtures_server.requested_paths) < 15
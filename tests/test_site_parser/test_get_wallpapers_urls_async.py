@@ -0,0 +1,61 @@
+import aiohttp
+import pytest
+
+from wallpaper_downloader import site_parser
+
+
+@pytest.mark.asyncio
+async def test_with_good_arguments(
+    fixtures_server,
+    get_wallpapers_urls_from_file,
+):
+    """
+    Test 'get_wallpapers_urls_async' function of site_parser module.
+
+    Function is tested with the correct 'month_year' and
+    'resolution' arguments on the local server.
+
+    Args:
+        fixtures_server (Fixture): fixture that start the local server
+            with pages from files for tests.
+        get_wallpapers_urls_from_file (Fixture): fixture that return URLs of
+            wallpapers in format {'wallpaper_filename': 'wallpaper_url'}.
+    """
+    async with aiohttp.ClientSession() as session:
+        wallpapers_urls = await site_parser.get_wallpapers_urls_async(
+            "07-2020",
+            "1920x1080",
+            session,
+        )
+
+    expected_wallpapers_urls = {
+        wallpaper_name: wallpaper_url.replace(
+            fixtures_server.images_host,
+            fixtures_server.url,
+        )
+        for wallpaper_name, wallpaper_url
+        in get_wallpapers_urls_from_file.items()
+    }
+    assert wallpapers_urls == expected_wallpapers_urls
+    assert len(fixtures_server.requested_paths) == 2
+    assert len(fixtures_server.clients_ports) == 1
+
+
+@pytest.mark.asyncio
+async def test_with_bad_resolution(fixtures_server):
+    """
+    Test 'get_wallpapers_urls_async' function of site_parser module.
+
+    Function is tested with the incorrect 'resolution' argument.
+
+    Args:
+        fixtures_server (Fixture): fixture that start the local server
+            with pages from files for tests.
+    """
+    async with aiohttp.ClientSession() as session:
+        with pytest.raises(SystemExit):
+            await site_parser.get_wallpapers_urls_async(
+                "07-2020",
+                "1920x10",
+                session,
+            )
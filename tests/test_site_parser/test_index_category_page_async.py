@@ -0,0 +1,46 @@
+import threading
+
+import pytest
+
+from wallpaper_downloader import site_parser
+from wallpaper_downloader.month_index import MonthIndex
+
+
+@pytest.mark.asyncio
+async def test_save_outside_of_event_loop(
+    get_page_html_from_file,
+    monkeypatch,
+    tmp_path,
+):
+    """
+    Test '_index_category_page_async' function of site_parser module.
+
+    Function is tested with the category page whose months are not
+    indexed. The index must be saved outside of the thread of the event
+    loop.
+
+    Args:
+        get_page_html_from_file (Fixture): fixture that return HTML.
+        monkeypatch (Fixture): fixture for patching of module attributes.
+        tmp_path (Fixture): fixture that return the temporary directory.
+    """
+    index_path = str(tmp_path / "month_index.json")
+    month_index = MonthIndex(index_path)
+    save_threads = []
+
+    def save():
+        save_threads.append(threading.current_thread())
+        MonthIndex.save(month_index)
+
+    monkeypatch.setattr(month_index, "save", save)
+    monkeypatch.setattr(site_parser, "month_index", month_index)
+
+    await site_parser._index_category_page_async(
+        get_page_html_from_file("first_main_page.html"),
+    )
+
+    assert len(save_threads) == 1
+    assert save_threads[0] is not threading.current_thread()
+    assert MonthIndex(index_path).get("july", "2020") == (
+        "/2020/06/desktop-wallpaper-calendars-july-2020/"
+    )
@@ -0,0 +1,41 @@
+from wallpaper_downloader import site_parser
+
+
+def test_page_with_wallpapers(
+    get_page_html_from_file,
+    get_wallpapers_names_from_file,
+):
+    """
+    Test '_index_wallpapers_page' function of site_parser module.
+
+    Function is tested with the HTML where wallpapers are exist.
+
+    Args:
+        get_page_html_from_file (Fixture): fixture that return HTML.
+        get_wallpapers_names_from_file (Fixture): fixture that return
+            names of wallpapers.
+    """
+    page_html = get_page_html_from_file("page_with_wallpapers.html")
+    page_index = site_parser._index_wallpapers_page(page_html)
+    assert page_index.names == get_wallpapers_names_from_file
+    assert page_index.titles["Birdie July - 1920x1080"] == [
+        "http://files.smashingmagazine.com/wallpapers/july-20/"
+        "birdie-july/cal/july-20-birdie-july-cal-1920x1080.png",
+        "http://files.smashingmagazine.com/wallpapers/july-20/"
+        "birdie-july/nocal/july-20-birdie-july-nocal-1920x1080.png",
+    ]
+
+
+def test_page_without_wallpapers(get_page_html_from_file):
+    """
+    Test '_index_wallpapers_page' function of site_parser module.
+
+    Function is tested with the HTML where wallpapers are not exist.
+
+    Args:
+        get_page_html_from_file (Fixture): fixture that return HTML.
+    """
+    page_html = get_page_html_from_file("first_main_page.html")
+    page_index = site_parser._index_wallpapers_page(page_html)
+    assert page_index.names == []
+    assert "Birdie July - 1920x1080" not in page_index.titles
@@ -0,0 +1,63 @@
+import aiohttp
+import pytest
+
+from wallpaper_downloader import site_parser
+
+
+@pytest.mark.asyncio
+async def test_with_several_months(
+    fixtures_server,
+    get_wallpapers_urls_from_file,
+):
+    """
+    Test 'iter_wallpapers_urls_async' function of site_parser module.
+
+    Function is tested on the local server with the month whose page
+    with wallpapers does not exist and with the month which exists.
+    Only wallpapers of the existing month must be yielded.
+
+    Args:
+        fixtures_server (Fixture): fixture that start the local server
+            with pages from files for tests.
+        get_wallpapers_urls_from_file (Fixture): fixture that return URLs of
+            wallpapers in format {'wallpaper_filename': 'wallpaper_url'}.
+    """
+    async with aiohttp.ClientSession() as session:
+        wallpapers = [
+            wallpaper
+            async for wallpaper in site_parser.iter_wallpapers_urls_async(
+                ["05-2020", "07-2020"],
+                ["1920x1080"],
+                session,
+            )
+        ]
+
+    wallpapers_names = [wallpaper[2] for wallpaper in wallpapers]
+    assert sorted(wallpapers_names) == sorted(get_wallpapers_urls_from_file)
+    assert {
+        (month_year, resolution) for month_year, resolution, _, _ in wallpapers
+    } == {("07-2020", "1920x1080")}
+
+
+@pytest.mark.asyncio
+async def test_close_before_end(fixtures_server):
+    """
+    Test 'iter_wallpapers_urls_async' function of site_parser module.
+
+    Function is tested with the consumer which stops after the first
+    wallpaper. The generator must be closed without errors.
+
+    Args:
+        fixtures_server (Fixture): fixture that start the local server
+            with pages from files for tests.
+    """
+    async with aiohttp.ClientSession() as session:
+        wallpapers_urls = site_parser.iter_wallpapers_urls_async(
+            ["07-2020", "12-2012"],
+            ["1920x1080"],
+            session,
+        )
+        wallpaper = await wallpapers_urls.__anext__()
+        await wallpapers_urls.aclose()
+
+    assert wallpaper[0] == "07-2020"
@@ -0,0 +1,82 @@
+import os
+
+from wallpaper_downloader import site_parser
+
+
+def read_page(page_file_name: str) -> str:
+    """
+    Read the HTML of the page from the file.
+
+    Args:
+        page_file_name (str): the name of the file that
+            contains the HTML for parsing.
+
+    Returns:
+        str: HTML of the page.
+    """
+    page_path = os.path.join(
+        os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        "files_for_tests",
+        page_file_name,
+    )
+    with open(page_path) as page:
+        return page.read()
+
+
+def test_restricted_category_page(monkeypatch):
+    """
+    Test '_parse_html' function of site_parser module.
+
+    Function is tested in the restricted mode with the category page.
+
+    Args:
+        monkeypatch (Fixture): fixture for patching of module attributes.
+    """
+    monkeypatch.setattr(site_parser, "restricted_parsing", True)
+    page_html = site_parser._parse_html(read_page("first_main_page.html"))
+
+    assert page_html.find("script") is None
+    assert site_parser._find_next_page_url(page_html, "07-2020") == (
+        "/categories/wallpapers/page/2/"
+    )
+    assert site_parser._get_newest_wallpapers_month_year(page_html) == (
+        "august",
+        "2020",
+    )
+    assert site_parser._find_wallpapers_page_url(
+        page_html,
+        "july",
+        "2020",
+    ) == "/2020/06/desktop-wallpaper-calendars-july-2020/"
+
+
+def test_restricted_page_with_wallpapers(
+    monkeypatch,
+    get_wallpapers_names_from_file,
+    get_wallpapers_urls_from_file,
+):
+    """
+    Test '_parse_html' function of site_parser module.
+
+    Function is tested in the restricted mode with the page with wallpapers.
+
+    Args:
+        monkeypatch (Fixture): fixture for patching of module attributes.
+        get_wallpapers_names_from_file (Fixture): fixture that return
+            names of wallpapers.
+        get_wallpapers_urls_from_file (Fixture): fixture that return URLs of
+            wallpapers in format {'wallpaper_filename': 'wallpaper_url'}.
+    """
+    monkeypatch.setattr(site_parser, "restricted_parsing", True)
+    page_html = site_parser._parse_html(
+        read_page("page_with_wallpapers.html"),
+    )
+
+    wallpapers_names = site_parser._find_wallpapers_names(page_html)
+    wallpapers_urls = site_parser._find_wallpapers_urls(
+        page_html,
+        wallpapers_names,
+        "1920x1080",
+    )
+    assert wallpapers_names == get_wallpapers_names_from_file
+    assert wallpapers_urls == get_wallpapers_urls_from_file
@@ -0,0 +1,34 @@
+import pytest
+
+from wallpaper_downloader import site_parser
+
+
+def test_installed_parser(monkeypatch):
+    """
+    Test 'set_html_parser' function of site_parser module.
+
+    Function is tested with the parser which is always installed.
+
+    Args:
+        monkeypatch (Fixture): fixture for patching of module attributes.
+    """
+    monkeypatch.setattr(site_parser, "html_parser", None)
+    monkeypatch.setattr(site_parser, "restricted_parsing", False)
+    site_parser.set_html_parser("html.parser", restricted=True)
+    assert site_parser.html_parser == "html.parser"
+    assert site_parser.restricted_parsing is True
+
+
+def test_not_installed_parser(monkeypatch):
+    """
+    Test 'set_html_parser' function of site_parser module.
+
+    Function is tested with the parser which does not exist.
+
+    Args:
+        monkeypatch (Fixture): fixture for patching of module attributes.
+    """
+    monkeypatch.setattr(site_parser, "html_parser", "html.parser")
+    with pytest.raises(SystemExit):
+        site_parser.set_html_parser("not-a-parser")
+    assert site_parser.html_parser == "html.parser"
@@ -0,0 +1,19 @@
+from wallpaper_downloader.watcher import Watcher
+
+
+def test_backoff_after_failed_polls():
+    """
+    Test 'get_delay' method of Watcher class.
+
+    Method is tested with the number of failed polls in a row. The delay
+    must be doubled after every failure and limited by the maximum.
+    """
+    watcher = Watcher(["1920x1080"], interval=60, max_interval=300)
+
+    assert [watcher.get_delay(failures) for failures in range(5)] == [
+        60,
+        120,
+        240,
+        300,
+        300,
+    ]
@@ -0,0 +1,141 @@
+import os
+
+import aiohttp
+import pytest
+
+from wallpaper_downloader import metrics, retry, site_parser
+from wallpaper_downloader.month_check import LastCheck
+from wallpaper_downloader.watcher import Watcher
+
+
+@pytest.mark.asyncio
+async def test_new_month_is_downloaded(
+    fixtures_server,
+    monkeypatch,
+    tmp_path,
+):
+    """
+    Test 'poll' method of Watcher class.
+
+    Method is tested with the month published after the last downloaded
+    month. Wallpapers of the new month must be downloaded and the month
+    must be saved.
+
+    Args:
+        fixtures_server (Fixture): fixture that start the local server
+            with pages from files for tests.
+        monkeypatch (Fixture): fixture for patching of module attributes.
+        tmp_path (Fixture): fixture that return the temporary directory.
+    """
+    async def get_newest_month_year_async(session):
+        return "07-2020"
+
+    monkeypatch.setattr(site_parser, "BASE_URL", fixtures_server.url)
+    monkeypatch.setattr(
+        site_parser,
+        "get_newest_month_year_async",
+        get_newest_month_year_async,
+    )
+    monkeypatch.setattr(metrics, "_metrics", metrics.get_metrics())
+    monkeypatch.setattr(retry, "_retry_policy", retry.get_retry_policy())
+    last_check = LastCheck(str(tmp_path / "last_watch.json"))
+    last_check.save("06-2020")
+    watcher = Watcher(
+        ["1920x1080"],
+        last_check=last_check,
+        downloader_options={"destination_directory_path": str(tmp_path)},
+    )
+
+    async with aiohttp.ClientSession() as session:
+        poll_succeeded = await watcher.poll(session)
+
+    assert poll_succeeded is True
+    assert last_check.load() == "07-2020"
+    assert os.listdir(tmp_path / "july-2020 1920x1080 (with-calendar)")
+
+
+@pytest.mark.asyncio
+async def test_failed_month_is_not_saved(
+    fixtures_server,
+    monkeypatch,
+    tmp_path,
+):
+    """
+    Test 'poll' method of Watcher class.
+
+    Method is tested with the new month whose page is not parsed.
+    The poll must fail, the failed month must be counted and the last
+    downloaded month must not be advanced past it.
+
+    Args:
+        fixtures_server (Fixture): fixture that start the local server
+            with pages from files for tests.
+        monkeypatch (Fixture): fixture for patching of module attributes.
+        tmp_path (Fixture): fixture that return the temporary directory.
+    """
+    async def get_newest_month_year_async(session):
+        return "07-2020"
+
+    async def get_resolutions_wallpapers_urls_async(*args):
+        raise SystemExit(1)
+
+    monkeypatch.setattr(site_parser, "BASE_URL", fixtures_server.url)
+    monkeypatch.setattr(
+        site_parser,
+        "get_newest_month_year_async",
+        get_newest_month_year_async,
+    )
+    monkeypatch.setattr(
+        site_parser,
+        "get_resolutions_wallpapers_urls_async",
+        get_resolutions_wallpapers_urls_async,
+    )
+    monkeypatch.setattr(metrics, "_metrics", metrics.get_metrics())
+    monkeypatch.setattr(retry, "_retry_policy", retry.get_retry_policy())
+    last_check = LastCheck(str(tmp_path / "last_watch.json"))
+    last_check.save("06-2020")
+    watcher = Watcher(
+        ["1920x1080"],
+        last_check=last_check,
+        downloader_options={"destination_directory_path": str(tmp_path)},
+    )
+
+    async with aiohttp.ClientSession() as session:
+        poll_succeeded = await watcher.poll(session)
+
+    assert poll_succeeded is False
+    assert metrics.get_metrics().counters["months_failed_total"] == 1
+    assert last_check.load() == "06-2020"
+
+
+@pytest.mark.asyncio
+async def test_unexpected_error(monkeypatch, tmp_path):
+    """
+    Test 'poll' method of Watcher class.
+
+    Method is tested with the unexpected error while the newest month is
+    checked. The poll must fail without stopping the watcher.
+
+    Args:
+        monkeypatch (Fixture): fixture for patching of module attributes.
+        tmp_path (Fixture): fixture that return the temporary directory.
+    """
+    async def get_newest_month_year_async(session):
+        raise ValueError("time data 'Smarch-2020' does not match format")
+
+    monkeypatch.setattr(
+        site_parser,
+        "get_newest_month_year_async",
+        get_newest_month_year_async,
+    )
+    monkeypatch.setattr(metrics, "_metrics", metrics.get_metrics())
+    monkeypatch.setattr(retry, "_retry_policy", retry.get_retry_policy())
+    last_check = LastCheck(str(tmp_path / "last_watch.json"))
+    last_check.save("06-2020")
+    watcher = Watcher(["1920x1080"], last_check=last_check)
+
+    async with aiohttp.ClientSession() as session:
+        poll_succeeded = await watcher.poll(session)
+
+    assert poll_succeeded is False
+    assert last_check.load() == "06-2020"
@@ -0,0 +1,34 @@
+import pytest
+
+from wallpaper_downloader import metrics, retry, site_parser
+from wallpaper_downloader.month_check import LastCheck
+from wallpaper_downloader.watcher import Watcher
+
+
+@pytest.mark.asyncio
+async def test_polls_without_new_month(fixtures_server, monkeypatch, tmp_path):
+    """
+    Test 'run' method of Watcher class.
+
+    Method is tested with two polls when the newest month is already
+    downloaded. Only the category page must be requested and the
+    connection must be reused by both polls.
+
+    Args:
+        fixtures_server (Fixture): fixture that start the local server
+            with pages from files for tests.
+        monkeypatch (Fixture): fixture for patching of module attributes.
+        tmp_path (Fixture): fixture that return the temporary directory.
+    """
+    monkeypatch.setattr(site_parser, "BASE_URL", fixtures_server.url)
+    monkeypatch.setattr(metrics, "_metrics", metrics.get_metrics())
+    monkeypatch.setattr(retry, "_retry_policy", retry.get_retry_policy())
+    last_check = LastCheck(str(tmp_path / "last_watch.json"))
+    last_check.save("08-2020")
+    watcher = Watcher(["1920x1080"], interval=0, last_check=last_check)
+
+    await watcher.run(polls_count=2)
+
+    assert fixtures_server.requested_paths == ["/category/wallpapers/"] * 2
+    assert len(fixtures_server.clients_ports) == 1
+    assert last_check.load() == "08-2020"
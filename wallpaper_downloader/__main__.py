@@ -0,0 +1,3 @@
+from wallpaper_downloader.cli import cli
+
+cli()
@@ -0,0 +1,66 @@
+import os
+import tempfile
+from typing import Union
+
+
+def get_cache_directory_path() -> str:
+    """
+    Get the directory where the application keeps cached data.
+
+    '$XDG_CACHE_HOME/wallpaper-downloader' is used if XDG_CACHE_HOME
+    is defined, otherwise '~/.cache/wallpaper-downloader'.
+
+    Returns:
+        str: absolute path of the directory.
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"),
+        ".cache",
+    )
+    return os.path.join(os.path.abspath(cache_home), "wallpaper-downloader")
+
+
+def get_cache_path(name: str) -> str:
+    """
+    Get the path of the file or the directory in the cache directory.
+
+    Args:
+        name (str): name of the file or the directory.
+
+    Returns:
+        str: absolute path.
+    """
+    return os.path.join(get_cache_directory_path(), name)
+
+
+def write_file_atomically(file_path: str, data: Union[str, bytes]) -> None:
+    """
+    Write the file atomically.
+
+    The data is written to the temporary file in the directory of the file
+    which then replaces the file, so readers never see a partial file.
+    The temporary file is removed if writing fails.
+
+    Args:
+        file_path (str): path of the file.
+        data (Union[str, bytes]): content of the file.
+
+    Raises:
+        OSError: if the file can't be written.
+    """
+    tmp_file = tempfile.NamedTemporaryFile(
+        "wb" if isinstance(data, bytes) else "w",
+        dir=os.path.dirname(os.path.abspath(file_path)),
+        suffix=".tmp",
+        delete=False,
+    )
+    try:
+        with tmp_file:
+            tmp_file.write(data)
+        os.replace(tmp_file.name, file_path)
+    except BaseException:
+        try:
+            os.remove(tmp_file.name)
+        except OSError:
+            pass
+        raise
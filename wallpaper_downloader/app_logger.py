@@ -28,5 +28,6 @@ def get_logger(name: str) -> logging.Logger:
     """
     logger = logging.getLogger(name)
     logger.setLevel(logging.INFO)
-    logger.addHandler(_get_stream_handler())
+    if not logger.handlers:
+        logger.addHandler(_get_stream_handler())
     return logger
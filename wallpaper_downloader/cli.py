@@ -0,0 +1,499 @@
+import cProfile
+import sys
+
+import click
+
+from wallpaper_downloader.manifest import VERIFY_MODES
+
+# Modules with heavy dependencies (aiohttp, bs4, requests) are imported
+# by commands, so the start of the CLI and '--help' stay fast.
+
+
+@click.group()
+def cli() -> None:
+    """CLI for download wallpapers from 'smashingmagazine.com'."""
+
+
+@cli.command()
+@click.option(
+    "--month-year",
+    type=str,
+    multiple=True,
+    help="Month and year of downloadable wallpapers, can be repeated",
+)
+@click.option(
+    "--from",
+    "from_month_year",
+    type=str,
+    help="The first month of the range of downloadable wallpapers",
+)
+@click.option(
+    "--to",
+    "to_month_year",
+    type=str,
+    help="The last month of the range of downloadable wallpapers",
+)
+@click.option(
+    "--resolution",
+    type=str,
+    multiple=True,
+    default=["1920x1080"],
+    show_default=True,
+    help="Resolution of downloadable wallpapers, can be repeated",
+)
+@click.option(
+    "--dest_path",
+    type=str,
+    default="smashingmagazine",
+    show_default=True,
+    help="Destination path for downloadable wallpapers",
+)
+@click.option(
+    "--chunk-size",
+    type=int,
+    default=64 * 1024,
+    show_default=True,
+    help="Size in bytes of chunks in which wallpapers are written",
+)
+@click.option(
+    "--io-workers",
+    type=int,
+    default=4,
+    show_default=True,
+    help="Number of threads for writing wallpapers on the disk",
+)
+@click.option(
+    "--min-concurrency",
+    type=int,
+    default=1,
+    show_default=True,
+    help="Minimum number of concurrent downloads",
+)
+@click.option(
+    "--max-concurrency",
+    type=int,
+    default=32,
+    show_default=True,
+    help="Maximum number of concurrent downloads",
+)
+@click.option(
+    "--max-in-flight",
+    type=int,
+    default=64,
+    show_default=True,
+    help="Maximum size of wallpapers downloaded at the same time in MiB",
+)
+@click.option(
+    "--html-rate",
+    type=float,
+    default=2.0,
+    show_default=True,
+    help="Maximum HTML requests per second to one host, 0 disables",
+)
+@click.option(
+    "--image-rate",
+    type=float,
+    default=10.0,
+    show_default=True,
+    help="Maximum image requests per second to one host, 0 disables",
+)
+@click.option(
+    "--rate-burst",
+    type=int,
+    default=4,
+    show_default=True,
+    help="Number of requests of one kind sent to one host in a burst",
+)
+@click.option(
+    "--retries",
+    type=int,
+    default=3,
+    show_default=True,
+    help="Maximum number of retries of one request",
+)
+@click.option(
+    "--retry-budget",
+    type=int,
+    default=50,
+    show_default=True,
+    help="Maximum number of retries in the run",
+)
+@click.option(
+    "--metrics-file",
+    type=str,
+    default=None,
+    help="Prometheus textfile where metrics of the run are written",
+)
+@click.option(
+    "--profile",
+    is_flag=True,
+    default=False,
+    help="Log wall and CPU time of every phase of the run",
+)
+@click.option(
+    "--profile-output",
+    type=str,
+    default=None,
+    help="File where cProfile statistics of the run are written",
+)
+@click.option(
+    "--html-parser",
+    type=click.Choice(["lxml", "html.parser", "html5lib"]),
+    default=None,
+    help="Parser of HTML pages  [default: lxml if installed]",
+)
+@click.option(
+    "--restricted-parsing",
+    is_flag=True,
+    help="Parse only tags with wallpapers and links from HTML pages",
+)
+@click.option(
+    "--month-index/--no-month-index",
+    default=True,
+    show_default=True,
+    help="Keep URLs of wallpapers pages in the cache directory",
+)
+@click.option(
+    "--page-search",
+    type=click.Choice(["jump", "linear"]),
+    default="jump",
+    show_default=True,
+    help="Estimate the number of the category page or follow pages",
+)
+@click.option(
+    "--page-search-window",
+    type=int,
+    default=3,
+    show_default=True,
+    help="Number of category pages requested concurrently",
+)
+@click.option(
+    "--http-cache/--no-http-cache",
+    default=True,
+    show_default=True,
+    help="Keep HTML pages in the cache directory and revalidate them",
+)
+@click.option(
+    "--http-cache-size",
+    type=int,
+    default=50,
+    show_default=True,
+    help="Maximum size of the cache of HTML pages in MiB",
+)
+@click.option(
+    "--dedup",
+    is_flag=True,
+    default=False,
+    help="Keep identical wallpapers once and link them to directories",
+)
+@click.option(
+    "--verify",
+    type=click.Choice(VERIFY_MODES),
+    default="quick",
+    show_default=True,
+    help="Check of downloaded wallpapers: by size, by hash and ETag or none",
+)
+def download(
+    month_year,
+    from_month_year,
+    to_month_year,
+    resolution,
+    dest_path,
+    chunk_size,
+    io_workers,
+    min_concurrency,
+    max_concurrency,
+    max_in_flight,
+    html_rate,
+    image_rate,
+    rate_burst,
+    retries,
+    retry_budget,
+    metrics_file,
+    profile,
+    profile_output,
+    html_parser,
+    restricted_parsing,
+    month_index,
+    page_search,
+    page_search_window,
+    http_cache,
+    http_cache_size,
+    dedup,
+    verify,
+) -> None:
+    """Download wallpapers of months in resolutions."""
+    from wallpaper_downloader import (
+        profiler,
+        rate_limiter,
+        retry,
+        site_parser,
+    )
+    from wallpaper_downloader.downloader import WallpaperDownloader
+    from wallpaper_downloader.http_cache import PageCache
+    from wallpaper_downloader.month_index import MonthIndex
+
+    months_years = list(month_year)
+    if from_month_year or to_month_year:
+        if not (from_month_year and to_month_year):
+            raise click.UsageError(
+                "Options '--from' and '--to' must be used together.",
+            )
+        months_years.extend(
+            site_parser.get_months_years(from_month_year, to_month_year),
+        )
+    if not months_years:
+        raise click.UsageError(
+            "Option '--month-year' or '--from' and '--to' is required.",
+        )
+    months_years = list(dict.fromkeys(months_years))
+    rate_limiter.set_rate_limiter(
+        rate_limiter.RateLimiter(html_rate, image_rate, rate_burst),
+    )
+    retry.set_retry_policy(
+        retry.RetryPolicy(max_attempts=retries + 1, budget=retry_budget),
+    )
+    site_parser.set_html_parser(html_parser, restricted_parsing)
+    site_parser.set_page_search(page_search, page_search_window)
+    if http_cache:
+        site_parser.set_page_cache(
+            PageCache(max_size=http_cache_size * 1024 * 1024),
+        )
+    if month_index:
+        site_parser.set_month_index(MonthIndex())
+    downloader = WallpaperDownloader(
+        months_years,
+        list(dict.fromkeys(resolution)),
+        dest_path,
+        chunk_size,
+        io_workers,
+        verify,
+        min_concurrency,
+        max_concurrency,
+        max_in_flight * 1024 * 1024,
+        metrics_file,
+        dedup,
+    )
+    if profile:
+        profiler.set_profiler(profiler.Profiler())
+    if profile_output is None:
+        downloader.download_wallpapers()
+        return
+    run_profile = cProfile.Profile()
+    try:
+        run_profile.runcall(downloader.download_wallpapers)
+    finally:
+        run_profile.dump_stats(profile_output)
+
+
+@cli.command()
+@click.option(
+    "--since",
+    type=str,
+    default=None,
+    help="Month compared with the newest month instead of the last check",
+)
+@click.option(
+    "--state-file",
+    type=str,
+    default=None,
+    help="File of the newest month found by the last check  "
+    "[default: last_check.json in the cache directory]",
+)
+@click.option(
+    "--retries",
+    type=int,
+    default=3,
+    show_default=True,
+    help="Maximum number of retries of the request",
+)
+@click.option(
+    "--http-cache/--no-http-cache",
+    default=True,
+    show_default=True,
+    help="Revalidate the cached category page instead of downloading it",
+)
+def check(since, state_file, retries, http_cache) -> None:
+    """
+    Check that wallpapers of a new month are published.
+
+    The newest month is printed. Exit code is 10 if it is newer than
+    the month of '--since' or of the last check, 0 if it is not and 1
+    if the check failed.
+    """
+    from wallpaper_downloader import month_check, retry, site_parser
+    from wallpaper_downloader.http_cache import PageCache
+
+    retry.set_retry_policy(retry.RetryPolicy(max_attempts=retries + 1))
+    if http_cache:
+        site_parser.set_page_cache(PageCache())
+    try:
+        if since is not None:
+            site_parser.format_month_year(since)
+        newest_month_year = site_parser.get_newest_month_year()
+    except SystemExit:
+        sys.exit(month_check.EXIT_ERROR)
+
+    click.echo(newest_month_year)
+    if since is None:
+        last_check = month_check.LastCheck(state_file)
+        since = last_check.load()
+        last_check.save(newest_month_year)
+    if month_check.is_new_month_year(newest_month_year, since):
+        sys.exit(month_check.EXIT_NEW_MONTH)
+
+
+@cli.command()
+@click.option(
+    "--resolution",
+    type=str,
+    multiple=True,
+    default=["1920x1080"],
+    show_default=True,
+    help="Resolution of downloadable wallpapers, can be repeated",
+)
+@click.option(
+    "--dest_path",
+    type=str,
+    default="smashingmagazine",
+    show_default=True,
+    help="Destination path for downloadable wallpapers",
+)
+@click.option(
+    "--interval",
+    type=float,
+    default=3600.0,
+    show_default=True,
+    help="Seconds between polls of the site",
+)
+@click.option(
+    "--max-interval",
+    type=float,
+    default=86400.0,
+    show_default=True,
+    help="Maximum seconds between polls after failed polls",
+)
+@click.option(
+    "--state-file",
+    type=str,
+    default=None,
+    help="File of the newest downloaded month  "
+    "[default: last_watch.json in the cache directory]",
+)
+@click.option(
+    "--max-concurrency",
+    type=int,
+    default=32,
+    show_default=True,
+    help="Maximum number of concurrent downloads",
+)
+@click.option(
+    "--html-rate",
+    type=float,
+    default=2.0,
+    show_default=True,
+    help="Maximum HTML requests per second to one host, 0 disables",
+)
+@click.option(
+    "--image-rate",
+    type=float,
+    default=10.0,
+    show_default=True,
+    help="Maximum image requests per second to one host, 0 disables",
+)
+@click.option(
+    "--retries",
+    type=int,
+    default=3,
+    show_default=True,
+    help="Maximum number of retries of one request",
+)
+@click.option(
+    "--retry-budget",
+    type=int,
+    default=50,
+    show_default=True,
+    help="Maximum number of retries in one poll",
+)
+@click.option(
+    "--metrics-file",
+    type=str,
+    default=None,
+    help="Prometheus textfile where metrics of the last poll are written",
+)
+@click.option(
+    "--http-cache/--no-http-cache",
+    default=True,
+    show_default=True,
+    help="Keep HTML pages in the cache directory and revalidate them",
+)
+@click.option(
+    "--dedup",
+    is_flag=True,
+    default=False,
+    help="Keep identical wallpapers once and link them to directories",
+)
+@click.option(
+    "--verify",
+    type=click.Choice(VERIFY_MODES),
+    default="quick",
+    show_default=True,
+    help="Check of downloaded wallpapers: by size, by hash and ETag or none",
+)
+def watch(
+    resolution,
+    dest_path,
+    interval,
+    max_interval,
+    state_file,
+    max_concurrency,
+    html_rate,
+    image_rate,
+    retries,
+    retry_budget,
+    metrics_file,
+    http_cache,
+    dedup,
+    verify,
+) -> None:
+    """
+    Poll the site and download wallpapers of new months.
+
+    The newest downloaded month is kept in the state file, so only months
+    published after it are downloaded.
+    """
+    from wallpaper_downloader import rate_limiter, site_parser
+    from wallpaper_downloader.http_cache import PageCache
+    from wallpaper_downloader.month_check import LastCheck
+    from wallpaper_downloader.month_index import MonthIndex
+    from wallpaper_downloader.watcher import Watcher
+
+    rate_limiter.set_rate_limiter(
+        rate_limiter.RateLimiter(html_rate, image_rate),
+    )
+    if http_cache:
+        site_parser.set_page_cache(PageCache())
+    site_parser.set_month_index(MonthIndex())
+    watcher = Watcher(
+        list(dict.fromkeys(resolution)),
+        interval,
+        max_interval,
+        retries,
+        retry_budget,
+        LastCheck(state_file) if state_file else None,
+        {
+            "destination_directory_path": dest_path,
+            "verify": verify,
+            "max_concurrency": max_concurrency,
+            "metrics_path": metrics_file,
+            "dedup": dedup,
+        },
+    )
+    try:
+        watcher.watch()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    cli()
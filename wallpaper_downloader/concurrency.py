@@ -0,0 +1,230 @@
+import asyncio
+from typing import Union
+
+from wallpaper_downloader import app_logger
+
+logger = app_logger.get_logger(__name__)
+
+# Statuses with which the server asks to slow down.
+OVERLOAD_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+def is_overload_status(status: int) -> bool:
+    """
+    Check that the status of the response means overload of the server.
+
+    Args:
+        status (int): status of the response.
+
+    Returns:
+        bool: True if the number of concurrent requests should be reduced.
+    """
+    return status in OVERLOAD_STATUSES
+
+
+class _LoopCondition:
+    """
+    asyncio.Condition created in the running event loop.
+
+    Before Python 3.10 the condition is bound to the loop which is current
+    when it is created, so the condition can't be created in '__init__'
+    of objects which are made before 'asyncio.run'. A new condition is
+    created when the object is used in another event loop.
+    """
+
+    def __init__(self) -> None:
+        """Initialize without the condition."""
+        self._condition = None
+        self._loop = None
+
+    def get(self) -> asyncio.Condition:
+        """
+        Get the condition of the running event loop.
+
+        Returns:
+            asyncio.Condition: the condition.
+        """
+        loop = asyncio.get_running_loop()
+        if self._condition is None or self._loop is not loop:
+            self._condition = asyncio.Condition()
+            self._loop = loop
+        return self._condition
+
+
+class AdaptiveConcurrency:
+    """
+    Limit of concurrent downloads tuned at runtime (AIMD).
+
+    Every successful download increases the limit by '1 / limit', so the
+    limit grows by one after a whole window of downloads. A failed
+    download or the overload status halves the limit once per window:
+    failures of downloads started before the last decrease are ignored.
+    Downloads whose response time is much longer than the best observed
+    one don't increase the limit, so the limit stops growing when the
+    link is saturated.
+    """
+
+    def __init__(
+        self,
+        min_limit: int = 1,
+        max_limit: int = 32,
+        initial_limit: int = 4,
+        latency_tolerance: float = 2.0,
+    ) -> None:
+        """
+        Initialize the limit.
+
+        Args:
+            min_limit (int, optional): minimum number of concurrent
+                downloads. Defaults to 1.
+            max_limit (int, optional): maximum number of concurrent
+                downloads. Defaults to 32.
+            initial_limit (int, optional): number of concurrent downloads
+                at the start. Defaults to 4.
+            latency_tolerance (float, optional): how many times the response
+                time can exceed the best one without stopping the growth.
+                Defaults to 2.0.
+        """
+        self.min_limit = max(min_limit, 1)
+        self.max_limit = max(max_limit, self.min_limit)
+        self.limit = float(
+            min(max(initial_limit, self.min_limit), self.max_limit),
+        )
+        self.latency_tolerance = latency_tolerance
+        self.in_flight = 0
+        self.peak_limit = int(self.limit)
+        self.min_response_time = None
+        self._generation = 0
+        self._condition = _LoopCondition()
+
+    @property
+    def current(self) -> int:
+        """
+        Get the current number of allowed concurrent downloads.
+
+        Returns:
+            int: the limit rounded down.
+        """
+        return int(self.limit)
+
+    async def acquire(self) -> int:
+        """
+        Wait until the download can be started.
+
+        Returns:
+            int: token which must be passed to 'release'.
+        """
+        condition = self._condition.get()
+        async with condition:
+            await condition.wait_for(
+                lambda: self.in_flight < self.current,
+            )
+            self.in_flight += 1
+            return self._generation
+
+    async def release(
+        self,
+        token: int,
+        response_time: Union[float, None],
+    ) -> None:
+        """
+        Finish the download and adjust the limit with its result.
+
+        Args:
+            token (int): token returned by 'acquire'.
+            response_time (Union[float, None]): seconds until headers of
+                the response were received or 'None' if the download failed.
+        """
+        condition = self._condition.get()
+        async with condition:
+            self.in_flight -= 1
+            previous_limit = self.current
+            if response_time is None:
+                self._decrease(token)
+            else:
+                self._increase(response_time)
+            if self.current != previous_limit:
+                logger.info(f"Concurrency of downloads is {self.current}.")
+            condition.notify_all()
+
+    def _increase(self, response_time: float) -> None:
+        """
+        Increase the limit after the successful download.
+
+        Args:
+            response_time (float): seconds until headers were received.
+        """
+        if (
+            self.min_response_time is None or
+            response_time < self.min_response_time
+        ):
+            self.min_response_time = response_time
+        if response_time > self.min_response_time * self.latency_tolerance:
+            return
+        self.limit = min(self.limit + 1 / self.limit, self.max_limit)
+        self.peak_limit = max(self.peak_limit, self.current)
+
+    def _decrease(self, token: int) -> None:
+        """
+        Halve the limit after the failed download.
+
+        Args:
+            token (int): token of the failed download.
+        """
+        if token != self._generation:
+            return
+        self._generation += 1
+        self.limit = max(self.limit / 2, self.min_limit)
+
+
+class ByteBudget:
+    """
+    Semaphore of bytes of bodies which are downloaded at the same time.
+
+    Every download reserves the size of its body from 'Content-Length'
+    before the body is read. A body bigger than the whole budget is
+    allowed only when nothing else is downloaded.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024) -> None:
+        """
+        Initialize the budget.
+
+        Args:
+            max_bytes (int, optional): maximum number of bytes of bodies
+                downloaded at the same time. Defaults to 64 MiB.
+        """
+        self.max_bytes = max_bytes
+        self.in_flight_bytes = 0
+        self._condition = _LoopCondition()
+
+    async def acquire(self, size: int) -> int:
+        """
+        Wait until the body of the size fits in the budget.
+
+        Args:
+            size (int): size of the body in bytes.
+
+        Returns:
+            int: reserved number of bytes which must be passed to 'release'.
+        """
+        size = min(max(size, 0), self.max_bytes)
+        condition = self._condition.get()
+        async with condition:
+            await condition.wait_for(
+                lambda: self.in_flight_bytes + size <= self.max_bytes,
+            )
+            self.in_flight_bytes += size
+            return size
+
+    async def release(self, size: int) -> None:
+        """
+        Return bytes of the downloaded body to the budget.
+
+        Args:
+            size (int): number of bytes returned by 'acquire'.
+        """
+        condition = self._condition.get()
+        async with condition:
+            self.in_flight_bytes -= size
+            condition.notify_all()
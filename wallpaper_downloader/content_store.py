@@ -0,0 +1,182 @@
+import json
+import os
+import shutil
+import threading
+from typing import Union
+
+from wallpaper_downloader import app_cache, app_logger
+
+logger = app_logger.get_logger(__name__)
+
+
+class ContentStore:
+    """
+    Content-addressed store of wallpapers in the destination directory.
+
+    Every distinct content is kept once in 'objects/' under its SHA-256,
+    wallpapers in directories of months are hardlinks to these objects.
+    If the filesystem does not support hardlinks, the object is copied.
+    The index maps URLs of wallpapers to hashes of their content, so
+    the wallpaper with the known URL is linked without downloading.
+    """
+
+    directory_name = ".wallpapers-store"
+
+    def __init__(self, directory_path: str) -> None:
+        """
+        Initialize the store. The file of the index is read lazily.
+
+        Args:
+            directory_path (str): absolute path of the destination directory.
+        """
+        self.store_path = os.path.join(directory_path, self.directory_name)
+        self.objects_path = os.path.join(self.store_path, "objects")
+        self.index_path = os.path.join(self.store_path, "index.json")
+        self._urls_hashes = None
+        self._lock = threading.Lock()
+
+    @property
+    def urls_hashes(self) -> dict:
+        """
+        Get hashes of contents of wallpapers by their URLs.
+
+        Returns:
+            dict: hashes in '{wallpaper_url: sha256}' format.
+        """
+        if self._urls_hashes is None:
+            self._urls_hashes = self._load()
+        return self._urls_hashes
+
+    def _load(self) -> dict:
+        """
+        Read the index from the file.
+
+        Broken or missing file gives the empty index.
+
+        Returns:
+            dict: hashes in '{wallpaper_url: sha256}' format.
+        """
+        try:
+            with open(self.index_path) as index_file:
+                urls_hashes = json.load(index_file)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError):
+            logger.warning(
+                f"Index of the store '{self.index_path}' is broken "
+                "and is ignored.",
+            )
+            return {}
+        return urls_hashes if isinstance(urls_hashes, dict) else {}
+
+    def _get_object_path(self, sha256: str) -> str:
+        """
+        Get the path of the object with the content.
+
+        Args:
+            sha256 (str): SHA-256 of the content.
+
+        Returns:
+            str: absolute path of the object.
+        """
+        return os.path.join(self.objects_path, sha256[:2], sha256)
+
+    def _link(self, source_path: str, target_path: str) -> None:
+        """
+        Replace the target file with the hardlink to the source file.
+
+        Args:
+            source_path (str): absolute path of the existing file.
+            target_path (str): absolute path of the link.
+        """
+        if os.path.exists(target_path) and os.path.samefile(
+            source_path,
+            target_path,
+        ):
+            return
+        os.makedirs(os.path.dirname(target_path), exist_ok=True)
+        tmp_path = f"{target_path}.link.tmp"
+        try:
+            os.link(source_path, tmp_path)
+        except FileExistsError:
+            os.remove(tmp_path)
+            os.link(source_path, tmp_path)
+        except OSError:
+            shutil.copyfile(source_path, tmp_path)
+        os.replace(tmp_path, target_path)
+
+    def add(
+        self,
+        wallpaper_path: str,
+        wallpaper_url: str,
+        sha256: str,
+    ) -> bool:
+        """
+        Add the downloaded wallpaper to the store.
+
+        If the content is already stored, the wallpaper is replaced with
+        the link to the stored object.
+
+        Args:
+            wallpaper_path (str): absolute path of the wallpaper.
+            wallpaper_url (str): URL of the wallpaper.
+            sha256 (str): SHA-256 of the content of the wallpaper.
+
+        Returns:
+            bool: True if the content was already stored.
+        """
+        object_path = self._get_object_path(sha256)
+        with self._lock:
+            self.urls_hashes[wallpaper_url] = sha256
+            try:
+                if os.path.exists(object_path):
+                    self._link(object_path, wallpaper_path)
+                    return True
+                self._link(wallpaper_path, object_path)
+            except OSError:
+                logger.warning(
+                    f"Can't add '{wallpaper_path}' to the store.",
+                )
+        return False
+
+    def link(
+        self,
+        wallpaper_url: str,
+        wallpaper_path: str,
+    ) -> Union[str, None]:
+        """
+        Link the stored content of the URL to the wallpaper path.
+
+        Args:
+            wallpaper_url (str): URL of the wallpaper.
+            wallpaper_path (str): absolute path of the wallpaper.
+
+        Returns:
+            Union[str, None]: SHA-256 of the linked content or 'None'
+                if the content of the URL is not stored.
+        """
+        with self._lock:
+            sha256 = self.urls_hashes.get(wallpaper_url)
+            if sha256 is None:
+                return None
+            object_path = self._get_object_path(sha256)
+            try:
+                self._link(object_path, wallpaper_path)
+            except OSError:
+                return None
+        return sha256
+
+    def save(self) -> None:
+        """Write the index to the file atomically."""
+        if self._urls_hashes is None:
+            return
+        try:
+            os.makedirs(self.store_path, exist_ok=True)
+            app_cache.write_file_atomically(
+                self.index_path,
+                json.dumps(self._urls_hashes, indent=2, sort_keys=True),
+            )
+        except OSError:
+            logger.warning(
+                f"Can't save index of the store to '{self.index_path}'.",
+            )
@@ -1,10 +1,34 @@
 import asyncio
 import os
+import re
+import time
+from typing import Union
 
 import aiohttp
-import click
 
-from wallpaper_downloader import app_logger, site_parser
+from wallpaper_downloader import (
+    app_logger,
+    metrics,
+    profiler,
+    rate_limiter,
+    retry,
+    site_parser,
+)
+from wallpaper_downloader.concurrency import (
+    AdaptiveConcurrency,
+    ByteBudget,
+    is_overload_status,
+)
+from wallpaper_downloader.content_store import ContentStore
+from wallpaper_downloader.io_executor import IOExecutor
+from wallpaper_downloader.manifest import Manifest
+from wallpaper_downloader.partial_download import PartialDownload
+
+RESPONSE_STATUS_OK = 200
+RESPONSE_STATUS_PARTIAL_CONTENT = 206
+RESPONSE_STATUS_NOT_MODIFIED = 304
+RESPONSE_STATUS_RANGE_NOT_SATISFIABLE = 416
+CONTENT_RANGE_PATTERN = re.compile(r"bytes (\d+)-\d+/(?:\d+|\*)")
 
 
 class WallpaperDownloader:
@@ -12,59 +36,135 @@ class WallpaperDownloader:
 
     def __init__(
         self,
-        month_year: str,
-        resolution: str = '1920x1080',
+        month_year: Union[str, list],
+        resolution: Union[str, list] = '1920x1080',
         destination_directory_path: str = "smashingmagazine",
+        chunk_size: int = 64 * 1024,
+        io_workers: int = 4,
+        verify: str = "quick",
+        min_concurrency: int = 1,
+        max_concurrency: int = 32,
+        max_in_flight_bytes: int = 64 * 1024 * 1024,
+        metrics_path: str = None,
+        dedup: bool = False,
     ) -> None:
         """
         Initialize attributes of the class and the console logger.
 
         Args:
-            month_year (str): month and year of downloadable wallpapers
-                in format 'mm-yyyy'.
-            resolution (str, optional): resolution of downloadable wallpapers.
+            month_year (Union[str, list]): month and year of downloadable
+                wallpapers in format 'mm-yyyy' or the list of them.
+            resolution (Union[str, list], optional): resolution of
+                downloadable wallpapers or the list of them.
                 Defaults to '1920x1080'.
             destination_directory_path (str, optional): the directory where
                 wallpapers will be downloaded.
                 Defaults to './smashingmagazine'.
+            chunk_size (int, optional): size in bytes of the chunks in which
+                wallpapers are streamed to the disk.
+                Defaults to 65536.
+            io_workers (int, optional): number of threads which perform
+                filesystem operations outside of the event loop.
+                Defaults to 4.
+            verify (str, optional): how wallpapers downloaded by previous
+                runs are checked before they are skipped. 'quick' compares
+                the size with the manifest without requests, 'full' also
+                compares the hash of the content and revalidates wallpapers
+                recorded with ETag by conditional requests, 'none'
+                downloads all wallpapers again. Defaults to 'quick'.
+            min_concurrency (int, optional): minimum number of concurrent
+                downloads. Defaults to 1.
+            max_concurrency (int, optional): maximum number of concurrent
+                downloads and of download workers. Defaults to 32.
+            max_in_flight_bytes (int, optional): maximum number of bytes of
+                wallpapers downloaded at the same time. Defaults to 64 MiB.
+            metrics_path (str, optional): path of the Prometheus textfile
+                where metrics of the run are written. Defaults to None.
+            dedup (bool, optional): keep identical wallpapers once in
+                the content store and link them to directories of months.
+                Defaults to False.
         """
-        self.month_year = month_year
-        self.resolution = resolution
+        if isinstance(month_year, str):
+            month_year = [month_year]
+        self.months_years = list(month_year)
+        self.month_year = self.months_years[0]
+        if isinstance(resolution, str):
+            resolution = [resolution]
+        self.resolutions = list(resolution)
+        self.resolution = self.resolutions[0]
         self.destination_directory_path = os.path.abspath(
             destination_directory_path,
         )
+        self.chunk_size = chunk_size
+        self.io_executor = IOExecutor(io_workers)
+        self.verify = verify
+        self.manifest = Manifest(self.destination_directory_path)
+        self.content_store = None
+        if dedup:
+            self.content_store = ContentStore(self.destination_directory_path)
+        self.concurrency = AdaptiveConcurrency(
+            min_concurrency,
+            max_concurrency,
+        )
+        self.byte_budget = ByteBudget(max_in_flight_bytes)
+        self.metrics_path = metrics_path
         self.logger = app_logger.get_logger(__name__)
 
-    def _get_directory_path(self, with_calendar: bool) -> str:
+    def _get_directory_path(
+        self,
+        with_calendar: bool,
+        month_year: str = None,
+        resolution: str = None,
+    ) -> str:
         """
         Get the path to the directory where wallpapers will be downloaded.
 
         Args:
             with_calendar (bool): defines the name of the directory.
+            month_year (str, optional): month and year of wallpapers in
+                format 'mm-yyyy'. Defaults to the first month.
+            resolution (str, optional): resolution of wallpapers.
+                Defaults to the first resolution.
 
         Returns:
             str: absolute path of directory.
         """
         with_without = "with" if with_calendar else "without"
-        month, year = site_parser.format_month_year(self.month_year)
+        month, year = site_parser.format_month_year(
+            month_year or self.month_year,
+        )
         return os.path.join(
             self.destination_directory_path,
-            f"{month}-{year} ({with_without}-calendar)",
+            f"{month}-{year} {resolution or self.resolution} "
+            f"({with_without}-calendar)",
         )
 
-    def _get_wallpaper_path(self, wallpaper_name: str) -> str:
+    def _get_wallpaper_path(
+        self,
+        wallpaper_name: str,
+        month_year: str = None,
+        resolution: str = None,
+    ) -> str:
         """
         Get the absolute path where the wallpaper will be created.
 
         Args:
             wallpaper_name (str): wallpaper name.
+            month_year (str, optional): month and year of the wallpaper in
+                format 'mm-yyyy'. Defaults to the first month.
+            resolution (str, optional): resolution of the wallpaper.
+                Defaults to the first resolution.
 
         Returns:
             str: absolute wallpaper path.
         """
         wallpaper_with_calendar = "-cal-" in wallpaper_name
         return os.path.join(
-            self._get_directory_path(wallpaper_with_calendar),
+            self._get_directory_path(
+                wallpaper_with_calendar,
+                month_year,
+                resolution,
+            ),
             wallpaper_name,
         )
 
@@ -98,34 +198,164 @@ class WallpaperDownloader:
             )
             raise SystemExit
 
-    def _create_directories(self) -> None:
-        """Create directories where wallpapers will be downloaded."""
-        directory_to_wallpapers_with_calendar = self._get_directory_path(
-            with_calendar=True,
-        )
-        directory_to_wallpapers_without_calendar = self._get_directory_path(
-            with_calendar=False,
-        )
-        directories_paths = (
-            self.destination_directory_path,
-            directory_to_wallpapers_with_calendar,
-            directory_to_wallpapers_without_calendar,
-        )
+    def _create_directories(self, months_resolutions: list = None) -> None:
+        """
+        Create directories where wallpapers will be downloaded.
+
+        Args:
+            months_resolutions (list, optional): pairs of month and year
+                in format 'mm-yyyy' and resolution of wallpapers.
+                Defaults to all months in all resolutions.
+        """
+        if months_resolutions is None:
+            months_resolutions = [
+                (month_year, resolution)
+                for month_year in self.months_years
+                for resolution in self.resolutions
+            ]
+        directories_paths = [self.destination_directory_path]
+        for month_year, resolution in months_resolutions:
+            directories_paths.extend((
+                self._get_directory_path(True, month_year, resolution),
+                self._get_directory_path(False, month_year, resolution),
+            ))
 
         for directory_path in directories_paths:
             self._create_directory(directory_path)
 
-    def _write_wallpaper(self, wallpaper_data: bytes, wallpaper_path: str):
+    def _write_chunk(self, wallpaper_file, wallpaper_hash, chunk: bytes):
+        """
+        Write the chunk of the wallpaper in the file and update the hash.
+
+        Args:
+            wallpaper_file: file opened for writing.
+            wallpaper_hash: hash object of the content of the wallpaper.
+            chunk (bytes): chunk of the wallpaper.
+        """
+        wallpaper_file.write(chunk)
+        wallpaper_hash.update(chunk)
+
+    def _is_resumable_response(self, response: aiohttp.ClientResponse) -> bool:
         """
-        Write wallpaper in a file.
+        Check that the rest of the body can be requested after a failure.
 
         Args:
-            wallpaper_data (bytes): the raw wallpaper data.
+            response (aiohttp.ClientResponse): response with the wallpaper.
+
+        Returns:
+            bool: True if the server supports ranges and the response
+                has validators.
+        """
+        if response.status == RESPONSE_STATUS_PARTIAL_CONTENT:
+            return True
+        return (
+            response.headers.get("Accept-Ranges", "").lower() == "bytes" and
+            bool(
+                response.headers.get("ETag") or
+                response.headers.get("Last-Modified"),
+            )
+        )
+
+    def _is_continuation(
+        self,
+        response: aiohttp.ClientResponse,
+        partial_download: PartialDownload,
+    ) -> bool:
+        """
+        Check that the response continues the partial file.
+
+        Args:
+            response (aiohttp.ClientResponse): response with the wallpaper.
+            partial_download (PartialDownload): the partial file.
+
+        Returns:
+            bool: True if the response contains the rest of the body.
+        """
+        if response.status != RESPONSE_STATUS_PARTIAL_CONTENT:
+            return False
+        content_range = CONTENT_RANGE_PATTERN.fullmatch(
+            response.headers.get("Content-Range", ""),
+        )
+        return (
+            content_range is not None and
+            int(content_range.group(1)) == partial_download.size
+        )
+
+    async def _write_wallpaper(
+        self,
+        response: aiohttp.ClientResponse,
+        wallpaper_path: str,
+        partial_download: PartialDownload = None,
+    ) -> tuple:
+        """
+        Stream wallpaper from the response in a file.
+
+        The body is written chunk by chunk to the partial file in the
+        destination directory, which is renamed to the wallpaper path
+        only after the whole body is received. So the memory usage does not
+        depend on the size of the image and a broken download never leaves
+        a truncated wallpaper. If the server supports ranges, the partial
+        file is kept after a failure and the next run resumes it.
+
+        Every filesystem call goes through the I/O executor, so writing
+        of one wallpaper does not stall other downloads.
+
+        Args:
+            response (aiohttp.ClientResponse): response with the wallpaper.
             wallpaper_path (str): the absolute path of the directory where
                 the image will be created.
+            partial_download (PartialDownload, optional): the partial file
+                continued by the response.
+
+        Returns:
+            tuple: size in bytes and SHA-256 of the wallpaper.
         """
-        with open(wallpaper_path, "wb") as wallpaper:
-            wallpaper.write(wallpaper_data)
+        if partial_download is None:
+            partial_download = PartialDownload(wallpaper_path)
+        resume = self._is_continuation(response, partial_download)
+        resumable = self._is_resumable_response(response)
+
+        with profiler.phase("write"):
+            wallpaper_file, wallpaper_hash = await self.io_executor.run(
+                partial_download.open,
+                resume,
+            )
+        wallpaper_size = start_size = partial_download.size
+        try:
+            try:
+                if resumable and not resume:
+                    await self.io_executor.run(
+                        partial_download.mark,
+                        response.headers.get("ETag"),
+                        response.headers.get("Last-Modified"),
+                    )
+                async for chunk in response.content.iter_chunked(
+                    self.chunk_size,
+                ):
+                    with profiler.phase("write"):
+                        await self.io_executor.run(
+                            self._write_chunk,
+                            wallpaper_file,
+                            wallpaper_hash,
+                            chunk,
+                        )
+                    wallpaper_size += len(chunk)
+            finally:
+                await self.io_executor.run(wallpaper_file.close)
+                metrics.get_metrics().increment(
+                    "downloaded_bytes_total",
+                    wallpaper_size - start_size,
+                )
+            with profiler.phase("write"):
+                await self.io_executor.run(
+                    partial_download.complete,
+                    wallpaper_path,
+                )
+        except BaseException:
+            if not resumable:
+                await self.io_executor.run(partial_download.discard)
+            raise
+        return wallpaper_size, wallpaper_hash.hexdigest()
 
     def _is_good_response(self, response: aiohttp.ClientSession) -> bool:
         """
@@ -138,11 +368,12 @@ class WallpaperDownloader:
         Returns:
             bool: True if response is good.
         """
-        content_type = response.headers.get('Content-Type').lower()
-        response_status_ok = 200
+        content_type = response.headers.get("Content-Type", "").lower()
         return (
-            response.status == response_status_ok and
-            content_type is not None and
+            response.status in {
+                RESPONSE_STATUS_OK,
+                RESPONSE_STATUS_PARTIAL_CONTENT,
+            } and
             "image" in content_type
         )
 
@@ -151,98 +382,512 @@ class WallpaperDownloader:
         wallpaper_path: str,
         wallpaper_url: str,
         session: aiohttp.ClientSession,
+        etag: Union[str, None] = None,
     ) -> None:
         """
         Download one wallpaper.
 
+        Temporary failures are retried by the retry policy. The broken
+        download is resumed by the retry if the server supports ranges.
+
         Args:
             wallpaper_path (str): the absolute path of the directory where
                 the image will be created.
             wallpaper_url (str): URL for downloading the image.
+            session (aiohttp.ClientSession): session of the downloader.
+            etag (Union[str, None], optional): ETag of the downloaded
+                wallpaper, which is revalidated. Defaults to None.
         """
-        async with session.get(wallpaper_url) as response:
-            if self._is_good_response(response):
-                wallpaper_data = await response.read()
-                self._write_wallpaper(wallpaper_data, wallpaper_path)
+        retry_policy = retry.get_retry_policy()
+        attempt = 0
+        while True:
+            try:
+                with profiler.phase("download"):
+                    status, retry_after = await self._request_wallpaper(
+                        wallpaper_path,
+                        wallpaper_url,
+                        session,
+                        etag,
+                    )
+            except (aiohttp.ClientError, asyncio.TimeoutError) as error:
+                if not (
+                    retry_policy.is_retryable_error(error) and
+                    retry_policy.should_retry(attempt, wallpaper_url)
+                ):
+                    raise
+                delay = retry_policy.get_delay(attempt)
             else:
-                self.logger.error(
-                    f"Response for '{wallpaper_url}' is wrong. "
-                    "Wallpaper not loaded."
+                if not retry_policy.is_retryable_status(status):
+                    return
+                if not retry_policy.should_retry(attempt, wallpaper_url):
+                    metrics.get_metrics().increment("wallpapers_failed_total")
+                    self.logger.error(
+                        f"Response for '{wallpaper_url}' is wrong. "
+                        "Wallpaper not loaded."
+                    )
+                    return
+                delay = retry_policy.get_delay(attempt, retry_after)
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _request_wallpaper(
+        self,
+        wallpaper_path: str,
+        wallpaper_url: str,
+        session: aiohttp.ClientSession,
+        etag: Union[str, None] = None,
+    ) -> tuple:
+        """
+        Request one wallpaper and save it.
+
+        The request waits for the free slot of the adaptive concurrency
+        and reports its response time or failure to it. The response with
+        the retryable status is not saved. With ETag the request is
+        conditional and the wallpaper not modified on the server is
+        skipped. If the server rejects the range of the partial file,
+        the whole wallpaper is requested once more in the same slot.
+
+        Args:
+            wallpaper_path (str): the absolute path of the directory where
+                the image will be created.
+            wallpaper_url (str): URL for downloading the image.
+            session (aiohttp.ClientSession): session of the downloader.
+            etag (Union[str, None], optional): ETag of the downloaded
+                wallpaper, which is revalidated. Defaults to None.
+
+        Returns:
+            tuple: status of the response and its 'Retry-After' header.
+        """
+        partial_download = PartialDownload(wallpaper_path, wallpaper_url)
+        await self.io_executor.run(partial_download.load)
+
+        request_headers = partial_download.get_range_headers()
+        if etag is not None:
+            request_headers["If-None-Match"] = etag
+
+        concurrency_token = await self.concurrency.acquire()
+        response_time = None
+        try:
+            while True:
+                await rate_limiter.wait_async(
+                    wallpaper_url,
+                    rate_limiter.IMAGE,
                 )
+                request_start_time = time.monotonic()
+                async with session.get(
+                    wallpaper_url,
+                    headers=request_headers,
+                ) as response:
+                    headers_time = time.monotonic() - request_start_time
+                    metrics.get_metrics().observe(
+                        "image_request_seconds",
+                        headers_time,
+                    )
+                    range_rejected = self._is_rejected_range(
+                        response,
+                        request_headers,
+                        partial_download,
+                    )
+                    if range_rejected:
+                        await self.io_executor.run(partial_download.discard)
+                    elif response.status == RESPONSE_STATUS_NOT_MODIFIED:
+                        metrics.get_metrics().increment(
+                            "wallpapers_skipped_total",
+                        )
+                    elif not retry.get_retry_policy().is_retryable_status(
+                        response.status,
+                    ):
+                        await self._save_wallpaper_in_budget(
+                            response,
+                            wallpaper_path,
+                            wallpaper_url,
+                            partial_download,
+                        )
+                    if not (
+                        range_rejected or
+                        is_overload_status(response.status)
+                    ):
+                        response_time = headers_time
+                if not range_rejected:
+                    break
+                request_headers.pop("Range")
+                request_headers.pop("If-Range", None)
+        finally:
+            await self.concurrency.release(concurrency_token, response_time)
+
+        return response.status, response.headers.get("Retry-After")
+
+    def _is_rejected_range(
+        self,
+        response: aiohttp.ClientResponse,
+        request_headers: dict,
+        partial_download: PartialDownload,
+    ) -> bool:
+        """
+        Check that the server did not continue the partial file.
+
+        Args:
+            response (aiohttp.ClientResponse): response of the request.
+            request_headers (dict): headers of the request.
+            partial_download (PartialDownload): the partial file.
 
-    async def _downloader_event_loop(self, wallpapers_urls: dict) -> None:
+        Returns:
+            bool: True if the request had 'Range' header and the response
+                is '416 Range Not Satisfiable' or the part of other content.
         """
-        Event loop for async download wallpapers.
+        if "Range" not in request_headers:
+            return False
+        return (
+            response.status == RESPONSE_STATUS_RANGE_NOT_SATISFIABLE or
+            response.status == RESPONSE_STATUS_PARTIAL_CONTENT and
+            not self._is_continuation(response, partial_download)
+        )
+
+    async def _save_wallpaper_in_budget(
+        self,
+        response: aiohttp.ClientResponse,
+        wallpaper_path: str,
+        wallpaper_url: str,
+        partial_download: PartialDownload,
+    ) -> None:
+        """
+        Save the wallpaper with bytes of its body reserved in the budget.
+
+        Args:
+            response (aiohttp.ClientResponse): response with the wallpaper.
+            wallpaper_path (str): the absolute path of the wallpaper.
+            wallpaper_url (str): URL of the wallpaper.
+            partial_download (PartialDownload): the partial file.
+        """
+        reserved_bytes = await self.byte_budget.acquire(
+            response.content_length or self.chunk_size,
+        )
+        try:
+            await self._save_wallpaper(
+                response,
+                wallpaper_path,
+                wallpaper_url,
+                partial_download,
+            )
+        finally:
+            await self.byte_budget.release(reserved_bytes)
+
+    async def _save_wallpaper(
+        self,
+        response: aiohttp.ClientResponse,
+        wallpaper_path: str,
+        wallpaper_url: str,
+        partial_download: PartialDownload,
+    ) -> None:
+        """
+        Write the wallpaper from the response and add it to the manifest.
+
+        Args:
+            response (aiohttp.ClientResponse): response with the wallpaper.
+            wallpaper_path (str): the absolute path of the wallpaper.
+            wallpaper_url (str): URL of the wallpaper.
+            partial_download (PartialDownload): the partial file.
+        """
+        if self._is_good_response(response):
+            wallpaper_size, wallpaper_sha256 = await self._write_wallpaper(
+                response,
+                wallpaper_path,
+                partial_download,
+            )
+            self.manifest.record(
+                wallpaper_path,
+                wallpaper_url,
+                wallpaper_size,
+                wallpaper_sha256,
+                response.headers.get("ETag", partial_download.etag),
+            )
+            metrics.get_metrics().increment("wallpapers_ok_total")
+            if self.content_store is None:
+                return
+            with profiler.phase("write"):
+                deduplicated = await self.io_executor.run(
+                    self.content_store.add,
+                    wallpaper_path,
+                    wallpaper_url,
+                    wallpaper_sha256,
+                )
+            if deduplicated:
+                metrics.get_metrics().increment(
+                    "wallpapers_deduplicated_total",
+                )
+        else:
+            metrics.get_metrics().increment("wallpapers_failed_total")
+            self.logger.error(
+                f"Response for '{wallpaper_url}' is wrong. "
+                "Wallpaper not loaded."
+            )
+
+    def _link_stored_wallpaper(
+        self,
+        wallpaper_path: str,
+        wallpaper_url: str,
+    ) -> bool:
+        """
+        Link the wallpaper from the content store instead of downloading.
 
         Args:
-            wallpapers_urls (dict): wallpapers urls in
-                '{wallpaper_name: wallpaper_url}' format.
+            wallpaper_path (str): the absolute path of the wallpaper.
+            wallpaper_url (str): URL of the wallpaper.
+
+        Returns:
+            bool: True if the content of the URL is known from previous runs
+                and the wallpaper is linked.
+        """
+        wallpaper_sha256 = self.content_store.link(
+            wallpaper_url,
+            wallpaper_path,
+        )
+        if wallpaper_sha256 is None:
+            return False
+        self.manifest.record(
+            wallpaper_path,
+            wallpaper_url,
+            os.stat(wallpaper_path).st_size,
+            wallpaper_sha256,
+        )
+        return True
+
+    async def _download_worker(
+        self,
+        wallpapers_queue: asyncio.Queue,
+        session: aiohttp.ClientSession,
+    ) -> None:
         """
-        tasks = []
-        connections_limit = 20
-        connector = aiohttp.TCPConnector(limit=connections_limit)
+        Download wallpapers from the queue until 'None' is received.
+
+        Every failure is counted and logged, so one broken wallpaper can't
+        stop the worker and leave the queue without consumers.
 
-        async with aiohttp.ClientSession(connector=connector) as session:
-            for wallpaper_name, wallpaper_url in wallpapers_urls.items():
-                wallpaper_path = self._get_wallpaper_path(wallpaper_name)
-                task = asyncio.create_task(
-                    self._download_wallpaper(
+        Args:
+            wallpapers_queue (asyncio.Queue): queue of wallpapers in
+                '(wallpaper_path, wallpaper_url, etag)' format.
+            session (aiohttp.ClientSession): session of the downloader.
+        """
+        while True:
+            wallpaper = await wallpapers_queue.get()
+            try:
+                if wallpaper is None:
+                    return
+                wallpaper_path, wallpaper_url, etag = wallpaper
+                try:
+                    await self._download_wallpaper(
                         wallpaper_path,
                         wallpaper_url,
                         session,
-                    ),
+                        etag,
+                    )
+                except (aiohttp.ClientError, asyncio.TimeoutError, OSError):
+                    metrics.get_metrics().increment("wallpapers_failed_total")
+                    self.logger.error(
+                        f"Can't download '{wallpaper_url}'. "
+                        "Wallpaper not loaded."
+                    )
+                except Exception:
+                    metrics.get_metrics().increment("wallpapers_failed_total")
+                    self.logger.exception(
+                        f"Unexpected error while downloading "
+                        f"'{wallpaper_url}'. Wallpaper not loaded."
+                    )
+            finally:
+                wallpapers_queue.task_done()
+
+    async def _downloader_event_loop(
+        self,
+        session: aiohttp.ClientSession = None,
+    ) -> None:
+        """
+        Event loop for async parsing of the site and download wallpapers.
+
+        The site parser and the downloader share one session, so
+        connections to the site are reused by all requests. Wallpapers are
+        put in the bounded queue as soon as the page of their month is
+        parsed, so downloading of the first month overlaps with parsing of
+        other months. The queue is consumed by the fixed pool of workers,
+        so the number of tasks does not depend on the number of wallpapers.
+        In 'full' verify mode downloaded wallpapers recorded with ETag are
+        revalidated by the workers instead of being skipped.
+
+        Args:
+            session (aiohttp.ClientSession, optional): session of the caller.
+                Defaults to the new session closed after the download.
+        """
+        workers_count = self.concurrency.max_limit
+        if session is None:
+            connector = aiohttp.TCPConnector(limit=workers_count)
+            async with aiohttp.ClientSession(connector=connector) as session:
+                await self._downloader_event_loop(session)
+            return
+
+        wallpapers_queue = asyncio.Queue(maxsize=workers_count * 2)
+        workers = [
+            asyncio.create_task(
+                self._download_worker(wallpapers_queue, session),
+            )
+            for _ in range(workers_count)
+        ]
+        wallpapers_urls = site_parser.iter_wallpapers_urls_async(
+            self.months_years,
+            self.resolutions,
+            session,
+        )
+        created_directories = set()
+        found_wallpapers_count = 0
+        skipped_wallpapers_count = 0
+        linked_wallpapers_count = 0
+        try:
+            async for (
+                month_year,
+                resolution,
+                wallpaper_name,
+                wallpaper_url,
+            ) in wallpapers_urls:
+                found_wallpapers_count += 1
+                if (month_year, resolution) not in created_directories:
+                    with profiler.phase("directory setup"):
+                        await self.io_executor.run(
+                            self._create_directories,
+                            [(month_year, resolution)],
+                        )
+                    created_directories.add((month_year, resolution))
+                if found_wallpapers_count == 1:
+                    self.logger.info(
+                        "Downloading of wallpapers is started.",
+                    )
+
+                wallpaper_path = self._get_wallpaper_path(
+                    wallpaper_name,
+                    month_year,
+                    resolution,
+                )
+                with profiler.phase("plan"):
+                    downloaded = await self.io_executor.run(
+                        self.manifest.is_valid,
+                        wallpaper_path,
+                        wallpaper_url,
+                        self.verify,
+                    )
+                etag = None
+                if downloaded and self.verify == "full":
+                    etag = self.manifest.get_etag(wallpaper_path)
+                if downloaded and etag is None:
+                    skipped_wallpapers_count += 1
+                    metrics.get_metrics().increment(
+                        "wallpapers_skipped_total",
+                    )
+                    continue
+                if self.content_store is not None and etag is None:
+                    with profiler.phase("plan"):
+                        linked = await self.io_executor.run(
+                            self._link_stored_wallpaper,
+                            wallpaper_path,
+                            wallpaper_url,
+                        )
+                    if linked:
+                        linked_wallpapers_count += 1
+                        metrics.get_metrics().increment(
+                            "wallpapers_deduplicated_total",
+                        )
+                        continue
+                await wallpapers_queue.put(
+                    (wallpaper_path, wallpaper_url, etag),
                 )
-                tasks.append(task)
 
-            await asyncio.gather(*tasks)
+            for _ in workers:
+                await wallpapers_queue.put(None)
+            await asyncio.gather(*workers)
+        finally:
+            await wallpapers_urls.aclose()
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            await self.io_executor.run(self.manifest.save)
+            if self.content_store is not None:
+                await self.io_executor.run(self.content_store.save)
+
+        if not found_wallpapers_count:
+            self.logger.error("Wallpapers are not found.")
+            raise SystemExit
+        if found_wallpapers_count > (
+            skipped_wallpapers_count + linked_wallpapers_count
+        ):
+            self.logger.info(
+                "Concurrency of downloads: "
+                f"final {self.concurrency.current}, "
+                f"peak {self.concurrency.peak_limit}.",
+            )
+        self.logger.info(retry.get_retry_policy().get_summary())
+        if skipped_wallpapers_count:
+            self.logger.info(
+                f"{skipped_wallpapers_count} wallpapers are already "
+                "downloaded and were skipped.",
+            )
+        if linked_wallpapers_count:
+            self.logger.info(
+                f"{linked_wallpapers_count} wallpapers are linked from "
+                "the content store without downloading.",
+            )
+
+    def _report_metrics(self, run_duration: float) -> None:
+        """
+        Log the summary of metrics and write them to the textfile.
+
+        Args:
+            run_duration (float): wall time of the run in seconds.
+        """
+        run_metrics = metrics.get_metrics()
+        run_metrics.set_gauge("run_duration_seconds", run_duration)
+        run_metrics.set_gauge("last_run_timestamp_seconds", time.time())
+        for summary_line in run_metrics.get_summary():
+            self.logger.info(summary_line)
+        run_profiler = profiler.get_profiler()
+        if run_profiler is not None:
+            for table_line in run_profiler.get_table():
+                self.logger.info(table_line)
+        if self.metrics_path is None:
+            return
+        try:
+            run_metrics.write_textfile(self.metrics_path)
+        except OSError:
+            self.logger.warning(
+                f"Can't write metrics to '{self.metrics_path}'.",
+            )
 
     def download_wallpapers(self) -> None:
         """Download all wallpapers with initialized parameters."""
-        wallpapers_urls = site_parser.get_wallpapers_urls(
-            self.month_year,
-            self.resolution,
-        )
+        run_start_time = time.monotonic()
+        try:
+            asyncio.run(self._downloader_event_loop())
+        finally:
+            self.io_executor.shutdown()
+            self._report_metrics(time.monotonic() - run_start_time)
+        self.logger.info("Downloading of wallpapers is finished.")
 
-        self._create_directories()
+    async def download_wallpapers_async(
+        self,
+        session: aiohttp.ClientSession,
+    ) -> None:
+        """
+        Download all wallpapers in the running event loop.
 
-        self.logger.info("Downloading of wallpapers is started.")
-        asyncio.run(self._downloader_event_loop(wallpapers_urls))
+        Args:
+            session (aiohttp.ClientSession): session of the caller which
+                is kept open after the download.
+        """
+        run_start_time = time.monotonic()
+        try:
+            await self._downloader_event_loop(session)
+        finally:
+            self.io_executor.shutdown()
+            self._report_metrics(time.monotonic() - run_start_time)
         self.logger.info("Downloading of wallpapers is finished.")
 
 
 if __name__ == "__main__":
-    @click.command()
-    @click.option(
-        "--month-year",
-        type=str,
-        required=True,
-        help="Month and year of downloadable wallpapers",
-    )
-    @click.option(
-        "--resolution",
-        type=str,
-        default="1920x1080",
-        show_default=True,
-        help="Resolution of downloadable wallpapers",
-    )
-    @click.option(
-        "--dest_path",
-        type=str,
-        default="smashingmagazine",
-        show_default=True,
-        help="Destination path for downloadable wallpapers",
-    )
-    def download_wallpapers(
-        month_year,
-        resolution,
-        dest_path,
-    ) -> None:
-        """CLI for download wallpaper from 'smashingmagazine.com'."""
-        downloader = WallpaperDownloader(
-            month_year,
-            resolution,
-            dest_path,
-        )
-        downloader.download_wallpapers()
+    from wallpaper_downloader.cli import download
 
-    download_wallpapers()
+    download()
@@ -0,0 +1,288 @@
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, NamedTuple, Union
+
+from wallpaper_downloader import app_cache, app_logger
+
+logger = app_logger.get_logger(__name__)
+
+
+class Page(NamedTuple):
+    """Body of the page with its validators."""
+
+    url: str
+    body: bytes
+    etag: Union[str, None] = None
+    last_modified: Union[str, None] = None
+    # True if the server confirmed that the cached body is not changed.
+    unchanged: bool = False
+
+    @property
+    def validator(self) -> str:
+        """
+        Get the string which changes with the body of the page.
+
+        Returns:
+            str: ETag and Last-Modified of the page.
+        """
+        return f"{self.etag}|{self.last_modified}"
+
+
+class PageCache:
+    """
+    Size-bounded on-disk cache of HTML pages.
+
+    Bodies are stored with 'ETag' and 'Last-Modified' headers and are
+    revalidated with 'If-None-Match' and 'If-Modified-Since' headers.
+    Least recently used pages are evicted when the size of all bodies
+    exceeds the limit. Pages and results of parsing can be stored from
+    several threads. Results of parsing are stored with the page and are
+    valid while the body is not changed.
+    """
+
+    def __init__(
+        self,
+        cache_directory_path: str = None,
+        max_size: int = 50 * 1024 * 1024,
+        max_parsed_pages: int = 8,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            cache_directory_path (str, optional): directory of the cache.
+                Defaults to 'pages' in the cache directory.
+            max_size (int, optional): maximum size of all bodies in bytes.
+                Defaults to 50 MiB.
+            max_parsed_pages (int, optional): number of parsed pages kept
+                in memory. Defaults to 8.
+        """
+        self.cache_directory_path = (
+            cache_directory_path or app_cache.get_cache_path("pages")
+        )
+        self.max_size = max_size
+        self.max_parsed_pages = max_parsed_pages
+        self._parsed_pages = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get_entry_path(self, url: str, extension: str) -> str:
+        """
+        Get the path of the file of the cache entry.
+
+        Args:
+            url (str): URL of the page.
+            extension (str): 'html' for the body or 'json' for metadata.
+
+        Returns:
+            str: absolute path of the file.
+        """
+        key = hashlib.sha256(url.encode()).hexdigest()
+        return os.path.join(self.cache_directory_path, f"{key}.{extension}")
+
+    def _read_metadata(self, url: str) -> Union[dict, None]:
+        """
+        Read metadata of the cached page.
+
+        Args:
+            url (str): URL of the page.
+
+        Returns:
+            Union[dict, None]: metadata or 'None' if the page is not cached.
+        """
+        try:
+            with open(self._get_entry_path(url, "json")) as metadata_file:
+                metadata = json.load(metadata_file)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(metadata, dict) or metadata.get("url") != url:
+            return None
+        return metadata
+
+    def _write_file(self, path: str, data: Union[bytes, str]) -> None:
+        """
+        Write the file atomically.
+
+        Args:
+            path (str): absolute path of the file.
+            data (Union[bytes, str]): content of the file.
+        """
+        app_cache.write_file_atomically(path, data)
+
+    def load(self, url: str) -> Union[Page, None]:
+        """
+        Get the cached page and mark it as recently used.
+
+        Args:
+            url (str): URL of the page.
+
+        Returns:
+            Union[Page, None]: the page or 'None' if the page is not cached.
+        """
+        metadata = self._read_metadata(url)
+        if metadata is None:
+            return None
+        body_path = self._get_entry_path(url, "html")
+        try:
+            with open(body_path, "rb") as body_file:
+                body = body_file.read()
+            os.utime(body_path)
+        except OSError:
+            return None
+        return Page(
+            url,
+            body,
+            metadata.get("etag"),
+            metadata.get("last_modified"),
+        )
+
+    def get_conditional_headers(self, page: Union[Page, None]) -> dict:
+        """
+        Get headers for revalidation of the cached page.
+
+        Args:
+            page (Union[Page, None]): the cached page.
+
+        Returns:
+            dict: 'If-None-Match' and 'If-Modified-Since' headers.
+        """
+        headers = {}
+        if page is None:
+            return headers
+        if page.etag:
+            headers["If-None-Match"] = page.etag
+        if page.last_modified:
+            headers["If-Modified-Since"] = page.last_modified
+        return headers
+
+    def store(self, url: str, body: bytes, headers: Any) -> Page:
+        """
+        Put the page to the cache and evict old pages.
+
+        Args:
+            url (str): URL of the page.
+            body (bytes): body of the page.
+            headers (Any): headers of the response.
+
+        Returns:
+            Page: the stored page.
+        """
+        page = Page(
+            url,
+            body,
+            headers.get("ETag"),
+            headers.get("Last-Modified"),
+        )
+        metadata = {
+            "url": url,
+            "etag": page.etag,
+            "last_modified": page.last_modified,
+            "parsed": {},
+        }
+        try:
+            os.makedirs(self.cache_directory_path, exist_ok=True)
+            with self._lock:
+                self._write_file(self._get_entry_path(url, "html"), body)
+                self._write_file(
+                    self._get_entry_path(url, "json"),
+                    json.dumps(metadata),
+                )
+                self._evict()
+        except OSError:
+            logger.warning(f"Can't save page '{url}' to the cache.")
+        return page
+
+    def load_parsed(self, page: Page, name: str) -> Any:
+        """
+        Get the stored result of parsing of the unchanged page.
+
+        Args:
+            page (Page): the page.
+            name (str): name of the result.
+
+        Returns:
+            Any: the result or 'None' if it is not stored.
+        """
+        metadata = self._read_metadata(page.url)
+        if (
+            metadata is None or
+            metadata.get("etag") != page.etag or
+            metadata.get("last_modified") != page.last_modified
+        ):
+            return None
+        return metadata.get("parsed", {}).get(name)
+
+    def store_parsed(self, page: Page, name: str, parsed: Any) -> None:
+        """
+        Store the result of parsing with the cached page.
+
+        Args:
+            page (Page): the page.
+            name (str): name of the result.
+            parsed (Any): JSON-serializable result.
+        """
+        try:
+            with self._lock:
+                metadata = self._read_metadata(page.url)
+                if metadata is None:
+                    return
+                metadata.setdefault("parsed", {})[name] = parsed
+                self._write_file(
+                    self._get_entry_path(page.url, "json"),
+                    json.dumps(metadata),
+                )
+        except OSError:
+            logger.warning(f"Can't save parsed page '{page.url}'.")
+
+    def get_parsed_html(self, page: Page) -> Any:
+        """
+        Get the page parsed in this process if the body is not changed.
+
+        Args:
+            page (Page): the page.
+
+        Returns:
+            Any: parsed HTML or 'None'.
+        """
+        parsed_page = self._parsed_pages.get(page.url)
+        if parsed_page is None or parsed_page[0] != page.validator:
+            return None
+        self._parsed_pages.move_to_end(page.url)
+        return parsed_page[1]
+
+    def set_parsed_html(self, page: Page, page_html: Any) -> None:
+        """
+        Keep the parsed page in memory.
+
+        Args:
+            page (Page): the page.
+            page_html (Any): parsed HTML.
+        """
+        self._parsed_pages[page.url] = (page.validator, page_html)
+        self._parsed_pages.move_to_end(page.url)
+        while len(self._parsed_pages) > self.max_parsed_pages:
+            self._parsed_pages.popitem(last=False)
+
+    def _evict(self) -> None:
+        """Remove least recently used pages while the cache is too big."""
+        bodies = []
+        with os.scandir(self.cache_directory_path) as entries:
+            for entry in entries:
+                if entry.name.endswith(".html"):
+                    entry_stat = entry.stat()
+                    bodies.append(
+                        (entry_stat.st_mtime, entry_stat.st_size, entry.path),
+                    )
+
+        cache_size = sum(size for _, size, _ in bodies)
+        for _, size, body_path in sorted(bodies):
+            if cache_size <= self.max_size:
+                break
+            for path in (body_path, f"{body_path[:-len('html')]}json"):
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+            cache_size -= size
@@ -0,0 +1,46 @@
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+
+class IOExecutor:
+    """Run blocking filesystem calls outside of the event loop."""
+
+    def __init__(self, max_workers: int = 4) -> None:
+        """
+        Initialize the thread pool for filesystem calls.
+
+        Threads of the pool are started lazily on the first call.
+
+        Args:
+            max_workers (int, optional): number of threads in the pool.
+                Defaults to 4.
+        """
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="wallpaper-io",
+        )
+
+    async def run(self, func: Callable, *args, **kwargs) -> Any:
+        """
+        Call the blocking function in the thread pool and await the result.
+
+        Args:
+            func (Callable): blocking function.
+            *args: positional arguments of the function.
+            **kwargs: keyword arguments of the function.
+
+        Returns:
+            Any: result of the function.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor,
+            functools.partial(func, *args, **kwargs),
+        )
+
+    def shutdown(self) -> None:
+        """Wait for the pending calls and stop threads of the pool."""
+        self._executor.shutdown(wait=True)
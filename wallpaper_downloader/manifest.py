@@ -0,0 +1,203 @@
+import hashlib
+import json
+import os
+from typing import Union
+
+from wallpaper_downloader import app_cache, app_logger
+
+logger = app_logger.get_logger(__name__)
+
+# 'quick' compares the size of the file with the manifest,
+# 'full' also compares the hash of the content of the file and
+# revalidates the wallpaper on the server by its ETag,
+# 'none' downloads all wallpapers again.
+VERIFY_MODES = ("quick", "full", "none")
+
+
+def get_file_hash(file_path: str, chunk_size: int = 1024 * 1024) -> str:
+    """
+    Calculate SHA-256 of the content of the file.
+
+    Args:
+        file_path (str): absolute path of the file.
+        chunk_size (int, optional): size of chunks in which the file is read.
+            Defaults to 1 MiB.
+
+    Returns:
+        str: hex digest of the content.
+    """
+    file_hash = hashlib.sha256()
+    with open(file_path, "rb") as hashed_file:
+        for chunk in iter(lambda: hashed_file.read(chunk_size), b""):
+            file_hash.update(chunk)
+    return file_hash.hexdigest()
+
+
+class Manifest:
+    """
+    Records of wallpapers downloaded in the destination directory.
+
+    Every record contains URL, size, ETag and SHA-256 of the wallpaper,
+    so complete wallpapers are not downloaded again. In 'full' mode
+    wallpapers recorded with ETag are revalidated, so the changed wallpaper
+    is downloaded.
+    """
+
+    filename = ".wallpapers-manifest.json"
+
+    def __init__(self, directory_path: str) -> None:
+        """
+        Initialize the manifest. The file of the manifest is read lazily.
+
+        Args:
+            directory_path (str): absolute path of the destination directory.
+        """
+        self.directory_path = directory_path
+        self.manifest_path = os.path.join(directory_path, self.filename)
+        self._records = None
+
+    @property
+    def records(self) -> dict:
+        """
+        Get records of wallpapers.
+
+        Returns:
+            dict: records in '{relative_path: record}' format.
+        """
+        if self._records is None:
+            self._records = self._load()
+        return self._records
+
+    def _load(self) -> dict:
+        """
+        Read records from the file of the manifest.
+
+        Returns:
+            dict: records in '{relative_path: record}' format.
+        """
+        try:
+            with open(self.manifest_path) as manifest_file:
+                records = json.load(manifest_file)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError):
+            logger.warning(
+                f"Manifest '{self.manifest_path}' is broken and is ignored.",
+            )
+            return {}
+        return records if isinstance(records, dict) else {}
+
+    def _get_key(self, wallpaper_path: str) -> str:
+        """
+        Get the key of the record of the wallpaper.
+
+        Args:
+            wallpaper_path (str): absolute path of the wallpaper.
+
+        Returns:
+            str: path of the wallpaper relative to the directory.
+        """
+        return os.path.relpath(wallpaper_path, self.directory_path)
+
+    def get(self, wallpaper_path: str) -> Union[dict, None]:
+        """
+        Get the record of the wallpaper.
+
+        Args:
+            wallpaper_path (str): absolute path of the wallpaper.
+
+        Returns:
+            Union[dict, None]: the record or 'None' if it does not exist.
+        """
+        return self.records.get(self._get_key(wallpaper_path))
+
+    def record(
+        self,
+        wallpaper_path: str,
+        wallpaper_url: str,
+        size: int,
+        sha256: str,
+        etag: Union[str, None] = None,
+    ) -> None:
+        """
+        Add the record of the downloaded wallpaper.
+
+        Args:
+            wallpaper_path (str): absolute path of the wallpaper.
+            wallpaper_url (str): URL of the wallpaper.
+            size (int): size of the wallpaper in bytes.
+            sha256 (str): SHA-256 of the content of the wallpaper.
+            etag (Union[str, None], optional): ETag of the response.
+        """
+        self.records[self._get_key(wallpaper_path)] = {
+            "url": wallpaper_url,
+            "size": size,
+            "etag": etag,
+            "sha256": sha256,
+        }
+
+    def get_etag(self, wallpaper_path: str) -> Union[str, None]:
+        """
+        Get ETag of the recorded wallpaper.
+
+        Args:
+            wallpaper_path (str): absolute path of the wallpaper.
+
+        Returns:
+            Union[str, None]: ETag or 'None' if it is not recorded.
+        """
+        wallpaper_record = self.get(wallpaper_path)
+        if wallpaper_record is None:
+            return None
+        return wallpaper_record.get("etag")
+
+    def is_valid(
+        self,
+        wallpaper_path: str,
+        wallpaper_url: str,
+        verify: str = "quick",
+    ) -> bool:
+        """
+        Check that the wallpaper is already downloaded and complete.
+
+        Args:
+            wallpaper_path (str): absolute path of the wallpaper.
+            wallpaper_url (str): URL of the wallpaper.
+            verify (str, optional): 'quick' to compare the size of the file,
+                'full' to compare also the hash of the content,
+                'none' to consider all wallpapers invalid.
+                Defaults to 'quick'.
+
+        Returns:
+            bool: True if the wallpaper doesn't need to be downloaded.
+        """
+        if verify == "none":
+            return False
+        wallpaper_record = self.get(wallpaper_path)
+        if (
+            wallpaper_record is None or
+            wallpaper_record["url"] != wallpaper_url
+        ):
+            return False
+        try:
+            if os.stat(wallpaper_path).st_size != wallpaper_record["size"]:
+                return False
+            if verify == "full":
+                return get_file_hash(wallpaper_path) == wallpaper_record[
+                    "sha256"
+                ]
+        except OSError:
+            return False
+        return True
+
+    def save(self) -> None:
+        """Write records to the file of the manifest atomically."""
+        if self._records is None:
+            return
+        try:
+            app_cache.write_file_atomically(
+                self.manifest_path,
+                json.dumps(self._records, indent=2, sort_keys=True),
+            )
+        except OSError:
+            logger.warning(f"Can't save manifest to '{self.manifest_path}'.")
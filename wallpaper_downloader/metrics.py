@@ -0,0 +1,288 @@
+import threading
+from typing import Union
+
+from wallpaper_downloader import app_cache
+
+# Prefix of names of metrics in the Prometheus textfile.
+METRICS_PREFIX = "wallpaper_downloader"
+# Upper bounds of buckets of histograms in seconds.
+DEFAULT_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+# Help of metrics written to the Prometheus textfile.
+METRICS_HELP = {
+    "wallpapers_ok_total": "Wallpapers downloaded in the run.",
+    "wallpapers_failed_total": "Wallpapers which were not downloaded.",
+    "wallpapers_skipped_total": "Wallpapers which were already downloaded.",
+    "wallpapers_deduplicated_total": "Wallpapers linked to stored copies.",
+    "months_failed_total": "Months whose pages were not parsed.",
+    "downloaded_bytes_total": "Bytes of wallpapers received in the run.",
+    "html_pages_total": "HTML pages requested in the run.",
+    "html_pages_not_modified_total": "HTML pages not modified since caching.",
+    "image_request_seconds": "Time until headers of images are received.",
+    "html_request_seconds": "Time of requests of HTML pages.",
+    "parse_seconds": "Time of parsing of HTML pages.",
+    "run_duration_seconds": "Wall time of the run.",
+    "last_run_timestamp_seconds": "Unix time of the end of the run.",
+}
+
+
+def _format_number(value: float) -> str:
+    """
+    Format the value of the metric without the exponent for integers.
+
+    Args:
+        value (float): value of the metric.
+
+    Returns:
+        str: formatted value.
+    """
+    value = float(value)
+    if value.is_integer():
+        return str(int(value))
+    return repr(value)
+
+
+class Histogram:
+    """Distribution of observed values in cumulative buckets."""
+
+    def __init__(self, buckets: tuple = DEFAULT_BUCKETS) -> None:
+        """
+        Initialize empty buckets.
+
+        Args:
+            buckets (tuple, optional): sorted upper bounds of buckets.
+                Defaults to DEFAULT_BUCKETS.
+        """
+        self.buckets = tuple(buckets)
+        self.buckets_counts = [0] * len(self.buckets)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """
+        Add the value to the histogram.
+
+        Args:
+            value (float): observed value.
+        """
+        self.count += 1
+        self.sum += value
+        for bucket_number, upper_bound in enumerate(self.buckets):
+            if value <= upper_bound:
+                self.buckets_counts[bucket_number] += 1
+                break
+
+    def get_quantile(self, quantile: float) -> Union[float, None]:
+        """
+        Estimate the quantile by upper bounds of buckets.
+
+        Args:
+            quantile (float): quantile from 0 to 1.
+
+        Returns:
+            Union[float, None]: upper bound of the bucket with the quantile,
+                'inf' if it is above all buckets or 'None' if the histogram
+                is empty.
+        """
+        if not self.count:
+            return None
+        rank = quantile * self.count
+        cumulative_count = 0
+        for upper_bound, bucket_count in zip(
+            self.buckets,
+            self.buckets_counts,
+        ):
+            cumulative_count += bucket_count
+            if cumulative_count >= rank:
+                return upper_bound
+        return float("inf")
+
+
+class Metrics:
+    """
+    Counters, gauges and histograms of the run.
+
+    Metrics are updated from the event loop and from threads of the sync
+    parser, so updates are guarded by the lock.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty metrics."""
+        self.counters = {}
+        self.gauges = {}
+        self.histograms = {}
+        self._lock = threading.Lock()
+
+    def increment(self, name: str, value: float = 1) -> None:
+        """
+        Increase the counter.
+
+        Args:
+            name (str): name of the counter.
+            value (float, optional): increment. Defaults to 1.
+        """
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def set_gauge(self, name: str, value: float) -> None:
+        """
+        Set the value of the gauge.
+
+        Args:
+            name (str): name of the gauge.
+            value (float): value.
+        """
+        with self._lock:
+            self.gauges[name] = value
+
+    def observe(self, name: str, value: float) -> None:
+        """
+        Add the value to the histogram.
+
+        Args:
+            name (str): name of the histogram.
+            value (float): observed value.
+        """
+        with self._lock:
+            if name not in self.histograms:
+                self.histograms[name] = Histogram()
+            self.histograms[name].observe(value)
+
+    def get_summary(self) -> list:
+        """
+        Get lines of the end-of-run summary.
+
+        Returns:
+            list: human-readable lines.
+        """
+        counters = self.counters
+        lines = [
+            "Wallpapers: "
+            f"{counters.get('wallpapers_ok_total', 0):g} downloaded, "
+            f"{counters.get('wallpapers_failed_total', 0):g} failed, "
+            f"{counters.get('wallpapers_skipped_total', 0):g} skipped.",
+        ]
+        downloaded_mib = counters.get("downloaded_bytes_total", 0) / 2 ** 20
+        run_duration = self.gauges.get("run_duration_seconds")
+        if run_duration:
+            lines.append(
+                f"Downloaded {downloaded_mib:.2f} MiB in {run_duration:.2f} s "
+                f"({downloaded_mib / run_duration:.2f} MiB/s).",
+            )
+        lines.append(
+            f"HTML pages: {counters.get('html_pages_total', 0):g} requested, "
+            f"{counters.get('html_pages_not_modified_total', 0):g} "
+            "not modified.",
+        )
+        for name, description in (
+            ("image_request_seconds", "Image requests"),
+            ("html_request_seconds", "HTML requests"),
+            ("parse_seconds", "Parsing"),
+        ):
+            histogram = self.histograms.get(name)
+            if histogram is None or not histogram.count:
+                continue
+            lines.append(
+                f"{description}: {histogram.count} in "
+                f"{histogram.sum:.2f} s, "
+                f"mean {histogram.sum / histogram.count:.3f} s, "
+                f"p50 <= {histogram.get_quantile(0.5):g} s, "
+                f"p95 <= {histogram.get_quantile(0.95):g} s.",
+            )
+        return lines
+
+    def format_textfile(self) -> str:
+        """
+        Format metrics in the Prometheus text exposition format.
+
+        Returns:
+            str: content of the textfile.
+        """
+        lines = []
+        for metrics_type, metrics in (
+            ("counter", self.counters),
+            ("gauge", self.gauges),
+        ):
+            for name, value in sorted(metrics.items()):
+                full_name = f"{METRICS_PREFIX}_{name}"
+                lines.extend(
+                    self._format_header(full_name, name, metrics_type),
+                )
+                lines.append(f"{full_name} {_format_number(value)}")
+
+        for name, histogram in sorted(self.histograms.items()):
+            full_name = f"{METRICS_PREFIX}_{name}"
+            lines.extend(self._format_header(full_name, name, "histogram"))
+            cumulative_count = 0
+            for upper_bound, bucket_count in zip(
+                histogram.buckets,
+                histogram.buckets_counts,
+            ):
+                cumulative_count += bucket_count
+                lines.append(
+                    f'{full_name}_bucket{{le="{upper_bound:g}"}} '
+                    f"{cumulative_count}",
+                )
+            lines.append(f'{full_name}_bucket{{le="+Inf"}} {histogram.count}')
+            lines.append(
+                f"{full_name}_sum {_format_number(histogram.sum)}",
+            )
+            lines.append(f"{full_name}_count {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+    def _format_header(
+        self,
+        full_name: str,
+        name: str,
+        metrics_type: str,
+    ) -> list:
+        """
+        Format HELP and TYPE lines of the metric.
+
+        Args:
+            full_name (str): name of the metric with the prefix.
+            name (str): name of the metric.
+            metrics_type (str): 'counter', 'gauge' or 'histogram'.
+
+        Returns:
+            list: lines of the header.
+        """
+        header = []
+        if name in METRICS_HELP:
+            header.append(f"# HELP {full_name} {METRICS_HELP[name]}")
+        header.append(f"# TYPE {full_name} {metrics_type}")
+        return header
+
+    def write_textfile(self, textfile_path: str) -> None:
+        """
+        Write metrics to the textfile of node_exporter atomically.
+
+        Args:
+            textfile_path (str): path of the '.prom' file.
+        """
+        app_cache.write_file_atomically(textfile_path, self.format_textfile())
+
+
+# Metrics shared by the parser and the downloader.
+_metrics = Metrics()
+
+
+def set_metrics(metrics: Metrics) -> None:
+    """
+    Set metrics shared by the parser and the downloader.
+
+    Args:
+        metrics (Metrics): metrics of the run.
+    """
+    global _metrics
+    _metrics = metrics
+
+
+def get_metrics() -> Metrics:
+    """
+    Get metrics shared by the parser and the downloader.
+
+    Returns:
+        Metrics: metrics of the run.
+    """
+    return _metrics
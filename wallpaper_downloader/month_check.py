@@ -0,0 +1,94 @@
+import json
+import os
+from datetime import datetime
+from typing import Union
+
+from wallpaper_downloader import app_cache, app_logger
+
+logger = app_logger.get_logger(__name__)
+
+# Exit codes of the check of the new month.
+EXIT_NO_NEW_MONTH = 0
+EXIT_ERROR = 1
+EXIT_NEW_MONTH = 10
+
+
+def is_new_month_year(
+    month_year: str,
+    known_month_year: Union[str, None],
+) -> bool:
+    """
+    Check that the month is newer than the known month.
+
+    Args:
+        month_year (str): month and year in 'mm-yyyy' format.
+        known_month_year (Union[str, None]): the newest known month in
+            'mm-yyyy' format or 'None' if no month is known.
+
+    Returns:
+        bool: True if the month is newer or no month is known.
+    """
+    if known_month_year is None:
+        return True
+    return datetime.strptime(month_year, "%m-%Y") > datetime.strptime(
+        known_month_year,
+        "%m-%Y",
+    )
+
+
+class LastCheck:
+    """The newest month found by the previous check."""
+
+    def __init__(self, state_path: str = None) -> None:
+        """
+        Initialize the state of checks.
+
+        Args:
+            state_path (str, optional): path of the JSON file of the state.
+                Defaults to 'last_check.json' in the cache directory.
+        """
+        self.state_path = state_path or app_cache.get_cache_path(
+            "last_check.json",
+        )
+
+    def load(self) -> Union[str, None]:
+        """
+        Read the newest month found by the previous check.
+
+        Returns:
+            Union[str, None]: month and year in 'mm-yyyy' format or 'None'
+                if there was no check or the state is broken.
+        """
+        try:
+            with open(self.state_path) as state_file:
+                state = json.load(state_file)
+            month_year = state["newest_month_year"]
+            datetime.strptime(month_year, "%m-%Y")
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, TypeError, KeyError):
+            logger.warning(
+                f"State of checks '{self.state_path}' is broken "
+                "and is ignored.",
+            )
+            return None
+        return month_year
+
+    def save(self, month_year: str) -> None:
+        """
+        Write the newest month found by the check atomically.
+
+        Args:
+            month_year (str): month and year in 'mm-yyyy' format.
+        """
+        directory_path = os.path.dirname(os.path.abspath(self.state_path))
+        try:
+            os.makedirs(directory_path, exist_ok=True)
+            app_cache.write_file_atomically(
+                self.state_path,
+                json.dumps({"newest_month_year": month_year}),
+            )
+        except OSError:
+            logger.warning(
+                f"Can't save state of checks to '{self.state_path}'.",
+            )
@@ -0,0 +1,121 @@
+import json
+import os
+import threading
+from typing import Union
+
+from wallpaper_downloader import app_cache, app_logger
+
+logger = app_logger.get_logger(__name__)
+
+
+class MonthIndex:
+    """Persistent index of wallpapers pages URLs by month and year."""
+
+    def __init__(self, index_path: str = None) -> None:
+        """
+        Initialize the index. The file of the index is read lazily.
+
+        Args:
+            index_path (str, optional): path of the JSON file of the index.
+                Defaults to 'month_index.json' in the cache directory.
+        """
+        self.index_path = index_path or app_cache.get_cache_path(
+            "month_index.json",
+        )
+        self._pages_urls = None
+        self._lock = threading.Lock()
+
+    @property
+    def pages_urls(self) -> dict:
+        """
+        Get URLs of wallpapers pages.
+
+        Returns:
+            dict: URLs in '{month-year: page_url}' format.
+                Example - {'july-2020': '/2020/06/...-july-2020/'}.
+        """
+        if self._pages_urls is None:
+            self._pages_urls = self._load()
+        return self._pages_urls
+
+    def _load(self) -> dict:
+        """
+        Read the index from the file.
+
+        Broken or missing file gives the empty index.
+
+        Returns:
+            dict: URLs in '{month-year: page_url}' format.
+        """
+        try:
+            with open(self.index_path) as index_file:
+                pages_urls = json.load(index_file)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError):
+            logger.warning(
+                f"Month index '{self.index_path}' is broken and is ignored.",
+            )
+            return {}
+        if not isinstance(pages_urls, dict):
+            return {}
+        return pages_urls
+
+    def get(self, month: str, year: str) -> Union[str, None]:
+        """
+        Get URL of the wallpapers page for month and year.
+
+        Args:
+            month (str): month in full name format ('august').
+            year (str): year in four-digit format ('2020').
+
+        Returns:
+            Union[str, None]: URL of the page or
+                'None' if month is not indexed.
+        """
+        return self.pages_urls.get(f"{month}-{year}")
+
+    def update(self, pages_urls: dict, save: bool = True) -> bool:
+        """
+        Add URLs of wallpapers pages to the index and save it.
+
+        Args:
+            pages_urls (dict): URLs in '{month-year: page_url}' format.
+            save (bool, optional): write the changed index to the file.
+                Defaults to True.
+
+        Returns:
+            bool: True if the index was changed.
+        """
+        new_pages_urls = {
+            month_year: page_url
+            for month_year, page_url in pages_urls.items()
+            if self.pages_urls.get(month_year) != page_url
+        }
+        if not new_pages_urls:
+            return False
+        self.pages_urls.update(new_pages_urls)
+        if save:
+            self.save()
+        return True
+
+    def save(self) -> None:
+        """
+        Write the index to the file atomically.
+
+        The index can be saved from other threads while it is updated,
+        the file always gets the index at the time of writing.
+        """
+        index_directory_path = os.path.dirname(self.index_path)
+        with self._lock:
+            pages_urls = dict(self.pages_urls)
+            try:
+                os.makedirs(index_directory_path, exist_ok=True)
+                app_cache.write_file_atomically(
+                    self.index_path,
+                    json.dumps(pages_urls, indent=2, sort_keys=True),
+                )
+            except OSError:
+                logger.warning(
+                    f"Can't save month index to '{self.index_path}'.",
+                )
@@ -0,0 +1,207 @@
+from datetime import datetime
+from typing import Union
+
+
+def _to_datetime(month_year: str) -> datetime:
+    """
+    Convert month and year to datetime.
+
+    Args:
+        month_year (str): month and year in 'july-2020' format.
+
+    Returns:
+        datetime: the first day of the month.
+    """
+    return datetime.strptime(month_year, "%B-%Y")
+
+
+def _get_months_distance(newer: datetime, older: datetime) -> int:
+    """
+    Get the number of months between two dates.
+
+    Args:
+        newer (datetime): the newer date.
+        older (datetime): the older date.
+
+    Returns:
+        int: number of months, negative if 'newer' is older than 'older'.
+    """
+    return (newer.year - older.year) * 12 + newer.month - older.month
+
+
+def _ceil_div(dividend: int, divisor: int) -> int:
+    """
+    Divide integers with rounding up.
+
+    Args:
+        dividend (int): dividend.
+        divisor (int): divisor.
+
+    Returns:
+        int: quotient rounded up.
+    """
+    return -(-dividend // divisor)
+
+
+class PageSearch:
+    """
+    Search of the category page with wallpapers for the month.
+
+    Category pages are numbered and wallpapers are published monthly,
+    so the number of the page is estimated from the distance to the newest
+    month. Every requested page narrows the range of possible pages, and
+    the next page is interpolated from the months found on it.
+    The number of requested pages grows logarithmically with the distance.
+    """
+
+    def __init__(self, first_page_urls: dict, month: str, year: str) -> None:
+        """
+        Initialize the search with wallpapers pages of the first page.
+
+        Args:
+            first_page_urls (dict): URLs of wallpapers pages from the first
+                category page in '{month-year: page_url}' format.
+            month (str): month in full name format ('august').
+            year (str): year in four-digit format ('2020').
+        """
+        self.month_year = f"{month}-{year}"
+        self.requested_dt = _to_datetime(self.month_year)
+        self.posts_per_page = max(len(first_page_urls), 1)
+        self.result = first_page_urls.get(self.month_year)
+        self.low = 2
+        self.high = None
+        self.visited = {1}
+        self.not_found = False
+        self._guess = self.low
+        if first_page_urls:
+            newest_dt = max(map(_to_datetime, first_page_urls))
+            months_distance = _get_months_distance(
+                newest_dt,
+                self.requested_dt,
+            )
+            self._guess = 1 + months_distance // self.posts_per_page
+
+    @property
+    def done(self) -> bool:
+        """
+        Check that the search is finished.
+
+        Returns:
+            bool: True if URL is found or it can't be found.
+        """
+        return (
+            self.result is not None or
+            self.not_found or
+            (self.high is not None and self.low > self.high)
+        )
+
+    def _clamp(self, page_number: int) -> int:
+        """
+        Move the page number into the range of possible pages.
+
+        Args:
+            page_number (int): number of the page.
+
+        Returns:
+            int: number of the page in the range.
+        """
+        page_number = max(page_number, self.low)
+        if self.high is not None:
+            page_number = min(page_number, self.high)
+        return page_number
+
+    def next_pages(self, window: int = 1) -> list:
+        """
+        Get numbers of pages which should be requested next.
+
+        Args:
+            window (int, optional): number of pages which will be
+                requested concurrently. Defaults to 1.
+
+        Returns:
+            list: numbers of pages, the most probable page goes first.
+        """
+        guess = self._clamp(self._guess)
+        if guess in self.visited:
+            if self.high is None:
+                guess = max(self.visited) + 1
+            else:
+                guess = (self.low + self.high) // 2
+
+        pages_numbers = []
+        offset = 0
+        while len(pages_numbers) < window and offset <= window:
+            for page_number in (guess + offset, guess - offset):
+                if (
+                    page_number not in self.visited and
+                    page_number not in pages_numbers and
+                    page_number == self._clamp(page_number) and
+                    len(pages_numbers) < window
+                ):
+                    pages_numbers.append(page_number)
+            offset += 1
+        return pages_numbers
+
+    def observe(
+        self,
+        page_number: int,
+        pages_urls: Union[dict, None],
+    ) -> None:
+        """
+        Narrow the range of pages with the result of the page request.
+
+        Args:
+            page_number (int): number of the requested page.
+            pages_urls (Union[dict, None]): URLs of wallpapers pages from
+                the page in '{month-year: page_url}' format or 'None'
+                if the page does not exist.
+        """
+        self.visited.add(page_number)
+        if self.result is not None:
+            return
+
+        if not pages_urls:
+            # The page is after the last page with monthly wallpapers.
+            self._set_high(page_number - 1)
+            self._guess = page_number - 1
+            return
+
+        if self.month_year in pages_urls:
+            self.result = pages_urls[self.month_year]
+            return
+
+        pages_dts = [_to_datetime(month_year) for month_year in pages_urls]
+        newest_dt, oldest_dt = max(pages_dts), min(pages_dts)
+        if self.requested_dt > newest_dt:
+            months_distance = _get_months_distance(
+                self.requested_dt,
+                newest_dt,
+            )
+            self._set_high(page_number - 1)
+            self._guess = page_number - _ceil_div(
+                months_distance,
+                self.posts_per_page,
+            )
+        elif self.requested_dt < oldest_dt:
+            months_distance = _get_months_distance(
+                oldest_dt,
+                self.requested_dt,
+            )
+            self.low = max(self.low, page_number + 1)
+            self._guess = page_number + _ceil_div(
+                months_distance,
+                self.posts_per_page,
+            )
+        else:
+            # The month is inside the page range but was not published.
+            self.not_found = True
+
+    def _set_high(self, page_number: int) -> None:
+        """
+        Set the upper bound of the range of possible pages.
+
+        Args:
+            page_number (int): number of the page.
+        """
+        if self.high is None or page_number < self.high:
+            self.high = page_number
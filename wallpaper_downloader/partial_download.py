@@ -0,0 +1,152 @@
+import hashlib
+import json
+import os
+from typing import Union
+
+
+class PartialDownload:
+    """
+    Partially downloaded wallpaper which can be resumed.
+
+    The body is written to the '.part' file next to the wallpaper.
+    The marker file near it keeps URL and validators of the response,
+    so the next run can request only the rest of the body.
+    """
+
+    def __init__(
+        self,
+        wallpaper_path: str,
+        wallpaper_url: Union[str, None] = None,
+    ) -> None:
+        """
+        Initialize paths of the partial file and of the marker.
+
+        Args:
+            wallpaper_path (str): absolute path of the wallpaper.
+            wallpaper_url (Union[str, None], optional): URL of the wallpaper.
+        """
+        directory_path, wallpaper_name = os.path.split(wallpaper_path)
+        self.wallpaper_url = wallpaper_url
+        self.part_path = os.path.join(
+            directory_path,
+            f".{wallpaper_name}.part",
+        )
+        self.marker_path = f"{self.part_path}.json"
+        self.size = 0
+        self.etag = None
+        self.last_modified = None
+
+    def load(self) -> bool:
+        """
+        Read the marker of the partial file left by the previous run.
+
+        The partial file which can't be resumed is removed.
+
+        Returns:
+            bool: True if the download can be resumed.
+        """
+        try:
+            with open(self.marker_path) as marker_file:
+                marker = json.load(marker_file)
+            self.size = os.stat(self.part_path).st_size
+        except (OSError, ValueError):
+            self.discard()
+            return False
+
+        self.etag = marker.get("etag")
+        self.last_modified = marker.get("last_modified")
+        if (
+            marker.get("url") != self.wallpaper_url or
+            not self.size or
+            not (self.etag or self.last_modified)
+        ):
+            self.discard()
+            return False
+        return True
+
+    def get_range_headers(self) -> dict:
+        """
+        Get headers for request of the rest of the body.
+
+        Returns:
+            dict: 'Range' and 'If-Range' headers or empty dict if
+                there is nothing to resume.
+        """
+        if not self.size or not (self.etag or self.last_modified):
+            return {}
+        return {
+            "Range": f"bytes={self.size}-",
+            "If-Range": self.etag or self.last_modified,
+        }
+
+    def mark(
+        self,
+        etag: Union[str, None],
+        last_modified: Union[str, None],
+    ) -> None:
+        """
+        Write the marker which allows to resume the download.
+
+        Args:
+            etag (Union[str, None]): ETag of the response.
+            last_modified (Union[str, None]): Last-Modified of the response.
+        """
+        self.etag = etag
+        self.last_modified = last_modified
+        with open(self.marker_path, "w") as marker_file:
+            json.dump(
+                {
+                    "url": self.wallpaper_url,
+                    "etag": etag,
+                    "last_modified": last_modified,
+                },
+                marker_file,
+            )
+
+    def open(self, resume: bool) -> tuple:
+        """
+        Open the partial file for writing.
+
+        Args:
+            resume (bool): append to the existing partial file.
+
+        Returns:
+            tuple: the opened file and the hash object of its content.
+        """
+        wallpaper_hash = hashlib.sha256()
+        if not resume:
+            self.size = 0
+            return open(self.part_path, "wb"), wallpaper_hash
+
+        with open(self.part_path, "rb") as part_file:
+            for chunk in iter(lambda: part_file.read(1024 * 1024), b""):
+                wallpaper_hash.update(chunk)
+        return open(self.part_path, "ab"), wallpaper_hash
+
+    def complete(self, wallpaper_path: str) -> None:
+        """
+        Move the complete partial file to the wallpaper path.
+
+        Args:
+            wallpaper_path (str): absolute path of the wallpaper.
+        """
+        os.replace(self.part_path, wallpaper_path)
+        self._remove(self.marker_path)
+
+    def discard(self) -> None:
+        """Remove the partial file and the marker."""
+        self.size = 0
+        self._remove(self.part_path)
+        self._remove(self.marker_path)
+
+    def _remove(self, path: str) -> None:
+        """
+        Remove the file if it exists.
+
+        Args:
+            path (str): absolute path of the file.
+        """
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,152 @@
+import contextlib
+import contextvars
+import threading
+import time
+from typing import ContextManager
+
+# Phases in the order of the run.
+PHASES = (
+    "plan",
+    "category crawl",
+    "month page fetch",
+    "parse",
+    "directory setup",
+    "download",
+    "write",
+)
+
+_current_phase = contextvars.ContextVar("current_phase", default=None)
+
+
+class _PhaseFrame:
+    """Time of phases nested in the running phase."""
+
+    def __init__(self) -> None:
+        """Initialize the frame without nested phases."""
+        self.nested_wall_time = 0.0
+        self.nested_cpu_time = 0.0
+
+
+class Profiler:
+    """
+    Wall and CPU time of phases of the run.
+
+    Phases may be nested, the time of the nested phase is excluded from
+    the time of the outer phase. Phases of concurrent tasks overlap, so
+    the sum of wall times can exceed the wall time of the run. CPU time is
+    measured in the thread which entered the phase, so it also includes
+    other tasks of the event loop which ran while the phase was awaiting.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty statistics."""
+        self.phases = {}
+        self._lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def phase(self, name: str):
+        """
+        Measure the code in the block as the phase.
+
+        Args:
+            name (str): name of the phase.
+
+        Yields:
+            None: the block is executed.
+        """
+        frame = _PhaseFrame()
+        token = _current_phase.set(frame)
+        start_wall_time = time.perf_counter()
+        start_cpu_time = time.thread_time()
+        try:
+            yield
+        finally:
+            wall_time = time.perf_counter() - start_wall_time
+            cpu_time = time.thread_time() - start_cpu_time
+            _current_phase.reset(token)
+            parent_frame = _current_phase.get()
+            if parent_frame is not None:
+                parent_frame.nested_wall_time += wall_time
+                parent_frame.nested_cpu_time += cpu_time
+            self._record(
+                name,
+                wall_time - frame.nested_wall_time,
+                cpu_time - frame.nested_cpu_time,
+            )
+
+    def _record(self, name: str, wall_time: float, cpu_time: float) -> None:
+        """
+        Add the exclusive time of one call of the phase.
+
+        Args:
+            name (str): name of the phase.
+            wall_time (float): wall time in seconds.
+            cpu_time (float): CPU time in seconds.
+        """
+        with self._lock:
+            calls, total_wall_time, total_cpu_time = self.phases.get(
+                name,
+                (0, 0.0, 0.0),
+            )
+            self.phases[name] = (
+                calls + 1,
+                total_wall_time + wall_time,
+                total_cpu_time + cpu_time,
+            )
+
+    def get_table(self) -> list:
+        """
+        Get lines of the table of phases.
+
+        Returns:
+            list: header and one line for every measured phase.
+        """
+        names = [name for name in PHASES if name in self.phases]
+        names.extend(sorted(set(self.phases) - set(PHASES)))
+        lines = [f"{'phase':<18}{'calls':>7}{'wall s':>10}{'cpu s':>10}"]
+        for name in names:
+            calls, wall_time, cpu_time = self.phases[name]
+            lines.append(
+                f"{name:<18}{calls:>7}{wall_time:>10.3f}{cpu_time:>10.3f}",
+            )
+        return lines
+
+
+# The profiler of the run, 'None' if profiling is disabled.
+_profiler = None
+
+
+def set_profiler(profiler: Profiler) -> None:
+    """
+    Set the profiler shared by the parser and the downloader.
+
+    Args:
+        profiler (Profiler): the profiler or 'None' to disable profiling.
+    """
+    global _profiler
+    _profiler = profiler
+
+
+def get_profiler() -> Profiler:
+    """
+    Get the profiler shared by the parser and the downloader.
+
+    Returns:
+        Profiler: the profiler or 'None' if profiling is disabled.
+    """
+    return _profiler
+
+
+def phase(name: str) -> ContextManager:
+    """
+    Measure the block as the phase if profiling is enabled.
+
+    Args:
+        name (str): name of the phase.
+
+    Returns:
+        ContextManager: context manager of the phase.
+    """
+    if _profiler is None:
+        return contextlib.nullcontext()
+    return _profiler.phase(name)
@@ -0,0 +1,163 @@
+import asyncio
+import threading
+import time
+from typing import Union
+from urllib.parse import urlsplit
+
+# Kinds of requests with separate budgets.
+HTML = "html"
+IMAGE = "image"
+
+
+class TokenBucket:
+    """
+    Token bucket which paces requests to the constant rate.
+
+    The bucket is filled with 'rate' tokens per second up to 'capacity'
+    tokens. Every request takes one token. A request which finds the
+    bucket empty reserves the next token and waits for it, so waiting
+    requests are spread evenly instead of retrying at once.
+    """
+
+    def __init__(self, rate: float, capacity: int = 1) -> None:
+        """
+        Initialize the full bucket.
+
+        Args:
+            rate (float): number of requests per second.
+            capacity (int, optional): number of requests which can be sent
+                in a burst. Defaults to 1.
+        """
+        self.rate = rate
+        self.capacity = max(capacity, 1)
+        self.tokens = float(self.capacity)
+        self.updated_time = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Take the token for the request.
+
+        Returns:
+            float: seconds which the request has to wait for the token.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(
+                self.tokens + (now - self.updated_time) * self.rate,
+                self.capacity,
+            )
+            self.updated_time = now
+            self.tokens -= 1
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.rate
+
+
+class RateLimiter:
+    """
+    Token buckets of requests keyed by host and kind of requests.
+
+    HTML pages and images have separate budgets, so downloads of images
+    don't delay parsing and vice versa.
+    """
+
+    def __init__(
+        self,
+        html_rate: Union[float, None] = None,
+        image_rate: Union[float, None] = None,
+        burst: int = 1,
+    ) -> None:
+        """
+        Initialize the limiter. Buckets are created on the first request.
+
+        Args:
+            html_rate (Union[float, None], optional): HTML requests per second
+                to one host. 'None' or 0 disables the limit.
+            image_rate (Union[float, None], optional): requests of images per
+                second to one host. 'None' or 0 disables the limit.
+            burst (int, optional): number of requests of one kind to one
+                host which can be sent in a burst. Defaults to 1.
+        """
+        self.rates = {HTML: html_rate, IMAGE: image_rate}
+        self.burst = burst
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def _get_bucket(self, url: str, kind: str) -> Union[TokenBucket, None]:
+        """
+        Get the bucket of the host of URL.
+
+        Args:
+            url (str): URL of the request.
+            kind (str): 'html' or 'image'.
+
+        Returns:
+            Union[TokenBucket, None]: the bucket or 'None' if requests of
+                this kind are not limited.
+        """
+        rate = self.rates.get(kind)
+        if not rate:
+            return None
+        key = (urlsplit(url).netloc, kind)
+        with self._lock:
+            if key not in self._buckets:
+                self._buckets[key] = TokenBucket(rate, self.burst)
+            return self._buckets[key]
+
+    def get_delay(self, url: str, kind: str) -> float:
+        """
+        Take the token for the request.
+
+        Args:
+            url (str): URL of the request.
+            kind (str): 'html' or 'image'.
+
+        Returns:
+            float: seconds which the request has to wait.
+        """
+        bucket = self._get_bucket(url, kind)
+        if bucket is None:
+            return 0.0
+        return bucket.reserve()
+
+
+# The limiter shared by the parser and the downloader.
+_rate_limiter = RateLimiter()
+
+
+def set_rate_limiter(limiter: RateLimiter) -> None:
+    """
+    Set the limiter shared by all requests of the process.
+
+    Args:
+        limiter (RateLimiter): the limiter.
+    """
+    global _rate_limiter
+    _rate_limiter = limiter
+
+
+def wait(url: str, kind: str = HTML) -> None:
+    """
+    Block until the request can be sent.
+
+    Args:
+        url (str): URL of the request.
+        kind (str, optional): 'html' or 'image'. Defaults to 'html'.
+    """
+    delay = _rate_limiter.get_delay(url, kind)
+    if delay:
+        time.sleep(delay)
+
+
+async def wait_async(url: str, kind: str = HTML) -> None:
+    """
+    Wait until the request can be sent without blocking the event loop.
+
+    Args:
+        url (str): URL of the request.
+        kind (str, optional): 'html' or 'image'. Defaults to 'html'.
+    """
+    delay = _rate_limiter.get_delay(url, kind)
+    if delay:
+        await asyncio.sleep(delay)
@@ -0,0 +1,194 @@
+import asyncio
+import random
+import threading
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Union
+
+import aiohttp
+import requests
+
+from wallpaper_downloader import app_logger
+
+logger = app_logger.get_logger(__name__)
+
+# Statuses of temporary failures of the server.
+RETRYABLE_STATUSES = frozenset({408, 425, 429, 500, 502, 503, 504})
+# Errors of the connection after which the request can be repeated.
+RETRYABLE_EXCEPTIONS = (
+    asyncio.TimeoutError,
+    aiohttp.ClientConnectionError,
+    aiohttp.ClientPayloadError,
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+    requests.exceptions.ChunkedEncodingError,
+)
+
+
+def parse_retry_after(value: Union[str, None]) -> Union[float, None]:
+    """
+    Convert the value of 'Retry-After' header to seconds.
+
+    Args:
+        value (Union[str, None]): number of seconds or HTTP date.
+
+    Returns:
+        Union[float, None]: seconds to wait or 'None' if the value is
+            missing or broken.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_dt = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_dt.tzinfo is None:
+        retry_dt = retry_dt.replace(tzinfo=timezone.utc)
+    return max((retry_dt - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+class RetryPolicy:
+    """
+    Retries of failed requests with exponential backoff and full jitter.
+
+    The number of retries in the run is limited by the budget, so retries
+    don't multiply the load on the server during an outage.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 1,
+        base_delay: float = 0.5,
+        max_delay: float = 30.0,
+        budget: int = 50,
+    ) -> None:
+        """
+        Initialize the policy.
+
+        Args:
+            max_attempts (int, optional): maximum number of attempts of one
+                request including the first one. Defaults to 1 (no retries).
+            base_delay (float, optional): maximum delay before the first
+                retry in seconds. Doubled with every next retry.
+                Defaults to 0.5.
+            max_delay (float, optional): maximum delay before the retry
+                in seconds, also limits 'Retry-After'. Defaults to 30.
+            budget (int, optional): maximum number of retries in the run.
+                Defaults to 50.
+        """
+        self.max_attempts = max(max_attempts, 1)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.budget = budget
+        self.retries_count = 0
+        self.denied_retries_count = 0
+        self._lock = threading.Lock()
+
+    def is_retryable_status(self, status: int) -> bool:
+        """
+        Check that the request with the response status can be repeated.
+
+        Args:
+            status (int): status of the response.
+
+        Returns:
+            bool: True if the failure is temporary.
+        """
+        return status in RETRYABLE_STATUSES
+
+    def is_retryable_error(self, error: BaseException) -> bool:
+        """
+        Check that the request which raised the error can be repeated.
+
+        Args:
+            error (BaseException): raised error.
+
+        Returns:
+            bool: True if the failure is temporary.
+        """
+        return isinstance(error, RETRYABLE_EXCEPTIONS)
+
+    def should_retry(self, attempt: int, url: str) -> bool:
+        """
+        Take the retry from the budget if the request can be repeated.
+
+        Args:
+            attempt (int): number of the failed attempt starting from 0.
+            url (str): URL of the request.
+
+        Returns:
+            bool: True if the request should be repeated.
+        """
+        if attempt + 1 >= self.max_attempts:
+            return False
+        with self._lock:
+            if self.retries_count >= self.budget:
+                self.denied_retries_count += 1
+                if self.denied_retries_count == 1:
+                    logger.warning("Budget of retries is exhausted.")
+                return False
+            self.retries_count += 1
+        logger.info(f"Request of '{url}' will be repeated.")
+        return True
+
+    def get_delay(
+        self,
+        attempt: int,
+        retry_after: Union[str, None] = None,
+    ) -> float:
+        """
+        Get the delay before the retry.
+
+        Args:
+            attempt (int): number of the failed attempt starting from 0.
+            retry_after (Union[str, None], optional): value of 'Retry-After'
+                header of the response.
+
+        Returns:
+            float: seconds to wait.
+        """
+        retry_after_delay = parse_retry_after(retry_after)
+        if retry_after_delay is not None:
+            return min(retry_after_delay, self.max_delay)
+        backoff = min(self.base_delay * 2 ** attempt, self.max_delay)
+        return random.uniform(0, backoff)
+
+    def get_summary(self) -> str:
+        """
+        Get the description of retries of the run.
+
+        Returns:
+            str: numbers of performed and denied retries.
+        """
+        return (
+            f"Retries: {self.retries_count} of {self.budget}, "
+            f"denied by the budget: {self.denied_retries_count}."
+        )
+
+
+# The policy shared by the parser and the downloader.
+_retry_policy = RetryPolicy()
+
+
+def set_retry_policy(policy: RetryPolicy) -> None:
+    """
+    Set the policy shared by all requests of the process.
+
+    Args:
+        policy (RetryPolicy): the policy.
+    """
+    global _retry_policy
+    _retry_policy = policy
+
+
+def get_retry_policy() -> RetryPolicy:
+    """
+    Get the policy shared by all requests of the process.
+
+    Returns:
+        RetryPolicy: the policy.
+    """
+    return _retry_policy
@@ -1,17 +1,237 @@
+import asyncio
+import functools
+import re
+import time
+import weakref
 from contextlib import closing
 from datetime import datetime
-from typing import Union
+from typing import Any, Callable, NamedTuple, Union
 
+import aiohttp
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, FeatureNotFound, SoupStrainer
+from requests.adapters import HTTPAdapter
 
-from wallpaper_downloader import app_logger
+from wallpaper_downloader import (
+    app_logger,
+    metrics,
+    profiler,
+    rate_limiter,
+    retry,
+)
+from wallpaper_downloader.http_cache import Page, PageCache
+from wallpaper_downloader.month_index import MonthIndex
+from wallpaper_downloader.page_search import PageSearch
 
 
 # Init logger.
 logger = app_logger.get_logger(__name__)
 
 
+BASE_URL = "https://smashingmagazine.com"
+WALLPAPERS_CATEGORY_URL = "/category/wallpapers/"
+WALLPAPERS_CATEGORY_PAGE_URL = "/categories/wallpapers/page/{page_number}/"
+RESPONSE_STATUS_NOT_FOUND = 404
+RESPONSE_STATUS_NOT_MODIFIED = 304
+
+# URL of wallpapers page ends with month and year ('...-july-2020/').
+WALLPAPERS_PAGE_URL_PATTERN = re.compile(
+    r"-(january|february|march|april|may|june|july|august|september|"
+    r"october|november|december)-(\d{4})/?$",
+)
+
+# Timeouts of requests of the sync parser in seconds (connect, read).
+HTTP_TIMEOUT = (10, 30)
+# Number of connections to every host kept alive by the sync parser.
+HTTP_POOL_SIZE = 10
+
+# Tags used by the finders of the module. In the restricted mode
+# only these tags (with their content) are built by BeautifulSoup.
+PARSED_TAGS = ("a", "h1", "h2", "h3", "li")
+
+
+def _get_default_html_parser() -> str:
+    """
+    Get the fastest parser backend of BeautifulSoup which is installed.
+
+    Returns:
+        str: 'lxml' if lxml is installed, otherwise 'html.parser'.
+    """
+    try:
+        import lxml  # noqa: F401
+    except ImportError:
+        return "html.parser"
+    return "lxml"
+
+
+html_parser = _get_default_html_parser()
+restricted_parsing = False
+
+
+def set_html_parser(
+    parser: Union[str, None] = None,
+    restricted: bool = False,
+) -> None:
+    """
+    Set the parser backend of BeautifulSoup for all parsed pages.
+
+    Args:
+        parser (Union[str, None], optional): name of the parser backend
+            ('lxml', 'html.parser', 'html5lib'). The fastest installed
+            backend is used if None. Defaults to None.
+        restricted (bool, optional): build only tags used by the finders.
+            Defaults to False.
+
+    Raises:
+        SystemExit: if the parser backend is not installed.
+    """
+    global html_parser, restricted_parsing
+
+    parser = parser or _get_default_html_parser()
+    try:
+        BeautifulSoup("", parser)
+    except FeatureNotFound:
+        logger.error(
+            f"HTML parser '{parser}' is not installed. "
+            "Please install it or choose another parser."
+        )
+        raise SystemExit
+    html_parser = parser
+    restricted_parsing = restricted
+
+
+def _parse_html(markup: Union[str, bytes]) -> BeautifulSoup:
+    """
+    Parse HTML with the configured parser backend.
+
+    Args:
+        markup (Union[str, bytes]): HTML of the page.
+
+    Returns:
+        BeautifulSoup: parsed HTML.
+    """
+    parse_only = SoupStrainer(PARSED_TAGS) if restricted_parsing else None
+    parse_start_time = time.monotonic()
+    with profiler.phase("parse"):
+        page_html = BeautifulSoup(markup, html_parser, parse_only=parse_only)
+    metrics.get_metrics().observe(
+        "parse_seconds",
+        time.monotonic() - parse_start_time,
+    )
+    return page_html
+
+
+month_index = None
+page_cache = None
+# 'jump' estimates the number of the category page with requested month,
+# 'linear' follows links to the next page from the first page.
+page_search_mode = "jump"
+# Number of category pages requested concurrently by the async parser.
+page_search_window = 3
+
+
+def set_page_search(mode: str = "jump", window: int = 3) -> None:
+    """
+    Set the way in which category pages are searched.
+
+    Args:
+        mode (str, optional): 'jump' to estimate the number of the page
+            with wallpapers or 'linear' to follow pages one by one.
+            Defaults to 'jump'.
+        window (int, optional): number of category pages requested
+            concurrently by the async parser in 'jump' mode. Defaults to 3.
+    """
+    global page_search_mode, page_search_window
+    page_search_mode = mode
+    page_search_window = max(window, 1)
+
+
+def set_page_cache(cache: Union[PageCache, None]) -> None:
+    """
+    Set the on-disk cache of HTML pages.
+
+    Cached pages are revalidated with conditional requests.
+
+    Args:
+        cache (Union[PageCache, None]): the cache or None to disable it.
+    """
+    global page_cache
+    page_cache = cache
+
+
+def set_month_index(index: Union[MonthIndex, None]) -> None:
+    """
+    Set the persistent index of wallpapers pages URLs.
+
+    Every parsed category page is added to the index and indexed months
+    are resolved without requests to category pages.
+
+    Args:
+        index (Union[MonthIndex, None]): the index or None to disable it.
+    """
+    global month_index
+    month_index = index
+
+
+http_session = None
+
+
+def create_http_session(pool_size: int = HTTP_POOL_SIZE) -> requests.Session:
+    """
+    Create the session of the sync parser with the pool of connections.
+
+    Args:
+        pool_size (int, optional): number of connections to every host
+            kept alive. Defaults to HTTP_POOL_SIZE.
+
+    Returns:
+        requests.Session: the session.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def set_http_session(session: Union[requests.Session, None]) -> None:
+    """
+    Set the session shared by all requests of the sync parser.
+
+    Args:
+        session (Union[requests.Session, None]): the session or None to
+            create the default one on the next request.
+    """
+    global http_session
+    http_session = session
+
+
+def _get_http_session() -> requests.Session:
+    """
+    Get the session shared by all requests of the sync parser.
+
+    Connections of the session are kept alive, so pages of the same host
+    are requested without new TCP and TLS handshakes.
+
+    Returns:
+        requests.Session: the session.
+    """
+    global http_session
+    if http_session is None:
+        http_session = create_http_session()
+    return http_session
+
+
+class WallpapersPageIndex(NamedTuple):
+    """Wallpapers names and URLs collected from the page in one pass."""
+
+    names: list
+    titles: dict
+
+
 def format_month_year(month_year: str) -> tuple:
     """
     Convert month and year in correct format for parsing.
@@ -38,6 +258,40 @@ def format_month_year(month_year: str) -> tuple:
         raise SystemExit
 
 
+def get_months_years(from_month_year: str, to_month_year: str) -> list:
+    """
+    Get all months between two months inclusive.
+
+    Args:
+        from_month_year (str): the first month in 'mm-yyyy' format.
+        to_month_year (str): the last month in 'mm-yyyy' format.
+
+    Raises:
+        SystemExit: if months have incorrect format or
+            the first month is after the last month.
+
+    Returns:
+        list: months in 'mm-yyyy' format from the first to the last.
+    """
+    format_month_year(from_month_year)
+    format_month_year(to_month_year)
+    from_dt = datetime.strptime(from_month_year, "%m-%Y")
+    to_dt = datetime.strptime(to_month_year, "%m-%Y")
+    if from_dt > to_dt:
+        logger.error(
+            f"The first month '{from_month_year}' is after "
+            f"the last month '{to_month_year}'."
+        )
+        raise SystemExit
+
+    months_years = []
+    month, year = from_dt.month, from_dt.year
+    while (year, month) <= (to_dt.year, to_dt.month):
+        months_years.append(f"{month:02}-{year}")
+        month, year = (1, year + 1) if month == 12 else (month + 1, year)
+    return months_years
+
+
 def _is_good_response(response: requests.models.Response) -> bool:
     """
     Check the correctness of response.
@@ -57,29 +311,412 @@ def _is_good_response(response: requests.models.Response) -> bool:
     )
 
 
-def _get_page_html(page_url: str) -> BeautifulSoup:
+async def _run_blocking(func: Callable, *args) -> Any:
+    """
+    Call the blocking function in the default executor of the loop.
+
+    Files of the page cache and of the month index are read and written
+    by the async parser this way, so they don't stall downloads.
+
+    Args:
+        func (Callable): blocking function.
+        *args: positional arguments of the function.
+
+    Returns:
+        Any: result of the function.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, functools.partial(func, *args))
+
+
+def _load_cached_page(page_url: str) -> Union[Page, None]:
+    """
+    Get the page from the cache if the cache is enabled.
+
+    Args:
+        page_url (str): URL of the page.
+
+    Returns:
+        Union[Page, None]: the cached page or 'None'.
+    """
+    if page_cache is None:
+        return None
+    return page_cache.load(page_url)
+
+
+def _get_conditional_headers(cached_page: Union[Page, None]) -> dict:
+    """
+    Get headers for revalidation of the cached page.
+
+    Args:
+        cached_page (Union[Page, None]): the cached page.
+
+    Returns:
+        dict: conditional headers or empty dict if the page is not cached.
+    """
+    if page_cache is None:
+        return {}
+    return page_cache.get_conditional_headers(cached_page)
+
+
+def _store_page(page_url: str, body: bytes, headers) -> Page:
+    """
+    Put the downloaded page to the cache if the cache is enabled.
+
+    Args:
+        page_url (str): URL of the page.
+        body (bytes): body of the page.
+        headers: headers of the response.
+
+    Returns:
+        Page: the downloaded page.
+    """
+    if page_cache is None:
+        return Page(page_url, body)
+    return page_cache.store(page_url, body, headers)
+
+
+def _parse_page(page: Page) -> BeautifulSoup:
+    """
+    Parse HTML of the page unless it was parsed and not changed.
+
+    Args:
+        page (Page): the page.
+
+    Returns:
+        BeautifulSoup: HTML from the page.
+    """
+    if page_cache is None:
+        return _parse_html(page.body)
+    page_html = page_cache.get_parsed_html(page) if page.unchanged else None
+    if page_html is None:
+        page_html = _parse_html(page.body)
+        page_cache.set_parsed_html(page, page_html)
+    return page_html
+
+
+def _observe_html_request(request_start_time: float, status: int) -> None:
+    """
+    Add the request of the HTML page to metrics of the run.
+
+    Args:
+        request_start_time (float): monotonic time of the start of the request.
+        status (int): status of the response.
+    """
+    run_metrics = metrics.get_metrics()
+    run_metrics.increment("html_pages_total")
+    if status == RESPONSE_STATUS_NOT_MODIFIED:
+        run_metrics.increment("html_pages_not_modified_total")
+    run_metrics.observe(
+        "html_request_seconds",
+        time.monotonic() - request_start_time,
+    )
+
+
+def _download_page(
+    page_url: str,
+    missing_ok: bool = False,
+) -> Union[Page, None]:
+    """
+    Get the page for URL. The cached page is revalidated.
+
+    Args:
+        page_url (str): URL of the page.
+        missing_ok (bool, optional): return None if the page does not exist.
+            Defaults to False.
+
+    Raises:
+        SystemExit: response is not OK or raise RequestException.
+
+    Returns:
+        Union[Page, None]: the page or
+            'None' if the page does not exist and missing_ok is True.
+    """
+    cached_page = _load_cached_page(page_url)
+    headers = _get_conditional_headers(cached_page)
+    retry_policy = retry.get_retry_policy()
+    attempt = 0
+    while True:
+        rate_limiter.wait(page_url, rate_limiter.HTML)
+        request_start_time = time.monotonic()
+        try:
+            with closing(
+                _get_http_session().get(
+                    page_url,
+                    headers=headers,
+                    timeout=HTTP_TIMEOUT,
+                ),
+            ) as response:
+                _observe_html_request(request_start_time, response.status_code)
+                if (
+                    cached_page is not None and
+                    response.status_code == RESPONSE_STATUS_NOT_MODIFIED
+                ):
+                    return cached_page._replace(unchanged=True)
+                if (
+                    missing_ok and
+                    response.status_code == RESPONSE_STATUS_NOT_FOUND
+                ):
+                    return None
+                if _is_good_response(response):
+                    return _store_page(
+                        page_url,
+                        response.content,
+                        response.headers,
+                    )
+                if not (
+                    retry_policy.is_retryable_status(response.status_code) and
+                    retry_policy.should_retry(attempt, page_url)
+                ):
+                    logger.error(f"Response for '{page_url}' is wrong.")
+                    raise SystemExit
+                delay = retry_policy.get_delay(
+                    attempt,
+                    response.headers.get("Retry-After"),
+                )
+        except requests.exceptions.RequestException as error:
+            if not (
+                retry_policy.is_retryable_error(error) and
+                retry_policy.should_retry(attempt, page_url)
+            ):
+                logger.error(f"Can't download HTML from - '{page_url}'.")
+                raise SystemExit
+            delay = retry_policy.get_delay(attempt)
+        time.sleep(delay)
+        attempt += 1
+
+
+def _get_page_html(
+    page_url: str,
+    missing_ok: bool = False,
+) -> Union[BeautifulSoup, None]:
     """
     Get HTML for URL.
 
     Args:
         page_url (str): URL of the page.
+        missing_ok (bool, optional): return None if the page does not exist.
+            Defaults to False.
 
     Raises:
         SystemExit: response is not OK or raise RequestException.
 
     Returns:
-        BeautifulSoup: HTML from the page.
+        Union[BeautifulSoup, None]: HTML from the page or
+            'None' if the page does not exist and missing_ok is True.
     """
-    try:
-        with closing(requests.get(page_url)) as response:
-            if not _is_good_response(response):
-                logger.error(f"Response for '{page_url}' is wrong.")
+    page = _download_page(page_url, missing_ok)
+    if page is None:
+        return None
+    return _parse_page(page)
+
+
+def _is_good_async_response(response: aiohttp.ClientResponse) -> bool:
+    """
+    Check the correctness of async response.
+
+    Args:
+        response (aiohttp.ClientResponse): response of
+            aiohttp.ClientSession.get(url).
+
+    Returns:
+        bool: True if response is OK.
+    """
+    content_type = response.headers.get("Content-Type", "").lower()
+    response_status_ok = 200
+    return response.status == response_status_ok and "html" in content_type
+
+
+async def _download_page_async(
+    page_url: str,
+    session: aiohttp.ClientSession,
+    missing_ok: bool = False,
+) -> Union[Page, None]:
+    """
+    Get the page for URL with the session shared with the downloader.
+
+    The cached page is revalidated. Files of the cache are read and
+    written outside of the event loop.
+
+    Args:
+        page_url (str): URL of the page.
+        session (aiohttp.ClientSession): session whose connections are
+            reused for all requests.
+        missing_ok (bool, optional): return None if the page does not exist.
+            Defaults to False.
+
+    Raises:
+        SystemExit: response is not OK or raise ClientError.
+
+    Returns:
+        Union[Page, None]: the page or
+            'None' if the page does not exist and missing_ok is True.
+    """
+    cached_page = await _run_blocking(_load_cached_page, page_url)
+    headers = _get_conditional_headers(cached_page)
+    retry_policy = retry.get_retry_policy()
+    attempt = 0
+    while True:
+        await rate_limiter.wait_async(page_url, rate_limiter.HTML)
+        request_start_time = time.monotonic()
+        try:
+            async with session.get(page_url, headers=headers) as response:
+                _observe_html_request(request_start_time, response.status)
+                if (
+                    cached_page is not None and
+                    response.status == RESPONSE_STATUS_NOT_MODIFIED
+                ):
+                    return cached_page._replace(unchanged=True)
+                if (
+                    missing_ok and
+                    response.status == RESPONSE_STATUS_NOT_FOUND
+                ):
+                    return None
+                if _is_good_async_response(response):
+                    page_content = await response.read()
+                    return await _run_blocking(
+                        _store_page,
+                        page_url,
+                        page_content,
+                        response.headers,
+                    )
+                if not (
+                    retry_policy.is_retryable_status(response.status) and
+                    retry_policy.should_retry(attempt, page_url)
+                ):
+                    logger.error(f"Response for '{page_url}' is wrong.")
+                    raise SystemExit
+                delay = retry_policy.get_delay(
+                    attempt,
+                    response.headers.get("Retry-After"),
+                )
+        except (aiohttp.ClientError, asyncio.TimeoutError) as error:
+            if not (
+                retry_policy.is_retryable_error(error) and
+                retry_policy.should_retry(attempt, page_url)
+            ):
+                logger.error(f"Can't download HTML from - '{page_url}'.")
                 raise SystemExit
-    except requests.exceptions.RequestException:
-        logger.error(f"Can't download HTML from - '{page_url}'.")
+            delay = retry_policy.get_delay(attempt)
+        await asyncio.sleep(delay)
+        attempt += 1
+
+
+async def _get_page_html_async(
+    page_url: str,
+    session: aiohttp.ClientSession,
+    missing_ok: bool = False,
+) -> Union[BeautifulSoup, None]:
+    """
+    Get HTML for URL with the session shared with the downloader.
+
+    Args:
+        page_url (str): URL of the page.
+        session (aiohttp.ClientSession): session whose connections are
+            reused for all requests.
+        missing_ok (bool, optional): return None if the page does not exist.
+            Defaults to False.
+
+    Raises:
+        SystemExit: response is not OK or raise ClientError.
+
+    Returns:
+        Union[BeautifulSoup, None]: HTML from the page or
+            'None' if the page does not exist and missing_ok is True.
+    """
+    page = await _download_page_async(page_url, session, missing_ok)
+    if page is None:
+        return None
+    return _parse_page(page)
+
+
+# Category pages requested in the session. Months resolved concurrently
+# in one session share requests and parsing of category pages.
+_category_pages = weakref.WeakKeyDictionary()
+
+
+async def _get_category_page_html_async(
+    page_url: str,
+    session: aiohttp.ClientSession,
+    missing_ok: bool = False,
+) -> Union[BeautifulSoup, None]:
+    """
+    Get HTML of the category page once per session.
+
+    Concurrent requests of the same page wait for the first one.
+
+    Args:
+        page_url (str): URL of the category page.
+        session (aiohttp.ClientSession): session whose connections are
+            reused for all requests.
+        missing_ok (bool, optional): return None if the page does not exist.
+            Defaults to False.
+
+    Raises:
+        SystemExit: response is not OK or raise ClientError.
+
+    Returns:
+        Union[BeautifulSoup, None]: HTML from the page or
+            'None' if the page does not exist and missing_ok is True.
+    """
+    session_pages = _category_pages.setdefault(session, {})
+    if page_url not in session_pages:
+        session_pages[page_url] = [asyncio.Lock(), None, False]
+    page_entry = session_pages[page_url]
+
+    async with page_entry[0]:
+        if not page_entry[2]:
+            page_entry[1] = await _get_page_html_async(
+                page_url,
+                session,
+                missing_ok=True,
+            )
+            page_entry[2] = True
+
+    if page_entry[1] is None and not missing_ok:
+        logger.error(f"Response for '{page_url}' is wrong.")
         raise SystemExit
-    else:
-        return BeautifulSoup(response.content, "html.parser")
+    return page_entry[1]
+
+
+async def _get_category_page_html_or_error_async(
+    page_url: str,
+    session: aiohttp.ClientSession,
+) -> Union[BeautifulSoup, None, SystemExit]:
+    """
+    Get HTML of the category page in the task of 'asyncio.gather'.
+
+    SystemExit raised in a task is not delivered to the awaiting
+    coroutine but stops the event loop, so it is returned instead and
+    raised again by the caller.
+
+    Args:
+        page_url (str): URL of the category page.
+        session (aiohttp.ClientSession): session whose connections are
+            reused for all requests.
+
+    Returns:
+        Union[BeautifulSoup, None, SystemExit]: HTML from the page,
+            'None' if the page does not exist or the error of the request.
+    """
+    try:
+        return await _get_category_page_html_async(
+            page_url,
+            session,
+            missing_ok=True,
+        )
+    except SystemExit as error:
+        return error
+
+
+def clear_category_pages(session: aiohttp.ClientSession) -> None:
+    """
+    Forget category pages requested in the session.
+
+    Args:
+        session (aiohttp.ClientSession): session of requests.
+    """
+    _category_pages.pop(session, None)
 
 
 def _find_next_page_url(page_html: BeautifulSoup, month_year: str) -> str:
@@ -104,141 +741,634 @@ def _find_next_page_url(page_html: BeautifulSoup, month_year: str) -> str:
         "pagination__next" in tag.parent.get("class"),
     )
 
-    try:
-        next_page_url = next_page_url_tag.get("href")
-    except AttributeError:
+    try:
+        next_page_url = next_page_url_tag.get("href")
+    except AttributeError:
+        logger.error(
+            "Couldn't find wallpapers page for "
+            f"'{month_year}' month and year."
+        )
+        raise SystemExit
+    else:
+        return next_page_url
+
+
+def _find_wallpapers_page_url(
+    page_html: BeautifulSoup,
+    month: str,
+    year: str,
+) -> Union[str, None]:
+    """
+    Parse HTML and search the URL of the page with wallpapers.
+
+    Args:
+        page_html (BeautifulSoup): HTML for parsing.
+        month (str): month in full name format ('august').
+        year (str): year in four-digit format ('2020').
+
+    Returns:
+        Union[str, None]: URL of wallpapers page or
+            'None' if URL does not exist.
+    """
+    wallpapers_page_url_tag = page_html.find(
+        lambda tag:
+        tag.name == "a" and
+        tag.parent.name in {"h1", "h2"} and
+        tag.get("href") and
+        f"{month}-{year}" in tag.get("href")
+    )
+    if wallpapers_page_url_tag:
+        return wallpapers_page_url_tag.get("href")
+    return None
+
+
+def _index_wallpapers_page(page_html: BeautifulSoup) -> WallpapersPageIndex:
+    """
+    Walk HTML of the page with wallpapers once and index it.
+
+    Names of wallpapers and URLs of all titled links (all resolutions) are
+    collected in one traversal of the tree, so the lookups of names, URLs
+    and resolutions don't scan the whole page again.
+
+    Args:
+        page_html (BeautifulSoup): HTML for parsing.
+
+    Returns:
+        WallpapersPageIndex: names of wallpapers and URLs of links in
+            '{title: [url1, url2]}' format.
+    """
+    names = []
+    titles = {}
+    for tag in page_html.find_all(["h3", "a"]):
+        if tag.name == "h3":
+            if tag.get("id") and "Join In Next Month!" not in tag.text:
+                names.append(tag.text.strip())
+        elif tag.get("title") is not None:
+            titles.setdefault(tag.get("title"), []).append(tag.get("href"))
+    return WallpapersPageIndex(names, titles)
+
+
+def _get_wallpapers_page_index(page: Page) -> WallpapersPageIndex:
+    """
+    Get the index of the page with wallpapers.
+
+    The index of the page which is not changed since the last run is
+    taken from the cache without parsing of HTML.
+
+    Args:
+        page (Page): the page with wallpapers.
+
+    Returns:
+        WallpapersPageIndex: names of wallpapers and URLs of links.
+    """
+    if page_cache is not None and page.unchanged:
+        cached_index = page_cache.load_parsed(page, "wallpapers_page_index")
+        if cached_index is not None:
+            return WallpapersPageIndex(**cached_index)
+
+    page_index = _index_wallpapers_page(_parse_page(page))
+    if page_cache is not None:
+        page_cache.store_parsed(
+            page,
+            "wallpapers_page_index",
+            page_index._asdict(),
+        )
+    return page_index
+
+
+async def _get_wallpapers_page_index_async(
+    page: Page,
+) -> WallpapersPageIndex:
+    """
+    Get the index of the page with wallpapers in the async parser.
+
+    The cached index is read and written outside of the event loop.
+
+    Args:
+        page (Page): the page with wallpapers.
+
+    Returns:
+        WallpapersPageIndex: names of wallpapers and URLs of links.
+    """
+    if page_cache is not None and page.unchanged:
+        cached_index = await _run_blocking(
+            page_cache.load_parsed,
+            page,
+            "wallpapers_page_index",
+        )
+        if cached_index is not None:
+            return WallpapersPageIndex(**cached_index)
+
+    page_index = _index_wallpapers_page(_parse_page(page))
+    if page_cache is not None:
+        await _run_blocking(
+            page_cache.store_parsed,
+            page,
+            "wallpapers_page_index",
+            page_index._asdict(),
+        )
+    return page_index
+
+
+def _find_wallpapers_pages_urls(page_html: BeautifulSoup) -> dict:
+    """
+    Parse HTML of the category page and search all wallpapers pages URLs.
+
+    Args:
+        page_html (BeautifulSoup): HTML for parsing.
+
+    Returns:
+        dict: URLs of wallpapers pages in '{month-year: page_url}' format.
+            Example - {'july-2020': '/2020/06/...-july-2020/'}.
+    """
+    pages_urls = {}
+    for tag in page_html.find_all("a", href=WALLPAPERS_PAGE_URL_PATTERN):
+        if tag.parent.name not in {"h1", "h2"}:
+            continue
+        page_url = tag.get("href")
+        month, year = WALLPAPERS_PAGE_URL_PATTERN.search(page_url).groups()
+        pages_urls.setdefault(f"{month}-{year}", page_url)
+    return pages_urls
+
+
+def _index_category_page(page_html: BeautifulSoup) -> None:
+    """
+    Add wallpapers pages URLs from the category page to the month index.
+
+    Args:
+        page_html (BeautifulSoup): HTML of the category page.
+    """
+    if month_index is not None:
+        month_index.update(_find_wallpapers_pages_urls(page_html))
+
+
+async def _index_category_page_async(page_html: BeautifulSoup) -> None:
+    """
+    Add wallpapers pages URLs from the category page to the month index.
+
+    The changed index is saved outside of the event loop.
+
+    Args:
+        page_html (BeautifulSoup): HTML of the category page.
+    """
+    if month_index is not None and month_index.update(
+        _find_wallpapers_pages_urls(page_html),
+        save=False,
+    ):
+        await _run_blocking(month_index.save)
+
+
+def _find_indexed_wallpapers_page_url(
+    month: str,
+    year: str,
+) -> Union[str, None]:
+    """
+    Search URL of the page with wallpapers in the month index.
+
+    Args:
+        month (str): month in full name format ('august').
+        year (str): year in four-digit format ('2020').
+
+    Returns:
+        Union[str, None]: URL of wallpapers page or
+            'None' if the month is not indexed.
+    """
+    if month_index is None:
+        return None
+    wallpapers_page_url = month_index.get(month, year)
+    if wallpapers_page_url is not None:
+        logger.info(f"URL of wallpapers for '{month}-{year}' found in index.")
+    return wallpapers_page_url
+
+
+def _find_wallpaper_urls(
+    page_html: BeautifulSoup,
+    title: str,
+    page_index: WallpapersPageIndex = None,
+) -> Union[list, None]:
+    """
+    Parse HTML and search URLs of the wallpaper.
+
+    One wallpaper has two URLs. For wallpapers with and without calendar.
+
+    Args:
+        page_html (BeautifulSoup): HTML for parsing.
+        title (str): title in 'Wallpaper name - resolution' format.
+            Example - 'Beautiful image - 1920x1080'.
+        page_index (WallpapersPageIndex, optional): index of the page.
+            Built from page_html if not passed.
+
+    Returns:
+        Union[list, None]: URLs of wallpapers or
+            'None' if URLs of wallpapers does not exist.
+    """
+    if page_index is None:
+        page_index = _index_wallpapers_page(page_html)
+
+    wallpaper_urls = page_index.titles.get(title)
+    if wallpaper_urls:
+        return list(wallpaper_urls)
+    return None
+
+
+def _get_newest_wallpapers_month_year(page_html: BeautifulSoup) -> tuple:
+    """
+    Parse HTML and search month and year of the newest wallpapers.
+
+    Args:
+        page_html (BeautifulSoup): HTML for parsing.
+
+    Raises:
+        SystemExit: if the URL of the newest wallpapers does not exist.
+
+    Returns:
+        tuple: month and year the newest wallpapers
+            in format ('july', '2020').
+    """
+    wallpapers_url_tag = page_html.find(
+        lambda tag:
+        tag.name == 'a' and
+        tag.parent.name == "h2" and
+        tag.parent.get("class") and
+        "tilted-featured-article__title" in tag.parent.get("class")
+    )
+    if wallpapers_url_tag:
+        wallpapers_url = wallpapers_url_tag.get("href")
+        divided_wallpapers_url = wallpapers_url.split("-")
+        month = divided_wallpapers_url[-2]
+        year = divided_wallpapers_url[-1].rstrip("/")
+        return month, year
+
+    logger.error(
+        "Something went wrong. Couldn't find url the newest wallpapers.",
+    )
+    raise SystemExit
+
+
+def is_month_year_in_future(
+    page_html: BeautifulSoup,
+    month: str,
+    year: str,
+) -> bool:
+    """
+    Return result of compare request date to the newest wallpapers date.
+
+    Args:
+        page_html (BeautifulSoup): HTML for parsing.
+        month (str): month in full name format ('august').
+        year (str): year in four-digit format ('2020').
+
+    Returns:
+        bool: True if requested date newer than the newest wallpapers date.
+    """
+    newest_wallpapers_month_year = _get_newest_wallpapers_month_year(page_html)
+    newest_dt = datetime.strptime(
+        "-".join(newest_wallpapers_month_year),
+        "%B-%Y",
+    )
+    requested_dt = datetime.strptime(f"{month}-{year}", "%B-%Y")
+    return requested_dt > newest_dt
+
+
+def _get_cached_newest_month_year(page: Page) -> str:
+    """
+    Get month and year of the newest wallpapers from the category page.
+
+    The result is stored with the cached page, so the page which was not
+    changed since the previous check is not parsed again.
+
+    Args:
+        page (Page): the first category page.
+
+    Raises:
+        SystemExit: if the URL of the newest wallpapers does not exist.
+
+    Returns:
+        str: month and year in 'mm-yyyy' format.
+    """
+    if page_cache is not None and page.unchanged:
+        newest_month_year = page_cache.load_parsed(page, "newest_month_year")
+        if newest_month_year is not None:
+            return newest_month_year
+
+    newest_month_year = _parse_newest_month_year(page)
+    if page_cache is not None:
+        page_cache.store_parsed(page, "newest_month_year", newest_month_year)
+    return newest_month_year
+
+
+async def _get_cached_newest_month_year_async(page: Page) -> str:
+    """
+    Get month and year of the newest wallpapers in the async parser.
+
+    The stored result is read and written outside of the event loop.
+
+    Args:
+        page (Page): the first category page.
+
+    Raises:
+        SystemExit: if the URL of the newest wallpapers does not exist.
+
+    Returns:
+        str: month and year in 'mm-yyyy' format.
+    """
+    if page_cache is not None and page.unchanged:
+        newest_month_year = await _run_blocking(
+            page_cache.load_parsed,
+            page,
+            "newest_month_year",
+        )
+        if newest_month_year is not None:
+            return newest_month_year
+
+    newest_month_year = _parse_newest_month_year(page)
+    if page_cache is not None:
+        await _run_blocking(
+            page_cache.store_parsed,
+            page,
+            "newest_month_year",
+            newest_month_year,
+        )
+    return newest_month_year
+
+
+def _parse_newest_month_year(page: Page) -> str:
+    """
+    Parse month and year of the newest wallpapers from the category page.
+
+    Args:
+        page (Page): the first category page.
+
+    Raises:
+        SystemExit: if the URL of the newest wallpapers does not exist.
+
+    Returns:
+        str: month and year in 'mm-yyyy' format.
+    """
+    month, year = _get_newest_wallpapers_month_year(_parse_page(page))
+    return datetime.strptime(f"{month}-{year}", "%B-%Y").strftime("%m-%Y")
+
+
+def get_newest_month_year() -> str:
+    """
+    Get month and year of the newest wallpapers on the site.
+
+    Only the first category page is requested. With the page cache it is
+    revalidated by the conditional request.
+
+    Raises:
+        SystemExit: if the page can't be downloaded or the URL of
+            the newest wallpapers does not exist.
+
+    Returns:
+        str: month and year in 'mm-yyyy' format.
+    """
+    page = _download_page(f"{BASE_URL}{WALLPAPERS_CATEGORY_URL}")
+    return _get_cached_newest_month_year(page)
+
+
+async def get_newest_month_year_async(session: aiohttp.ClientSession) -> str:
+    """
+    Get month and year of the newest wallpapers on the site.
+
+    Only the first category page is requested. With the page cache it is
+    revalidated by the conditional request.
+
+    Args:
+        session (aiohttp.ClientSession): session whose connections are
+            reused for all requests.
+
+    Raises:
+        SystemExit: if the page can't be downloaded or the URL of
+            the newest wallpapers does not exist.
+
+    Returns:
+        str: month and year in 'mm-yyyy' format.
+    """
+    page = await _download_page_async(
+        f"{BASE_URL}{WALLPAPERS_CATEGORY_URL}",
+        session,
+    )
+    return await _get_cached_newest_month_year_async(page)
+
+
+def _check_month_year_in_past(
+    page_html: BeautifulSoup,
+    month: str,
+    year: str,
+) -> None:
+    """
+    Check that wallpapers for requested month and year can be published.
+
+    Args:
+        page_html (BeautifulSoup): HTML of the first category page.
+        month (str): month in full name format ('august').
+        year (str): year in four-digit format ('2020').
+
+    Raises:
+        SystemExit: if requested date newer than the newest wallpapers date.
+    """
+    if is_month_year_in_future(page_html, month, year):
+        logger.error(
+            f"Wallpapers for '{month}-{year}' does not exist yet. "
+            "You can't download wallpapers from the future."
+        )
+        raise SystemExit
+
+
+def _get_category_page_url(page_number: int) -> str:
+    """
+    Get URL of the category page by its number.
+
+    Args:
+        page_number (int): number of the page, the first page is 1.
+
+    Returns:
+        str: URL of the page.
+    """
+    if page_number == 1:
+        return f"{BASE_URL}{WALLPAPERS_CATEGORY_URL}"
+    return (
+        f"{BASE_URL}"
+        f"{WALLPAPERS_CATEGORY_PAGE_URL.format(page_number=page_number)}"
+    )
+
+
+def _observe_category_page(
+    page_search: PageSearch,
+    page_number: int,
+    page_html: Union[BeautifulSoup, None],
+) -> None:
+    """
+    Pass wallpapers pages URLs from the category page to the search.
+
+    The page is added to the month index by the caller.
+
+    Args:
+        page_search (PageSearch): search of the page with wallpapers.
+        page_number (int): number of the category page.
+        page_html (Union[BeautifulSoup, None]): HTML of the category page or
+            'None' if the page does not exist.
+    """
+    pages_urls = None
+    if page_html is not None:
+        pages_urls = _find_wallpapers_pages_urls(page_html)
+    page_search.observe(page_number, pages_urls)
+
+
+def _get_page_search_result(page_search: PageSearch, month_year: str) -> str:
+    """
+    Get URL of the page with wallpapers found by the search.
+
+    Args:
+        page_search (PageSearch): finished search of the page.
+        month_year (str): month and year in 'mm-yyyy' format.
+
+    Raises:
+        SystemExit: if the URL of wallpapers was not found.
+
+    Returns:
+        str: URL of the page with wallpapers.
+    """
+    if page_search.result is None:
         logger.error(
             "Couldn't find wallpapers page for "
             f"'{month_year}' month and year."
         )
         raise SystemExit
-    else:
-        return next_page_url
+    return f"{BASE_URL}{page_search.result}"
 
 
-def _find_wallpapers_page_url(
-    page_html: BeautifulSoup,
-    month: str,
-    year: str,
-) -> Union[str, None]:
+def _search_wallpapers_page_url(
+    first_page_html: BeautifulSoup,
+    month_year: str,
+) -> str:
     """
-    Parse HTML and search the URL of the page with wallpapers.
+    Search URL of the page with wallpapers with jumps over category pages.
 
     Args:
-        page_html (BeautifulSoup): HTML for parsing.
-        month (str): month in full name format ('august').
-        year (str): year in four-digit format ('2020').
+        first_page_html (BeautifulSoup): HTML of the first category page.
+        month_year (str): month and year in 'mm-yyyy' format.
+
+    Raises:
+        SystemExit: if the URL of wallpapers does not exist.
 
     Returns:
-        Union[str, None]: URL of wallpapers page or
-            'None' if URL does not exist.
+        str: URL of the page with wallpapers.
     """
-    wallpapers_page_url_tag = page_html.find(
-        lambda tag:
-        tag.name == "a" and
-        tag.parent.name in {"h1", "h2"} and
-        tag.get("href") and
-        f"{month}-{year}" in tag.get("href")
+    month, year = format_month_year(month_year)
+    page_search = PageSearch(
+        _find_wallpapers_pages_urls(first_page_html),
+        month,
+        year,
     )
-    if wallpapers_page_url_tag:
-        return wallpapers_page_url_tag.get("href")
-    return None
+    while not page_search.done:
+        for page_number in page_search.next_pages():
+            page_html = _get_page_html(
+                _get_category_page_url(page_number),
+                missing_ok=True,
+            )
+            if page_html is not None:
+                _index_category_page(page_html)
+            _observe_category_page(page_search, page_number, page_html)
+    return _get_page_search_result(page_search, month_year)
 
 
-def _find_wallpaper_urls(
-    page_html: BeautifulSoup,
-    title: str,
-) -> Union[list, None]:
+async def _search_wallpapers_page_url_async(
+    first_page_html: BeautifulSoup,
+    month_year: str,
+    session: aiohttp.ClientSession,
+) -> str:
     """
-    Parse HTML and search URLs of the wallpaper.
+    Search URL of the page with wallpapers with jumps over category pages.
 
-    One wallpaper has two URLs. For wallpapers with and without calendar.
+    Several most probable pages are requested concurrently. The failed
+    request of one of them fails the search of this month only.
 
     Args:
-        page_html (BeautifulSoup): HTML for parsing.
-        title (str): title in 'Wallpaper name - resolution' format.
-            Example - 'Beautiful image - 1920x1080'.
+        first_page_html (BeautifulSoup): HTML of the first category page.
+        month_year (str): month and year in 'mm-yyyy' format.
+        session (aiohttp.ClientSession): session whose connections are
+            reused for all requests.
+
+    Raises:
+        SystemExit: if the URL of wallpapers does not exist.
 
     Returns:
-        Union[list, None]: URLs of wallpapers or
-            'None' if URLs of wallpapers does not exist.
+        str: URL of the page with wallpapers.
     """
-    wallpaper_urls_tags = page_html.find_all(
-        lambda tag:
-        tag.name == "a" and
-        tag.get("title") == title,
+    month, year = format_month_year(month_year)
+    page_search = PageSearch(
+        _find_wallpapers_pages_urls(first_page_html),
+        month,
+        year,
     )
-
-    if wallpaper_urls_tags:
-        return [url_tag.get("href") for url_tag in wallpaper_urls_tags]
-    return None
+    while not page_search.done:
+        pages_numbers = page_search.next_pages(page_search_window)
+        pages_html = await asyncio.gather(*(
+            _get_category_page_html_or_error_async(
+                _get_category_page_url(page_number),
+                session,
+            )
+            for page_number in pages_numbers
+        ))
+        for page_html in pages_html:
+            if isinstance(page_html, SystemExit):
+                raise page_html
+        for page_number, page_html in zip(pages_numbers, pages_html):
+            if page_html is not None:
+                await _index_category_page_async(page_html)
+            _observe_category_page(page_search, page_number, page_html)
+    return _get_page_search_result(page_search, month_year)
 
 
-def _get_newest_wallpapers_month_year(page_html: BeautifulSoup) -> tuple:
+def _get_wallpapers_page_url(month_year: str) -> str:
     """
-    Parse HTML and search month and year of the newest wallpapers.
+    Search in 'smashingmagazine.com' URL with requested wallpapers.
 
     Args:
-        page_html (BeautifulSoup): HTML for parsing.
+        month_year (str): month and year in 'mm-yyyy' format.
 
     Raises:
-        SystemExit: if the URL of the newest wallpapers does not exist.
+        SystemExit: if the URL of wallpapers does not exist.
 
     Returns:
-        tuple: month and year the newest wallpapers
-            in format ('july', '2020').
+        str: URL of the page with wallpapers.
     """
-    wallpapers_url_tag = page_html.find(
-        lambda tag:
-        tag.name == 'a' and
-        tag.parent.name == "h2" and
-        tag.parent.get("class") and
-        "tilted-featured-article__title" in tag.parent.get("class")
-    )
-    if wallpapers_url_tag:
-        wallpapers_url = wallpapers_url_tag.get("href")
-        divided_wallpapers_url = wallpapers_url.split("-")
-        month = divided_wallpapers_url[-2]
-        year = divided_wallpapers_url[-1].rstrip("/")
-        return month, year
-
-    logger.error(
-        "Something went wrong. Couldn't find url the newest wallpapers.",
-    )
-    raise SystemExit
+    with profiler.phase("plan"):
+        month, year = format_month_year(month_year)
+        wallpapers_page_url = _find_indexed_wallpapers_page_url(month, year)
+    if wallpapers_page_url is not None:
+        return f"{BASE_URL}{wallpapers_page_url}"
 
+    page_html = _get_page_html(f"{BASE_URL}{WALLPAPERS_CATEGORY_URL}")
+    _index_category_page(page_html)
+    _check_month_year_in_past(page_html, month, year)
 
-def is_month_year_in_future(
-    page_html: BeautifulSoup,
-    month: str,
-    year: str,
-) -> bool:
-    """
-    Return result of compare request date to the newest wallpapers date.
+    if page_search_mode == "jump":
+        return _search_wallpapers_page_url(page_html, month_year)
 
-    Args:
-        page_html (BeautifulSoup): HTML for parsing.
-        month (str): month in full name format ('august').
-        year (str): year in four-digit format ('2020').
+    while True:
+        wallpapers_page_url = _find_wallpapers_page_url(page_html, month, year)
+        if wallpapers_page_url is not None:
+            return f"{BASE_URL}{wallpapers_page_url}"
 
-    Returns:
-        bool: True if requested date newer than the newest wallpapers date.
-    """
-    newest_wallpapers_month_year = _get_newest_wallpapers_month_year(page_html)
-    newest_dt = datetime.strptime(
-        "-".join(newest_wallpapers_month_year),
-        "%B-%Y",
-    )
-    requested_dt = datetime.strptime(f"{month}-{year}", "%B-%Y")
-    return requested_dt > newest_dt
+        next_page_url = _find_next_page_url(page_html, month_year)
+        page_html = _get_page_html(f"{BASE_URL}{next_page_url}")
+        _index_category_page(page_html)
 
 
-def _get_wallpapers_page_url(month_year: str) -> str:
+async def _get_wallpapers_page_url_async(
+    month_year: str,
+    session: aiohttp.ClientSession,
+) -> str:
     """
     Search in 'smashingmagazine.com' URL with requested wallpapers.
 
     Args:
         month_year (str): month and year in 'mm-yyyy' format.
+        session (aiohttp.ClientSession): session whose connections are
+            reused for all requests.
 
     Raises:
         SystemExit: if the URL of wallpapers does not exist.
@@ -246,34 +1376,50 @@ def _get_wallpapers_page_url(month_year: str) -> str:
     Returns:
         str: URL of the page with wallpapers.
     """
-    base_url = "https://smashingmagazine.com"
-    wallapper_category_url = "/category/wallpapers/"
-
-    month, year = format_month_year(month_year)
-    page_html = _get_page_html(f"{base_url}{wallapper_category_url}")
-
-    if is_month_year_in_future(page_html, month, year):
-        logger.error(
-            f"Wallpapers for '{month}-{year}' does not exist yet. "
-            "You can't download wallpapers from the future."
+    with profiler.phase("plan"):
+        month, year = format_month_year(month_year)
+        wallpapers_page_url = _find_indexed_wallpapers_page_url(month, year)
+    if wallpapers_page_url is not None:
+        return f"{BASE_URL}{wallpapers_page_url}"
+
+    page_html = await _get_category_page_html_async(
+        f"{BASE_URL}{WALLPAPERS_CATEGORY_URL}",
+        session,
+    )
+    await _index_category_page_async(page_html)
+    _check_month_year_in_past(page_html, month, year)
+
+    if page_search_mode == "jump":
+        return await _search_wallpapers_page_url_async(
+            page_html,
+            month_year,
+            session,
         )
-        raise SystemExit
 
     while True:
         wallpapers_page_url = _find_wallpapers_page_url(page_html, month, year)
         if wallpapers_page_url is not None:
-            return f"{base_url}{wallpapers_page_url}"
+            return f"{BASE_URL}{wallpapers_page_url}"
 
         next_page_url = _find_next_page_url(page_html, month_year)
-        page_html = _get_page_html(f"{base_url}{next_page_url}")
+        page_html = await _get_category_page_html_async(
+            f"{BASE_URL}{next_page_url}",
+            session,
+        )
+        await _index_category_page_async(page_html)
 
 
-def _find_wallpapers_names(page_html: BeautifulSoup) -> list:
+def _find_wallpapers_names(
+    page_html: BeautifulSoup,
+    page_index: WallpapersPageIndex = None,
+) -> list:
     """
     Parse HTML and search wallpapers names.
 
     Args:
         page_html (BeautifulSoup): HTML for parsing.
+        page_index (WallpapersPageIndex, optional): index of the page.
+            Built from page_html if not passed.
 
     Raises:
         SystemExit: if wallpapers names does not exist.
@@ -281,24 +1427,66 @@ def _find_wallpapers_names(page_html: BeautifulSoup) -> list:
     Returns:
         list: wallpapers names
     """
-    name_tags = page_html.find_all(
-        lambda tag:
-        tag.name == "h3" and
-        tag.get("id") and
-        "Join In Next Month!" not in tag.text
-    )
+    if page_index is None:
+        page_index = _index_wallpapers_page(page_html)
 
-    if name_tags:
-        return [tag.text.strip() for tag in name_tags]
+    if page_index.names:
+        return list(page_index.names)
 
     logger.error("Wallpapers names weren't found in the HTML.")
     raise SystemExit
 
 
+def _resolution_sort_key(resolution: str) -> tuple:
+    """
+    Get the key for sorting resolutions by width and height.
+
+    Args:
+        resolution (str): resolution in 'width'x'height' format.
+
+    Returns:
+        tuple: width and height as integers.
+    """
+    width, height = resolution.split("x")
+    return int(width), int(height)
+
+
+def _find_wallpapers_resolutions(
+    page_html: BeautifulSoup,
+    wallpapers_names: list,
+    page_index: WallpapersPageIndex = None,
+) -> set:
+    """
+    Parse HTML and search resolutions in which wallpapers are available.
+
+    Args:
+        page_html (BeautifulSoup): HTML for parsing.
+        wallpapers_names (list): wallpapers names.
+        page_index (WallpapersPageIndex, optional): index of the page.
+            Built from page_html if not passed.
+
+    Returns:
+        set: resolutions in 'width'x'height' format.
+    """
+    if page_index is None:
+        page_index = _index_wallpapers_page(page_html)
+
+    titles_prefixes = tuple(f"{name} - " for name in wallpapers_names)
+    resolutions = set()
+    for title in page_index.titles:
+        if title.startswith(titles_prefixes):
+            resolution = title.rsplit(" - ", 1)[-1]
+            width, _, height = resolution.partition("x")
+            if width.isdigit() and height.isdigit():
+                resolutions.add(resolution)
+    return resolutions
+
+
 def _find_wallpapers_urls(
     page_html: BeautifulSoup,
     wallpapers_names: list,
     resolution: str,
+    page_index: WallpapersPageIndex = None,
 ) -> dict:
     """
     Parse HTML and search wallpapers URLs.
@@ -308,15 +1496,20 @@ def _find_wallpapers_urls(
         wallpapers_names (list): wallpapers names.
         resolution (str): wallpapers resolution in 'width'x'height' format.
             Example - '1920x1080'.
+        page_index (WallpapersPageIndex, optional): index of the page.
+            Built from page_html if not passed.
 
     Returns:
         dict: URLs of wallpapers in '{wallpaper_name: wallpaper_url}' format.
     """
+    if page_index is None:
+        page_index = _index_wallpapers_page(page_html)
+
     wallpapers_urls = {}
 
     for wallpaper_name in wallpapers_names:
         title = f"{wallpaper_name} - {resolution}"
-        wallpaper_urls = _find_wallpaper_urls(page_html, title)
+        wallpaper_urls = _find_wallpaper_urls(page_html, title, page_index)
 
         if wallpaper_urls:
             for wallpaper_url in wallpaper_urls:
@@ -330,6 +1523,72 @@ def _find_wallpapers_urls(
     return wallpapers_urls
 
 
+def _parse_wallpapers_urls(
+    page_index: WallpapersPageIndex,
+    month_year: str,
+    resolutions: list,
+) -> dict:
+    """
+    Search URLs of wallpapers in the index of the page with wallpapers.
+
+    All resolutions are looked up in the same index, so the page is
+    parsed once for any number of resolutions.
+
+    Args:
+        page_index (WallpapersPageIndex): index of the page with wallpapers.
+        month_year (str): month and year in 'mm-yyyy' format.
+        resolutions (list): wallpapers resolutions in 'width'x'height'
+            format. Example - ['1920x1080', '2560x1440']
+
+    Raises:
+        SystemExit: if URLs of wallpapers with requested parameters
+            does not exist.
+
+    Returns:
+        dict: URLs of wallpapers in
+            '{resolution: {wallpaper_filename: wallpaper_url}}' format.
+            Resolutions without wallpapers are omitted.
+    """
+    wallpaper_names = _find_wallpapers_names(None, page_index)
+    resolutions_wallpapers_urls = {}
+    missing_resolutions = []
+    for resolution in resolutions:
+        wallpapers_urls = _find_wallpapers_urls(
+            None,
+            wallpaper_names,
+            resolution,
+            page_index,
+        )
+        if wallpapers_urls:
+            resolutions_wallpapers_urls[resolution] = wallpapers_urls
+        else:
+            missing_resolutions.append(resolution)
+
+    if missing_resolutions:
+        logger.info(
+            f"Wallpapers for {month_year} with resolution "
+            f"{', '.join(missing_resolutions)} not found.",
+        )
+        available_resolutions = _find_wallpapers_resolutions(
+            None,
+            wallpaper_names,
+            page_index,
+        )
+        if available_resolutions:
+            available_resolutions = sorted(
+                available_resolutions,
+                key=_resolution_sort_key,
+            )
+            logger.info(
+                f"Available resolutions: {', '.join(available_resolutions)}.",
+            )
+
+    if resolutions_wallpapers_urls:
+        logger.info("Parsing successfully completed.")
+        return resolutions_wallpapers_urls
+    raise SystemExit
+
+
 def get_wallpapers_urls(
     month_year: str,
     resolution: str,
@@ -351,19 +1610,212 @@ def get_wallpapers_urls(
             '{wallpaper_filename: wallpaper_url}' format.
     """
     logger.info("Site parsing started.")
-    wallpapers_page_url = _get_wallpapers_page_url(month_year)
-    page_html = _get_page_html(wallpapers_page_url)
-    wallpaper_names = _find_wallpapers_names(page_html)
-    wallpapers_urls = _find_wallpapers_urls(
-        page_html,
-        wallpaper_names,
-        resolution,
-    )
-    if wallpapers_urls:
-        logger.info("Parsing successfully completed.")
-        return wallpapers_urls
+    with profiler.phase("category crawl"):
+        wallpapers_page_url = _get_wallpapers_page_url(month_year)
+    with profiler.phase("month page fetch"):
+        page = _download_page(wallpapers_page_url)
+    with profiler.phase("parse"):
+        page_index = _get_wallpapers_page_index(page)
+        resolutions_wallpapers_urls = _parse_wallpapers_urls(
+            page_index,
+            month_year,
+            [resolution],
+        )
+    return resolutions_wallpapers_urls[resolution]
+
+
+async def get_resolutions_wallpapers_urls_async(
+    month_year: str,
+    resolutions: list,
+    session: aiohttp.ClientSession,
+) -> dict:
+    """
+    Return URLs of wallpapers in several resolutions found in the HTML.
+
+    The page with wallpapers is requested and parsed once for all
+    resolutions.
+
+    Args:
+        month_year (str): month and year in 'mm-yyyy' format.
+        resolutions (list): wallpapers resolutions in 'width'x'height'
+            format. Example - ['1920x1080', '2560x1440']
+        session (aiohttp.ClientSession): session whose connections are
+            reused for all requests.
 
-    logger.info(
-        f"Wallpapers for {month_year} with resolution {resolution} not found.",
+    Raises:
+        SystemExit: if URLs of wallpapers with requested parameters
+            does not exist.
+
+    Returns:
+        dict: URLs of wallpapers in
+            '{resolution: {wallpaper_filename: wallpaper_url}}' format.
+            Resolutions without wallpapers are omitted.
+    """
+    logger.info("Site parsing started.")
+    with profiler.phase("category crawl"):
+        wallpapers_page_url = await _get_wallpapers_page_url_async(
+            month_year,
+            session,
+        )
+    with profiler.phase("month page fetch"):
+        page = await _download_page_async(wallpapers_page_url, session)
+    with profiler.phase("parse"):
+        page_index = await _get_wallpapers_page_index_async(page)
+        return _parse_wallpapers_urls(page_index, month_year, resolutions)
+
+
+async def get_wallpapers_urls_async(
+    month_year: str,
+    resolution: str,
+    session: aiohttp.ClientSession,
+) -> dict:
+    """
+    Return URLs of wallpapers found in the HTML.
+
+    All pages are requested with the passed session, so connections to
+    the site are reused by the parser and by the downloader.
+
+    Args:
+        month_year (str): month and year in 'mm-yyyy' format.
+        resolution (str): wallpapers resolution in 'width'x'height' format.
+            Example - '1920x1080'
+        session (aiohttp.ClientSession): session whose connections are
+            reused for all requests.
+
+    Raises:
+        SystemExit: if URLs of wallpapers with requested parameters
+            does not exist.
+
+    Returns:
+        dict: URLs of wallpapers in
+            '{wallpaper_filename: wallpaper_url}' format.
+    """
+    resolutions_wallpapers_urls = await get_resolutions_wallpapers_urls_async(
+        month_year,
+        [resolution],
+        session,
     )
-    raise SystemExit
+    return resolutions_wallpapers_urls[resolution]
+
+
+async def _get_month_wallpapers_urls_async(
+    month_year: str,
+    resolutions: list,
+    session: aiohttp.ClientSession,
+) -> dict:
+    """
+    Return URLs of wallpapers for one month of the batch.
+
+    Errors of one month are logged, counted and don't stop other months.
+
+    Args:
+        month_year (str): month and year in 'mm-yyyy' format.
+        resolutions (list): wallpapers resolutions in 'width'x'height'
+            format.
+        session (aiohttp.ClientSession): session whose connections are
+            reused for all requests.
+
+    Returns:
+        dict: URLs of wallpapers in
+            '{resolution: {wallpaper_filename: wallpaper_url}}' format
+            or empty dict.
+    """
+    try:
+        return await get_resolutions_wallpapers_urls_async(
+            month_year,
+            resolutions,
+            session,
+        )
+    except SystemExit:
+        logger.error(f"Wallpapers for '{month_year}' are skipped.")
+        metrics.get_metrics().increment("months_failed_total")
+        return {}
+
+
+async def iter_wallpapers_urls_async(
+    months_years: list,
+    resolutions: list,
+    session: aiohttp.ClientSession,
+):
+    """
+    Yield URLs of wallpapers as soon as the page of each month is parsed.
+
+    Months are resolved concurrently and wallpapers of the month which is
+    parsed first are yielded first, so they can be downloaded while other
+    months are parsed. Category pages are requested and parsed once for
+    all months, pages with wallpapers are requested and parsed once for
+    all resolutions.
+
+    Args:
+        months_years (list): months and years in 'mm-yyyy' format.
+        resolutions (list): wallpapers resolutions in 'width'x'height'
+            format. Example - ['1920x1080', '2560x1440']
+        session (aiohttp.ClientSession): session whose connections are
+            reused for all requests.
+
+    Yields:
+        tuple: month and year, resolution, filename and URL of
+            the wallpaper.
+    """
+    months_tasks = {
+        asyncio.ensure_future(
+            _get_month_wallpapers_urls_async(month_year, resolutions, session),
+        ): month_year
+        for month_year in months_years
+    }
+    pending_tasks = set(months_tasks)
+    try:
+        while pending_tasks:
+            done_tasks, pending_tasks = await asyncio.wait(
+                pending_tasks,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            for month_task in done_tasks:
+                month_year = months_tasks[month_task]
+                for resolution, wallpapers_urls in month_task.result().items():
+                    for wallpaper_name, wallpaper_url in (
+                        wallpapers_urls.items()
+                    ):
+                        yield (
+                            month_year,
+                            resolution,
+                            wallpaper_name,
+                            wallpaper_url,
+                        )
+    finally:
+        for month_task in pending_tasks:
+            month_task.cancel()
+
+
+async def get_months_wallpapers_urls_async(
+    months_years: list,
+    resolutions: list,
+    session: aiohttp.ClientSession,
+) -> dict:
+    """
+    Return URLs of wallpapers for several months.
+
+    Args:
+        months_years (list): months and years in 'mm-yyyy' format.
+        resolutions (list): wallpapers resolutions in 'width'x'height'
+            format. Example - ['1920x1080', '2560x1440']
+        session (aiohttp.ClientSession): session whose connections are
+            reused for all requests.
+
+    Returns:
+        dict: URLs of wallpapers in '{month_year: {resolution:
+            {wallpaper_filename: wallpaper_url}}}' format.
+            Months without wallpapers are omitted.
+    """
+    months_wallpapers_urls = {}
+    async for (
+        month_year,
+        resolution,
+        wallpaper_name,
+        wallpaper_url,
+    ) in iter_wallpapers_urls_async(months_years, resolutions, session):
+        months_wallpapers_urls.setdefault(month_year, {}).setdefault(
+            resolution,
+            {},
+        )[wallpaper_name] = wallpaper_url
+    return months_wallpapers_urls
@@ -0,0 +1,199 @@
+import asyncio
+
+import aiohttp
+
+from wallpaper_downloader import (
+    app_cache,
+    app_logger,
+    metrics,
+    retry,
+    site_parser,
+)
+from wallpaper_downloader.downloader import WallpaperDownloader
+from wallpaper_downloader.month_check import LastCheck, is_new_month_year
+
+logger = app_logger.get_logger(__name__)
+
+
+class Watcher:
+    """
+    Long-running poller of the site which downloads new months.
+
+    One event loop and one session are kept for all polls and downloads,
+    so connections to the site are reused. State of every poll (category
+    pages of the session, metrics and the retry budget) is dropped after
+    it, so memory does not grow with the uptime.
+    """
+
+    def __init__(
+        self,
+        resolutions: list,
+        interval: float = 3600.0,
+        max_interval: float = 86400.0,
+        retries: int = 3,
+        retry_budget: int = 50,
+        last_check: LastCheck = None,
+        downloader_options: dict = None,
+    ) -> None:
+        """
+        Initialize the watcher.
+
+        Args:
+            resolutions (list): resolutions of downloaded wallpapers.
+            interval (float, optional): seconds between polls.
+                Defaults to 3600.
+            max_interval (float, optional): maximum seconds between polls
+                after failed polls. Defaults to 86400.
+            retries (int, optional): maximum number of retries of one
+                request. Defaults to 3.
+            retry_budget (int, optional): maximum number of retries in
+                one poll. Defaults to 50.
+            last_check (LastCheck, optional): the newest month downloaded
+                by the previous poll. Defaults to 'last_watch.json' in
+                the cache directory.
+            downloader_options (dict, optional): keyword arguments of
+                WallpaperDownloader. Defaults to None.
+        """
+        self.resolutions = list(resolutions)
+        self.interval = interval
+        self.max_interval = max(max_interval, interval)
+        self.retries = retries
+        self.retry_budget = retry_budget
+        self.last_check = last_check or LastCheck(
+            app_cache.get_cache_path("last_watch.json"),
+        )
+        self.downloader_options = downloader_options or {}
+
+    def get_delay(self, failures_count: int) -> float:
+        """
+        Get the delay before the next poll.
+
+        Args:
+            failures_count (int): number of failed polls in a row.
+
+        Returns:
+            float: the interval doubled after every failed poll and
+                limited by the maximum interval.
+        """
+        return min(self.interval * 2 ** failures_count, self.max_interval)
+
+    def _get_new_months_years(self, newest_month_year: str) -> list:
+        """
+        Get months published after the last downloaded month.
+
+        Args:
+            newest_month_year (str): the newest month on the site in
+                'mm-yyyy' format.
+
+        Returns:
+            list: new months in 'mm-yyyy' format, only the newest month if
+                nothing was downloaded before.
+        """
+        known_month_year = self.last_check.load()
+        if not is_new_month_year(newest_month_year, known_month_year):
+            return []
+        if known_month_year is None:
+            return [newest_month_year]
+        return site_parser.get_months_years(
+            known_month_year,
+            newest_month_year,
+        )[1:]
+
+    def _reset_run_state(self) -> None:
+        """Start metrics and the retry budget of the poll from scratch."""
+        metrics.set_metrics(metrics.Metrics())
+        retry.set_retry_policy(
+            retry.RetryPolicy(
+                max_attempts=self.retries + 1,
+                budget=self.retry_budget,
+            ),
+        )
+
+    async def poll(self, session: aiohttp.ClientSession) -> bool:
+        """
+        Check the site and download wallpapers of new months.
+
+        The newest month is saved only if pages of all months are parsed
+        and all wallpapers are downloaded, so the next poll downloads
+        the rest. Unexpected errors fail the poll, not the watcher.
+
+        Args:
+            session (aiohttp.ClientSession): session of the watcher.
+
+        Returns:
+            bool: True if the poll succeeded.
+        """
+        self._reset_run_state()
+        try:
+            newest_month_year = await site_parser.get_newest_month_year_async(
+                session,
+            )
+            months_years = self._get_new_months_years(newest_month_year)
+            if not months_years:
+                logger.info(
+                    f"No new wallpapers, the newest month is "
+                    f"'{newest_month_year}'.",
+                )
+                return True
+            logger.info(
+                f"New wallpapers for {', '.join(months_years)} are found.",
+            )
+            downloader = WallpaperDownloader(
+                months_years,
+                self.resolutions,
+                **self.downloader_options,
+            )
+            await downloader.download_wallpapers_async(session)
+        except SystemExit:
+            logger.error("Poll of the site failed.")
+            return False
+        except Exception:
+            logger.exception("Poll of the site failed with unexpected error.")
+            return False
+        finally:
+            site_parser.clear_category_pages(session)
+
+        counters = metrics.get_metrics().counters
+        if counters.get("months_failed_total"):
+            logger.error("Some months are not parsed.")
+            return False
+        if counters.get("wallpapers_failed_total"):
+            logger.error("Some wallpapers are not downloaded.")
+            return False
+        self.last_check.save(newest_month_year)
+        return True
+
+    async def run(self, polls_count: int = None) -> None:
+        """
+        Poll the site on the interval with one session.
+
+        Args:
+            polls_count (int, optional): number of polls.
+                Defaults to None (poll forever).
+        """
+        connector = aiohttp.TCPConnector(
+            limit=self.downloader_options.get("max_concurrency", 32),
+        )
+        async with aiohttp.ClientSession(connector=connector) as session:
+            failures_count = 0
+            poll_number = 0
+            while polls_count is None or poll_number < polls_count:
+                if poll_number:
+                    delay = self.get_delay(failures_count)
+                    logger.info(f"Next poll in {delay:g} s.")
+                    await asyncio.sleep(delay)
+                if await self.poll(session):
+                    failures_count = 0
+                else:
+                    failures_count += 1
+                poll_number += 1
+
+    def watch(self, polls_count: int = None) -> None:
+        """
+        Poll the site in the new event loop.
+
+        Args:
+            polls_count (int, optional): number of polls.
+                Defaults to None (poll forever).
+        """
+        asyncio.run(self.run(polls_count))